@@ -0,0 +1,73 @@
+"""
+Benchmark: WorldModel construction and exploration step time vs. agent count
+
+Builds synthetic registries (countries plus sub-state actors) with a sparse
+random relation graph and times one exploration step. No LLM calls are made.
+
+Usage (from the project root):
+    python -m benchmarks.world_model_step --sizes 10 50 100 200 500 --degree 6
+"""
+import argparse
+import os
+import random
+import time
+
+from src.models.country_registry import CountryRegistry
+
+
+def synthetic_registry(size: int, degree: int, seed: int = 42) -> CountryRegistry:
+    """Registry of `size` actors, each naming `degree` random partners"""
+    rng = random.Random(seed)
+    names = [f"Actor {i:04d}" for i in range(size)]
+    profiles = []
+    for name in names:
+        partners = rng.sample(names, min(degree, size - 1) + 1)
+        profiles.append(
+            {
+                "country_name": name,
+                "population": f"{rng.randint(1, 300)} million",
+                "army_size": f"{rng.randint(1, 900)},000",
+                "economic_strengths": "synthetic",
+                "key_bilateral_relations": [p for p in partners if p != name][:degree],
+            }
+        )
+    return CountryRegistry(profiles)
+
+
+def run(sizes, degree: int, radius: int, repeats: int):
+    # The forecasting agent requires a key at import time; no request is sent here
+    os.environ.setdefault("GOOGLE_API_KEY", "benchmark-placeholder")
+    from src.models.world_model import WorldModel
+
+    print(f"{'agents':>8} {'edges':>8} {'build [ms]':>12} {'explore [ms]':>14} {'avg seen':>10}")
+    for size in sizes:
+        registry = synthetic_registry(size, degree)
+        build_times, step_times = [], []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            model = WorldModel(countries=registry, exploration_radius=radius)
+            build_times.append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            model.run_exploration()
+            step_times.append(time.perf_counter() - start)
+
+        seen = sum(len(a.explored_countries) for a in model.my_agents) / size
+        print(
+            f"{size:>8} {model.graph.edge_count():>8} "
+            f"{min(build_times) * 1000:>12.1f} {min(step_times) * 1000:>14.1f} {seen:>10.1f}"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 200, 500, 1000])
+    parser.add_argument("--degree", type=int, default=6, help="relations named per actor")
+    parser.add_argument("--radius", type=int, default=1, help="exploration radius (hops)")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    run(args.sizes, args.degree, args.radius, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,3 @@
-from .agent import root_agent
+from .agent import DEFAULT_MODEL, agent_generation_config, agent_graph_version, root_agent
 
-__all__ = ["root_agent"]
+__all__ = ["root_agent", "agent_graph_version", "agent_generation_config", "DEFAULT_MODEL"]
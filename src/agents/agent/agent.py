@@ -1,3 +1,5 @@
+import hashlib
+import json
 from typing import List
 
 from google.adk.agents import Agent, SequentialAgent
@@ -5,7 +7,9 @@ from google.adk.tools.agent_tool import AgentTool
 from google.adk.tools.google_search_tool import google_search
 from pydantic import BaseModel, Field
 from typing import Union, Optional
+from src.llm.adk import interactive_rate_limit
 from src.models.input import CountryInput
+from src.prompt_registry import PromptEntry, prompt_registry
 from src.agents.tools.embedding_search import (
     embeddings_search,
     embeddings_search_tool,
@@ -52,33 +56,30 @@ INTERNET_SEARCHER_NAME = "internet_searcher_agent"
 SUMMARIZER_NAME = "summarizer_agent"
 ROOT_AGENT_NAME = "root_agent"
 
+# Every model request of the agent graph waits for the shared LLM rate limits
+rate_limit_callback = interactive_rate_limit(DEFAULT_MODEL)
+
+# Prompt names in the prompt registry (file stems in src/prompts)
 PROMPTS = {
-    INTERNET_SEARCHER_NAME: "src/prompts/internet_searcher.md",
-    ROOT_AGENT_NAME: "src/prompts/root.md",
+    INTERNET_SEARCHER_NAME: "internet_searcher",
+    ROOT_AGENT_NAME: "root",
 }
 
 
-def load_system_prompt(file_path: str) -> str:
-    """Load the system prompt for AI agent from a specified file."""
-    try:
-        with open(file_path, "r", encoding="utf-8") as f:
-            return f.read()
-    except FileNotFoundError as e:
-        raise FileExistsError(f"System prompt file not found: {file_path}") from e
-
-
 internet_searcher = Agent(
     model=DEFAULT_MODEL,
+    before_model_callback=rate_limit_callback,
     name=INTERNET_SEARCHER_NAME,
     input_schema=CountryInput,
     description="An AI agent that can perform internet searches using Google Search to answer user queries.",
-    static_instruction=load_system_prompt(PROMPTS[INTERNET_SEARCHER_NAME]),
+    static_instruction=prompt_registry.get(PROMPTS[INTERNET_SEARCHER_NAME]),
     tools=[google_search],
     output_key="search_results",
 )
 
 summarizer = Agent(
     model=DEFAULT_MODEL,
+    before_model_callback=rate_limit_callback,
     name=SUMMARIZER_NAME,
     output_key="summary",
     description="An AI agent that synthesizes internet search results into actionable insights about threats and opportunities for a country.",
@@ -109,6 +110,7 @@ Be specific, actionable, and factual. Focus on geopolitical, economic, and secur
 extractor = Agent(
     output_schema=CountryInput,
     model=DEFAULT_MODEL,
+    before_model_callback=rate_limit_callback,
     name=EXTRACTOR_TOOL_NAME,
     description="An AI agent that extracts information about a country from the user's question.",
     static_instruction="""You are a extraction agent that converts raw information provide by user
@@ -119,15 +121,17 @@ extractor = Agent(
 final_formatter = Agent(
     output_schema=Output,
     model=DEFAULT_MODEL,
+    before_model_callback=rate_limit_callback,
     name="final_formatter",
     description="An AI agent that formats the final analysis into structured output with confidence and reasoning",
-    static_instruction=load_system_prompt(PROMPTS[ROOT_AGENT_NAME]),
+    static_instruction=prompt_registry.get(PROMPTS[ROOT_AGENT_NAME]),
 )
 
 
 embeddings_searcher = Agent(
     output_schema=EmbeddingsSearchOutput,
     model=DEFAULT_MODEL,
+    before_model_callback=rate_limit_callback,
     name="embeddings_searcher",
     description="An AI agent that searches for information about a country from the embeddings database.",
     static_instruction="""You are a embeddings searcher agent that searches for information about a country from the embeddings database.
@@ -142,9 +146,10 @@ When given a query, call the embeddings_search tool with that query and return t
 root_agent = Agent(
     output_schema=Output,
     model=DEFAULT_MODEL,  # Add model parameter
+    before_model_callback=rate_limit_callback,
     name=ROOT_AGENT_NAME,
     description="Sequential pipeline that always processes country analysis in order: extract country data, search for threats/opportunities, summarize findings, and format final output.",
-    static_instruction=load_system_prompt(PROMPTS[ROOT_AGENT_NAME]),
+    static_instruction=prompt_registry.get(PROMPTS[ROOT_AGENT_NAME]),
     tools=[
         AgentTool(extractor),
         AgentTool(internet_searcher),
@@ -153,3 +158,60 @@ root_agent = Agent(
         AgentTool(final_formatter),
     ],
 )
+
+
+# Agents whose static instruction comes from a prompt file, for hot reload
+_PROMPTED_AGENTS = {
+    PROMPTS[INTERNET_SEARCHER_NAME]: [internet_searcher],
+    PROMPTS[ROOT_AGENT_NAME]: [final_formatter, root_agent],
+}
+
+
+def _refresh_static_instructions(entry: PromptEntry):
+    for agent in _PROMPTED_AGENTS.get(entry.name, []):
+        agent.static_instruction = entry.text
+
+
+prompt_registry.on_change(_refresh_static_instructions)
+
+
+def agent_graph_version() -> str:
+    """
+    Hash of the agent graph: agent names, models, instructions, schemas and tools.
+
+    Changes whenever a prompt is hot-reloaded or the pipeline is edited, so
+    cached responses from an older graph are never served.
+    """
+    digest = hashlib.sha256()
+    agents = [root_agent] + [tool.agent for tool in root_agent.tools]
+    for agent in agents:
+        schema = getattr(agent, "output_schema", None)
+        tools = [getattr(tool, "name", str(tool)) for tool in agent.tools]
+        digest.update(
+            "|".join(
+                [
+                    agent.name,
+                    str(agent.model),
+                    str(agent.static_instruction or ""),
+                    schema.__name__ if schema else "",
+                    ",".join(tools),
+                ]
+            ).encode("utf-8")
+        )
+    return digest.hexdigest()
+
+
+def agent_generation_config() -> str:
+    """
+    Generation settings (generate_content_config) of every agent in the graph,
+    as canonical JSON. Agents without one use the model defaults ("{}").
+    """
+    configs = {}
+    for agent in [root_agent] + [tool.agent for tool in root_agent.tools]:
+        generation_config = getattr(agent, "generate_content_config", None)
+        configs[agent.name] = (
+            generation_config.model_dump(mode="json", exclude_none=True)
+            if generation_config is not None
+            else {}
+        )
+    return json.dumps(configs, sort_keys=True)
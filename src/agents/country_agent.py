@@ -1,9 +1,8 @@
 import mesa
-import json
-import asyncio
 import logging
 from datetime import datetime
 from src.agents.forecasting_agent import generate_forecast
+from src.models.country_registry import normalize_country_key
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -18,29 +17,32 @@ class CountryAgent(mesa.Agent):
         self.state = "exploring"
         self.explored_countries = []
         self.forecasts = None
+        self.error = None
 
         self.load_description(name)
 
     
     def load_description(self, name:str):
         """
-        Load initial resources for the Country agent.
+        Attach the country's profile from the model's shared country registry.
+        The profile is a read-only reference, not a copy.
         """
-        with open(f'resources/{name.lower()}.json', 'r') as file:
-            resources = json.load(file)
-        self.resources = resources
+        self.resources = self.model.countries[name]
+        self.country_key = normalize_country_key(self.resources['country_name'])
 
 
 
-    def step(self):
+    async def astep(self):
         """
         Define the agent's behavior for a single step in the simulation.
+        The forecast awaits the LLM call, so many agents can forecast
+        concurrently in the model's event loop (see WorldModel.step/astep).
         """
         if self.state == "exploring":
             self.explore()
         elif self.state == "forecast_scenario":
-            self.forecast_scenario()
-        elif self.state == "done":
+            await self.aforecast_scenario()
+        elif self.state in ("done", "failed"):
             pass
 
     def explore(self):
@@ -49,26 +51,30 @@ class CountryAgent(mesa.Agent):
         """
         logger.info(f"{self.resources['country_name']} is exploring other countries...")
         
-        # Get all agents from the model
-        for agent in self.model.my_agents:
-            # Skip self
-            if agent == self:
-                continue
-            
-            # Store explored country data
-            self.explored_countries.append(agent.resources)
-            logger.debug(f"{self.resources['country_name']} discovered {agent.resources['country_name']}")
+        # Rank the graph neighborhood by relevance; top up with the globally
+        # most relevant countries when the neighborhood is too small
+        limit = self.model.max_context_countries
+        neighborhood = self.model.graph.neighborhood(self.country_key, self.model.exploration_radius)
+        ranked = self.model.relevance.rank(self.country_key, candidates=neighborhood, k=limit)
+        if len(ranked) < limit:
+            for key in self.model.relevance.rank(self.country_key, k=limit + len(ranked)):
+                if len(ranked) >= limit:
+                    break
+                if key not in ranked:
+                    ranked.append(key)
+        self.explored_countries = [self.model.countries[key] for key in ranked]
+        logger.debug(f"{self.resources['country_name']} discovered {len(self.explored_countries)} countries")
         
         # After exploration, transition to forecasting
         logger.info(f"{self.resources['country_name']} finished exploration. Ready for forecasting.")
         self.state = "forecast_scenario"
     
-    def forecast_scenario(self):
+    async def aforecast_scenario(self):
         """
         Logic for forecasting scenarios using Gemini AI.
         Generates 12-month and 36-month forecasts with positive and negative scenarios.
         """
-        if not hasattr(self.model, 'scenario') or not self.model.scenario:
+        if getattr(self.model, 'scenario', None) is None:
             logger.warning(f"{self.resources['country_name']}: No scenario available for forecasting.")
             return
         
@@ -76,25 +82,13 @@ class CountryAgent(mesa.Agent):
         logger.info(f"{self.resources['country_name']} is generating forecasts...")
         
         try:
-            # Get or create event loop
-            try:
-                loop = asyncio.get_event_loop()
-                if loop.is_closed():
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            # Run async forecast generation
-            scenario_weight = self.model.scenario.get('total_weight', self.model.scenario.get('weight', 100))
-            self.forecasts = loop.run_until_complete(generate_forecast(
+            self.forecasts = await generate_forecast(
                 country_name=self.resources['country_name'],
                 country_resources=self.resources,
                 other_countries=self.explored_countries,
-                scenario=self.model.scenario['description'],
-                scenario_weight=scenario_weight
-            ))
+                scenario=self.model.scenario,
+                token_ledger=self.model.token_ledger,
+            )
             
             # Log completion with summary
             logger.info("="*80)
@@ -113,4 +107,9 @@ class CountryAgent(mesa.Agent):
                 logger.error("This appears to be a network/DNS issue. Check your internet connection.")
             elif "api key" in str(e).lower() or "GOOGLE_API_KEY" in str(e):
                 logger.error("Make sure GOOGLE_API_KEY is set in your .env file.")
-            self.state = "done"
\ No newline at end of file
+            # Keep the failure visible instead of looking like a finished country
+            self.error = str(e)
+            self.state = "failed"
+        
+        # Persist/publish the outcome right away so a crash later in the run keeps it
+        self.model.forecast_finished(self)
\ No newline at end of file
@@ -1,20 +1,28 @@
+import logging
 import os
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
-from pydantic_ai import Agent
+from pydantic_ai import Agent, NativeOutput, RunContext
 from pydantic_ai.models.google import GoogleModel, GoogleModelSettings
 from pydantic_ai.providers.google import GoogleProvider
-from typing import List
+from collections import OrderedDict
+from typing import List, Mapping, Optional, Union
+from src.agents.prompt_cache import PrefixCache, TokenBudgetReport, TokenLedger, estimate_tokens
 from src.configuration import Configuration
+from src.llm import Priority, classify_error, fake_model, get_gateway, use_fake_provider
+from src.models.indicators import format_indicators
+from src.models.scenario import Scenario
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
 # Load configuration
 config = Configuration()
 
 API_KEY = config.gemini_api_key or os.getenv("GOOGLE_API_KEY")
 
-if not API_KEY:
+if not API_KEY and not use_fake_provider():
     raise ValueError(
         "GOOGLE_API_KEY environment variable is not set. "
         "Please create a .env file with GOOGLE_API_KEY=your_api_key"
@@ -64,15 +72,20 @@ class ForecastOutput(BaseModel):
     forecast_12_months: ForecastScenario
     forecast_36_months: ForecastScenario
 
-# Configure provider with settings from configuration
-provider = GoogleProvider(api_key=API_KEY)
 
 settings = GoogleModelSettings(
     temperature=config.gemini_temperature,  # From config (default: 0.2)
     max_tokens=config.gemini_max_tokens,    # From config (default: 4096)
 )
 
-model = GoogleModel(config.gemini_model_name, provider=provider, settings=settings)
+if use_fake_provider():
+    # Local stand-in: no network, no API key, no context cache
+    provider = None
+    model = fake_model()
+else:
+    # Configure provider with settings from configuration
+    provider = GoogleProvider(api_key=API_KEY)
+    model = GoogleModel(config.gemini_model_name, provider=provider, settings=settings)
 
 SYSTEM_PROMPT = """
 **WAŻNE: Wszystkie odpowiedzi MUSZĄ być w języku polskim!**
@@ -107,7 +120,7 @@ Dla każdej prognozy MUSISZ przedstawić:
    - Wydobądź konkretne fakty historyczne z danych kraju
    - Zidentyfikuj obecne trendy globalne i lokalne
    - Lista 3-5 kluczowych faktów, które wykorzystasz w analizie
-   - **UWZGLĘDNIJ WSZYSTKIE 6 CZYNNIKÓW SCENARIUSZA**, ale z wagami: najważniejsze to a) (30) i f) (25)
+   - **UWZGLĘDNIJ WSZYSTKIE CZYNNIKI SCENARIUSZA**, ale z wagami podanymi w scenariuszu: najważniejsze są czynniki o najwyższej wadze
 
 2. **Identyfikacja korelacji:**
    - Znajdź korelacje między faktami historycznymi A korelacje MIĘDZY CZYNNIKAMI SCENARIUSZA
@@ -121,23 +134,23 @@ Dla każdej prognozy MUSISZ przedstawić:
 3. **Nieoczywiste czynniki (Deep Research):**
    - Zidentyfikuj 2-3 nieoczywiste czynniki wynikające z KOMBINACJI czynników scenariusza
    - "Czarne łabędzie" związane z wieloczynnikowym scenariuszem
-   - Ukryte zależności między 6 czynnikami (np. "Tania ropa (f) może paradoksalnie SPOWOLNIĆ transformację OZE w automotive (b)")
+   - Ukryte zależności między czynnikami (np. "Tania ropa (f) może paradoksalnie SPOWOLNIĆ transformację OZE w automotive (b)")
    - Efekty drugiego rzędu: "Czynnik A wpływa na B, co z kolei wpływa na C"
    - Wyjaśnij DLACZEGO te czynniki są nieoczywiste
 
 4. **Łańcuch rozumowania (krok po kroku) - UWZGLĘDNIAJĄCY WAGI:**
    - Minimum 5-7 kroków
    - Każdy krok: "Jeżeli A (czynnik scenariusza), to B (konsekwencja), ponieważ C (mechanizm)"
-   - **ROZPOCZNIJ od najważniejszych czynników (a=30, f=25)**
-   - Następnie pokaż jak nakładają się inne czynniki (b=15, c=15, d=10, e=5)
+   - **ROZPOCZNIJ od najważniejszych czynników (o najwyższej wadze)**
+   - Następnie pokaż jak nakładają się pozostałe czynniki
    - Przykład:
      * Krok 1: [a, waga 30] Producent GPU traci 60% mocy → globalne niedobory GPU
      * Krok 2: [a] Globalne niedobory → wzrost cen GPU o 150-200% → opóźnienia w AI
      * Krok 3: [c, waga 15] Jednocześnie PKB strefy euro↓ 1.5% → mniej środków na inwestycje
-     * Krok 4: [a+c] GPU drogie + mniej środków = podwójne ograniczenie dla ambicji AI kraju {country_name}
+     * Krok 4: [a+c] GPU drogie + mniej środków = podwójne ograniczenie dla ambicji AI kraju [kraj]
      * Krok 5: [f, waga 25] Równolegle: spadek cen ropy do 30-35 USD → presja na budżet Rosji
      * Krok 6: [d+f] Słaby rozejm + słaba Rosja ekonomicznie → możliwe zmiany geopolityczne
-     * Krok 7: Kumulatywny wpływ wszystkich 6 czynników na {country_name} → scenariusze
+     * Krok 7: Kumulatywny wpływ wszystkich czynników na [kraj] → scenariusze
 
 **Format Odpowiedzi:**
 Dla każdego horyzontu czasowego (12 i 36 miesięcy):
@@ -175,103 +188,49 @@ Wyjaśnij poziom pewności uwzględniając:
 - Dlaczego pewność dla 36 miesięcy może różnić się od 12 miesięcy
 
 Bądź zwięzły, ale kompletny. Każdy scenariusz powinien mieć 2-4 zdania.
-"""
-
-forecasting_agent = Agent(
-    output_type=ForecastOutput,
-    model=model,
-    system_prompt=SYSTEM_PROMPT,
-)
 
+**[kraj]** w przykładach oznacza kraj wskazany w wiadomości użytkownika.
+"""
 
-async def generate_forecast(
-    country_name: str,
-    country_resources: dict,
-    other_countries: List[dict],
-    scenario: str,
-    scenario_weight: int
-) -> ForecastOutput:
-    """
-    Generate a geopolitical forecast for a country based on a global scenario.
-    
-    Args:
-        country_name: Name of the country to forecast for
-        country_resources: Dictionary with country's resources and characteristics
-        other_countries: List of dictionaries with other countries' resources
-        scenario: The global scenario description
-        scenario_weight: Importance weight of the scenario (0-100)
-    
-    Returns:
-        ForecastOutput with 12-month and 36-month forecasts
-    """
-    
-    # Build context about other countries
-    max_countries = config.max_other_countries_context  # From config (default: 5)
-    other_countries_context = "\n\n".join([
-        f"**{country['country_name']}:**\n"
-        f"- Populacja: {country['population']}\n"
-        f"- Siły zbrojne: {country['army_size']}\n"
-        f"- Mocne strony gospodarcze: {country['economic_strengths']}\n"
-        f"- Kluczowe relacje bilateralne: {', '.join(country['key_bilateral_relations'])}"
-        for country in other_countries[:max_countries]  # Limit from config to avoid token limits
-    ])
-    
-    prompt = f"""
-**Kraj do analizy: {country_name}**
+# Scenario block, factor weights and task: identical for every country of a
+# run, so it belongs to the cacheable prefix, not the user prompt
+SCENARIO_CONTEXT_TEMPLATE = """
+**Scenariusz globalny - KOMPLEKSOWY (łączna waga: {total_weight}/100):**
+{description}
 
-**Charakterystyka kraju:**
-- Cechy geograficzne: {country_resources['geographical_features']}
-- Populacja: {country_resources['population']}
-- Klimat: {country_resources['climate']}
-- Mocne strony gospodarcze: {country_resources['economic_strengths']}
-- Wielkość armii: {country_resources['army_size']}
-- Poziom cyfryzacji: {country_resources['digitalization_level']}
-- Waluta: {country_resources['currency']}
-- Kluczowe relacje bilateralne: {', '.join(country_resources['key_bilateral_relations'])}
-- Zagrożenia polityczne/gospodarcze: {country_resources['political_economic_threats']}
-- Zagrożenia militarne: {country_resources['military_threats']}
-- Kamienie milowe rozwoju: {country_resources['development_milestones']}
-
-**Scenariusz globalny - KOMPLEKSOWY (łączna waga: {scenario_weight}/100):**
-{scenario}
-
-**WAŻNE: To jest JEDEN złożony scenariusz globalny składający się z 6 współzależnych czynników.**
-Musisz analizować ich wzajemne oddziaływanie i kumulatywny wpływ na kraj {country_name}.
+**WAŻNE: To jest JEDEN złożony scenariusz globalny składający się z {factor_count} współzależnych czynników.**
+Musisz analizować ich wzajemne oddziaływanie i kumulatywny wpływ na analizowany kraj.
 
 **Wagi poszczególnych czynników:**
-- a) Katastrofa GPU - waga 30/100 (najsilniejszy pojedynczy czynnik)
-- b) Kryzys automotive w Europie - waga 15/100
-- c) Spadek PKB strefy euro - waga 15/100
-- d) Rozejm na Ukrainie - waga 10/100
-- e) Inwestycje w Ukrainie - waga 5/100
-- f) Rewolucja energetyczna i spadek cen ropy - waga 25/100 (drugi najsilniejszy czynnik)
-
-**Kontekst międzynarodowy - inne kluczowe kraje:**
-{other_countries_context}
+{factor_weights}
 
 **Zadanie:**
-Wygeneruj szczegółowe prognozy dla kraju {country_name} na 12 i 36 miesięcy, uwzględniając:
-1. Wpływ CAŁEGO scenariusza globalnego (wszystkie 6 czynników razem) na ten konkretny kraj
+Wygeneruj szczegółowe prognozy dla analizowanego kraju na 12 i 36 miesięcy, uwzględniając:
+1. Wpływ CAŁEGO scenariusza globalnego (wszystkie {factor_count} czynników razem) na ten konkretny kraj
 2. Interakcje między czynnikami (np. spadek PKB + kryzys automotive = podwójna presja na przemysł)
-3. Wagi istotności - silniejsze czynniki (a=30, f=25) powinny mieć większy wpływ w analizie
-4. Jego specyficzne mocne strony i słabości w kontekście WSZYSTKICH 6 czynników
+3. Wagi istotności - silniejsze czynniki ({top_factors}) powinny mieć większy wpływ w analizie
+4. Jego specyficzne mocne strony i słabości w kontekście WSZYSTKICH {factor_count} czynników
 5. Relacje z innymi krajami wymienionymi w kontekście
 6. Bieżące zagrożenia i możliwości wynikające z KOMBINACJI czynników
 
 Dla każdego horyzontu czasowego przedstaw 2 pozytywne i 2 negatywne scenariusze.
+"""
 
+# Worked example written for the default scenario; static for every run
+WORKED_EXAMPLE = """
 **KLUCZOWE: Analizuj synergię i interakcje między czynnikami:**
 - Jak czynnik a) (GPU) wzmacnia lub osłabia wpływ czynnika c) (PKB↓)?
 - Jak czynnik f) (tania ropa) wpływa na czynnik b) (kryzys automotive)?
 - Jak czynniki d) i e) (Ukraina) łączą się z bezpieczeństwem energetycznym?
-- Które kombinacje czynników są najbardziej korzystne/niekorzystne dla {country_name}?
+- Które kombinacje czynników są najbardziej korzystne/niekorzystne dla [kraj]?
 
 **PRZYKŁAD CHAIN OF THOUGHT - KOMPLEKSOWY, WIELOCZYNNIKOWY (Wzór do naśladowania):**
+(Przykład dotyczy scenariusza bazowego; w analizie stosuj czynniki i wagi podane powyżej.)
 
 Fakty historyczne:
 1. "W latach 2020-2021 niedobory półprzewodników spowolniły przemysł motoryzacyjny o 15%" [powiązane z czynnikiem a]
-2. "{country_name} posiada rozwiniętą branżę ICT z ambicjami w AI" [podatność na czynnik a]
-3. "{country_name} ma silny sektor automotive powiązany z Niemcami i Francją" [podatność na czynnik b]
+2. "[kraj] posiada rozwiniętą branżę ICT z ambicjami w AI" [podatność na czynnik a]
+3. "[kraj] ma silny sektor automotive powiązany z Niemcami i Francją" [podatność na czynnik b]
 4. "Historyczne kryzysy energetyczne (1973, 2022) doprowadziły do transformacji energetycznej" [powiązane z czynnikiem f]
 5. "Relacje z Ukrainą są kluczowe dla bezpieczeństwa regionalnego" [powiązane z czynnikami d, e]
 
@@ -292,7 +251,7 @@ Korelacje (MIĘDZY CZYNNIKAMI SCENARIUSZA):
 Nieoczywiste czynniki (z KOMBINACJI czynników):
 1. "Efekt kaskadowy a→b→c": GPU↓ spowalnia automotive tech → kryzys automotive pogłębia się → PKB spada jeszcze bardziej
    - Opis: Trzy czynniki tworzą spiralę spowolnienia gospodarczego
-   - Wpływ: {country_name} z silnym automotive może być szczególnie dotknięty
+   - Wpływ: [kraj] z silnym automotive może być szczególnie dotknięty
 
 2. "Paradoks taniej ropy (f)": Tania ropa POWINNA pomóc gospodarce, ALE:
    - Spowalnia transformację OZE (mniej pilności)
@@ -301,7 +260,7 @@ Nieoczywiste czynniki (z KOMBINACJI czynników):
    - Opis: Pozornie pozytywny czynnik ma ukryte negatywne konsekwencje
 
 3. "Okno możliwości z Ukrainy (d+e)": Podczas gdy Rosja słabnie, inwestycje w Ukrainie rosną
-   - {country_name} może wzmocnić relacje z Ukrainą i dostęp do surowców krytycznych
+   - [kraj] może wzmocnić relacje z Ukrainą i dostęp do surowców krytycznych
    - Nieoczywiste: To może być kluczowa szansa geopolityczna
 
 Łańcuch rozumowania (UWZGLĘDNIAJĄCY WAGI I INTERAKCJE):
@@ -310,21 +269,21 @@ Krok 1 [a, waga 30 - NAJWAŻNIEJSZY]: Katastrofa naturalna → Producent GPU tra
 → Uzasadnienie: Fizyczne zniszczenie fabryk = natychmiastowy spadek produkcji
 → Globalne niedobory GPU, ceny rosną o 150-200%
 
-Krok 2 [a→wpływ na {country_name}]: {country_name} ma ambicje AI (big data centers, AI giga factories)
+Krok 2 [a→wpływ na [kraj]]: [kraj] ma ambicje AI (big data centers, AI giga factories)
 → Uzasadnienie: GPU są kluczowe dla AI, niedobory blokują realizację planów
 → Opóźnienia w projektach AI o 12-24 miesiące
 
 Krok 3 [c, waga 15]: Jednocześnie PKB strefy euro spada o 1.5%
 → Uzasadnienie: Recesja w UE = mniej środków w budżetach krajowych
-→ {country_name} ma mniej pieniędzy na inwestycje w AI
+→ [kraj] ma mniej pieniędzy na inwestycje w AI
 
 Krok 4 [a+c, SYNERGIA waga 45]: GPU drogie + mniej budżetu = podwójny problem
 → Uzasadnienie: Dwa czynniki się WZMACNIAJĄ - nie tylko drogie GPU, ale i brak środków
-→ Ambicje AI {country_name} są poważnie zagrożone
+→ Ambicje AI [kraj] są poważnie zagrożone
 
 Krok 5 [b, waga 15]: Przemysł automotive w Europie w kryzysie (zyski tylko 30% normy)
 → Uzasadnienie: Konkurencja z Azji + wolna transformacja na elektryki
-→ {country_name} ma silny sektor automotive → bezpośredni wpływ na PKB i zatrudnienie
+→ [kraj] ma silny sektor automotive → bezpośredni wpływ na PKB i zatrudnienie
 
 Krok 6 [f, waga 25 - DRUGI NAJWAŻNIEJSZY]: Równolegle ropa spada do 30-35 USD/baryłka
 → Uzasadnienie: Nowe złoża w Ameryce Południowej + wzrost OZE = nadpodaż
@@ -332,24 +291,239 @@ Krok 6 [f, waga 25 - DRUGI NAJWAŻNIEJSZY]: Równolegle ropa spada do 30-35 USD/
 
 Krok 7 [d+f, INTERAKCJA]: Słaby rozejm na Ukrainie + słaba Rosja ekonomicznie
 → Uzasadnienie: Rosja pod presją ekonomiczną ma mniej środków na eskalację
-→ Potencjalnie stabilniejsza sytuacja w regionie (szansa dla {country_name})
+→ Potencjalnie stabilniejsza sytuacja w regionie (szansa dla [kraj])
 
 Krok 8 [e]: Inwestycje USA w surowce krytyczne na Ukrainie
 → Uzasadnienie: USA zabezpiecza łańcuchy dostaw, konkurencja o wpływy
-→ {country_name} może wzmocnić relacje z Ukrainą (e) i dostęp do surowców
+→ [kraj] może wzmocnić relacje z Ukrainą (e) i dostęp do surowców
 
 Krok 9 [KUMULATYWNY WPŁYW wszystkich 6 czynników]:
 → Negatywne: a+b+c = technologiczne i gospodarcze spowolnienie (waga 60/100)
 → Pozytywne: f+d+e = szanse geopolityczne i energetyczne (waga 40/100)
-→ Ostateczny balans zależy od specyfiki {country_name} → scenariusze
+→ Ostateczny balans zależy od specyfiki [kraj] → scenariusze
 
 **PAMIĘTAJ: Odpowiedź MUSI być w języku polskim! Wszystkie scenariusze, wyjaśnienia, uzasadnienia i analiza przyczynowości muszą być po polsku!**
 
 **KLUCZOWE: Wyjaśnialność jest NAJWAŻNIEJSZA! Pracownik MSZ musi zrozumieć DLACZEGO doszedłeś do danej prognozy. Każdy krok musi być logiczny i oparty na faktach.**
 """
+
+# (label, profile field) pairs sent per country; empty fields are skipped
+COUNTRY_FIELDS = (
+    ("Cechy geograficzne", "geographical_features"),
+    ("Populacja", "population"),
+    ("Klimat", "climate"),
+    ("Mocne strony gospodarcze", "economic_strengths"),
+    ("Wielkość armii", "army_size"),
+    ("Poziom cyfryzacji", "digitalization_level"),
+    ("Waluta", "currency"),
+    ("Kluczowe relacje bilateralne", "key_bilateral_relations"),
+    ("Zagrożenia polityczne/gospodarcze", "political_economic_threats"),
+    ("Zagrożenia militarne", "military_threats"),
+    ("Kamienie milowe rozwoju", "development_milestones"),
+)
+
+OTHER_COUNTRY_FIELDS = (
+    ("Populacja", "population"),
+    ("Siły zbrojne", "army_size"),
+    ("Mocne strony gospodarcze", "economic_strengths"),
+    ("Kluczowe relacje bilateralne", "key_bilateral_relations"),
+)
+
+# Used without a cached prefix: the static prefix is the system prompt
+forecasting_agent = Agent(
+    output_type=ForecastOutput,
+    model=model,
+    deps_type=str,
+)
+
+
+@forecasting_agent.system_prompt
+def static_prefix(ctx: RunContext[str]) -> str:
+    return ctx.deps
+
+
+# Used with Gemini cached content, which owns the system instruction and does
+# not allow tools, so the output schema is sent natively instead of as a tool
+cached_forecasting_agent = Agent(
+    output_type=NativeOutput(ForecastOutput),
+    model=model,
+)
+
+
+# Static prefixes by scenario fingerprint (a sweep touches a handful at a time)
+_static_prefixes: "OrderedDict[str, str]" = OrderedDict()
+MAX_STATIC_PREFIXES = 16
+
+prefix_cache = PrefixCache(
+    client=provider.client if provider is not None else None,
+    model_name=config.gemini_model_name,
+    enabled=config.gemini_context_cache_enabled,
+    ttl_seconds=config.gemini_context_cache_ttl_seconds,
+    min_tokens=config.gemini_context_cache_min_tokens,
+    max_entries=MAX_STATIC_PREFIXES,
+)
+
+
+def _format_factor_weights(scenario: Scenario) -> str:
+    ranked = scenario.ranked_factors()
+    notes = {}
+    if ranked:
+        notes[ranked[0].id] = " (najsilniejszy pojedynczy czynnik)"
+    if len(ranked) > 1:
+        notes[ranked[1].id] = " (drugi najsilniejszy czynnik)"
+    return "\n".join(
+        f"- {factor.id}) {factor.label} - waga {factor.weight}/100{notes.get(factor.id, '')}"
+        for factor in scenario.factors
+    )
+
+
+def build_static_prefix(scenario: Scenario) -> str:
+    """
+    Static part of the forecast prompt for a scenario (same for every country)
+
+    Args:
+        scenario: The global scenario
+
+    Returns:
+        System prompt followed by the scenario context and worked example
+    """
+    prefix = _static_prefixes.get(scenario.fingerprint)
+    if prefix is None:
+        top_factors = ", ".join(f"{f.id}={f.weight}" for f in scenario.ranked_factors()[:2])
+        prefix = SYSTEM_PROMPT + SCENARIO_CONTEXT_TEMPLATE.format(
+            total_weight=scenario.total_weight,
+            description=scenario.description,
+            factor_count=len(scenario.factors),
+            factor_weights=_format_factor_weights(scenario),
+            top_factors=top_factors,
+        ) + WORKED_EXAMPLE
+        _static_prefixes[scenario.fingerprint] = prefix
+        if len(_static_prefixes) > MAX_STATIC_PREFIXES:
+            _static_prefixes.popitem(last=False)
+    return prefix
+
+
+def _format_fields(profile: Mapping, fields) -> str:
+    lines = []
+    for label, field in fields:
+        value = profile.get(field)
+        if not value:
+            continue
+        if isinstance(value, (list, tuple)):
+            value = ", ".join(value)
+        lines.append(f"- {label}: {value}")
+    return "\n".join(lines)
+
+
+def build_country_prompt(country_name: str, country_resources: Mapping, other_countries: List[Mapping]) -> str:
+    """
+    Per-country part of the forecast prompt (the only part that varies)
+
+    Args:
+        country_name: Name of the country to forecast for
+        country_resources: Country's resources and characteristics
+        other_countries: Other countries' resources, most relevant first
+
+    Returns:
+        User prompt text
+    """
+    max_countries = config.max_other_countries_context  # From config (default: 5)
+    other_countries_context = "\n\n".join(
+        f"**{country['country_name']}:**\n{_format_fields(country, OTHER_COUNTRY_FIELDS)}"
+        for country in other_countries[:max_countries]  # Pre-ranked by relevance; limit from config
+    )
+
+    indicators = format_indicators(country_resources.get("indicators"), years=config.forecast_indicator_years)
+    indicators_section = f"\n\n**Wskaźniki liczbowe (Bank Światowy):**\n{indicators}" if indicators else ""
+
+    return f"""**Kraj do analizy: {country_name}**
+
+**Charakterystyka kraju:**
+{_format_fields(country_resources, COUNTRY_FIELDS)}{indicators_section}
+
+**Kontekst międzynarodowy - inne kluczowe kraje:**
+{other_countries_context}
+
+Wygeneruj prognozy dla kraju {country_name} zgodnie z instrukcjami, scenariuszem i wzorem powyżej ([kraj] = {country_name}).
+"""
+
+
+def _usage(result):
+    # usage() is a method in pydantic-ai 1.x and a property in 2.x
+    return result.usage() if callable(result.usage) else result.usage
+
+
+async def generate_forecast(
+    country_name: str,
+    country_resources: dict,
+    other_countries: List[dict],
+    scenario: Union[Scenario, str],
+    scenario_weight: Optional[int] = None,
+    token_ledger: Optional[TokenLedger] = None,
+) -> ForecastOutput:
+    """
+    Generate a geopolitical forecast for a country based on a global scenario.
+
+    The static prefix (instructions, scenario, worked example) is built once
+    per scenario and served from the Gemini context cache when available.
+
+    Args:
+        country_name: Name of the country to forecast for
+        country_resources: Dictionary with country's resources and characteristics
+        other_countries: Other countries' resources, most relevant first
+        scenario: The global scenario (legacy free text is parsed into factors)
+        scenario_weight: Total weight, only used for free text without factors
+        token_ledger: Optional ledger receiving a TokenBudgetReport for this call
+
+    Returns:
+        ForecastOutput with 12-month and 36-month forecasts
+    """
+    if not isinstance(scenario, Scenario):
+        scenario = Scenario.from_text(scenario, total_weight=scenario_weight)
+    prefix = await prefix_cache.get(build_static_prefix(scenario), key=scenario.fingerprint)
+    prompt = build_country_prompt(country_name, country_resources, other_countries)
+
+    gateway = get_gateway()
+    estimated_tokens = prefix.estimated_tokens + estimate_tokens(prompt)
+
+    def gateway_call(fn):
+        # Rate-limited and retried; the simulation yields to interactive requests
+        return gateway.call(
+            fn,
+            model=config.gemini_model_name,
+            estimated_tokens=estimated_tokens,
+            priority=Priority.BATCH,
+            usage_tokens=lambda result: _usage(result).total_tokens,
+        )
     
     try:
-        result = await forecasting_agent.run(prompt)
-        return result.output
+        cache_mode = prefix.mode
+        if cache_mode == "gemini":
+            try:
+                result = await gateway_call(lambda: cached_forecasting_agent.run(
+                    prompt, model_settings=GoogleModelSettings(google_cached_content=prefix.remote_name)
+                ))
+            except Exception as e:
+                if classify_error(e) is not None:
+                    raise
+                # Cached content may have been evicted server-side; retry uncached
+                logger.warning(f"Cached forecast call failed, retrying without context cache: {e}")
+                prefix_cache.invalidate(prefix)
+                cache_mode = "local"
+        if cache_mode == "local":
+            result = await gateway_call(lambda: forecasting_agent.run(prompt, deps=prefix.text))
     except Exception as e:
-        raise Exception(f"Error generating forecast: {str(e)}")
+        raise Exception(f"Error generating forecast: {str(e)}") from e
+
+    if token_ledger is not None:
+        usage = _usage(result)
+        token_ledger.record(TokenBudgetReport(
+            country_name=country_name,
+            cache_mode=cache_mode,
+            prefix_tokens_estimated=prefix.estimated_tokens,
+            suffix_tokens_estimated=estimate_tokens(prompt),
+            input_tokens=usage.input_tokens or 0,
+            cached_tokens=usage.cache_read_tokens or 0,
+            output_tokens=usage.output_tokens or 0,
+        ))
+    return result.output
@@ -0,0 +1,209 @@
+"""
+Static prompt-prefix caching and token accounting for the forecasting agent.
+
+A forecast prompt is split into a static prefix (instructions, scenario, factor
+weights, worked example) shared by every country in a run and a short
+per-country suffix. The prefix is registered once as Gemini cached content when
+the API accepts it; otherwise the same byte-identical prefix is reused locally,
+which keeps it eligible for the provider's implicit prefix caching.
+"""
+
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from typing import Dict, List, Optional
+
+from src.agents.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Rough average for Polish/English text; only used for budgeting before a call
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (no tokenizer round-trip)."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def prefix_fingerprint(text: str) -> str:
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedPrefix:
+    """A static prompt prefix and, if created, its Gemini cached-content handle."""
+
+    fingerprint: str
+    text: str
+    estimated_tokens: int
+    remote_name: Optional[str] = None
+    expires_at: Optional[float] = None
+
+    @property
+    def mode(self) -> str:
+        """"gemini" while the remote cache is valid, "local" otherwise."""
+        if self.remote_name and (self.expires_at is None or self.expires_at > time.time()):
+            return "gemini"
+        return "local"
+
+
+class PrefixCache:
+    """
+    Caches static prompt prefixes, remotely (Gemini context cache) when possible.
+
+    Remote creation is attempted once per prefix; if it fails (prefix below the
+    model's minimum, unsupported model, quota) the prefix stays local-only.
+    """
+
+    def __init__(
+        self,
+        client=None,
+        model_name: str = "",
+        enabled: bool = True,
+        ttl_seconds: int = 3600,
+        min_tokens: int = 4096,
+        max_entries: int = 16,
+    ):
+        """
+        Args:
+            client: google.genai client (None = local-only)
+            model_name: Gemini model the cached content is bound to
+            enabled: Try to create Gemini cached content
+            ttl_seconds: Lifetime of remote cached content
+            min_tokens: Smallest prefix worth caching remotely (model minimum)
+            max_entries: Prefixes kept, least recently used evicted first (remote
+                         cached content of an evicted prefix simply expires)
+        """
+        self._client = client
+        self._model_name = model_name
+        self._enabled = enabled and client is not None
+        self._ttl_seconds = ttl_seconds
+        self._min_tokens = min_tokens
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[str, CachedPrefix]" = OrderedDict()
+        self._remote_failed: set = set()
+        self._creating: SingleFlight[CachedPrefix] = SingleFlight()
+
+    async def get(self, text: str, key: Optional[str] = None) -> CachedPrefix:
+        """
+        Get the cached prefix for a text, creating remote cached content if needed
+
+        Args:
+            text: Static prefix (system instruction) text
+            key: Precomputed fingerprint of the text's inputs (default: hash of text)
+
+        Returns:
+            CachedPrefix; ``mode`` tells whether the remote cache can be used
+        """
+        fingerprint = key or prefix_fingerprint(text)
+        entry = self._entries.get(fingerprint)
+        if entry is None:
+            entry = CachedPrefix(fingerprint, text, estimate_tokens(text))
+            self._entries[fingerprint] = entry
+            if len(self._entries) > self._max_entries:
+                evicted, _ = self._entries.popitem(last=False)
+                self._remote_failed.discard(evicted)
+        else:
+            self._entries.move_to_end(fingerprint)
+
+        if entry.mode == "gemini" or not self._should_create(entry):
+            return entry
+        result, _ = await self._creating.do(fingerprint, lambda: self._create_remote(entry))
+        return result
+
+    def invalidate(self, entry: CachedPrefix):
+        """Drop the remote handle of a prefix (e.g. after the API rejected it)."""
+        entry.remote_name = None
+        entry.expires_at = None
+        self._remote_failed.add(entry.fingerprint)
+
+    def _should_create(self, entry: CachedPrefix) -> bool:
+        return (
+            self._enabled
+            and entry.fingerprint not in self._remote_failed
+            and entry.estimated_tokens >= self._min_tokens
+        )
+
+    async def _create_remote(self, entry: CachedPrefix) -> CachedPrefix:
+        from google.genai import types
+
+        try:
+            cached = await self._client.aio.caches.create(
+                model=self._model_name,
+                config=types.CreateCachedContentConfig(
+                    system_instruction=entry.text,
+                    ttl=f"{self._ttl_seconds}s",
+                    display_name=f"diplomind-{entry.fingerprint[:12]}",
+                ),
+            )
+            entry.remote_name = cached.name
+            # Refresh a minute early so a call never races the expiry
+            entry.expires_at = time.time() + self._ttl_seconds - 60
+            logger.info(f"Created Gemini context cache {cached.name} (~{entry.estimated_tokens} tokens)")
+        except Exception as e:
+            self._remote_failed.add(entry.fingerprint)
+            logger.warning(f"Gemini context cache unavailable, using local prefix cache: {e}")
+        return entry
+
+
+@dataclass
+class TokenBudgetReport:
+    """Token usage of a single forecast call."""
+
+    country_name: str
+    cache_mode: str
+    prefix_tokens_estimated: int
+    suffix_tokens_estimated: int
+    input_tokens: int = 0
+    cached_tokens: int = 0
+    output_tokens: int = 0
+
+    @property
+    def uncached_input_tokens(self) -> int:
+        return max(self.input_tokens - self.cached_tokens, 0)
+
+    def as_dict(self) -> dict:
+        return {**asdict(self), "uncached_input_tokens": self.uncached_input_tokens}
+
+
+@dataclass
+class TokenLedger:
+    """Per-run collection of forecast token reports."""
+
+    reports: List[TokenBudgetReport] = field(default_factory=list)
+
+    def record(self, report: TokenBudgetReport):
+        self.reports.append(report)
+        logger.info(
+            f"Tokens for {report.country_name}: input={report.input_tokens} "
+            f"(cached={report.cached_tokens}), output={report.output_tokens}, "
+            f"prefix~{report.prefix_tokens_estimated}, suffix~{report.suffix_tokens_estimated}, "
+            f"cache={report.cache_mode}"
+        )
+
+    def totals(self) -> Dict[str, int]:
+        """Summed token counts over all recorded forecasts."""
+        totals = {
+            "forecasts": len(self.reports),
+            "input_tokens": 0,
+            "cached_tokens": 0,
+            "uncached_input_tokens": 0,
+            "output_tokens": 0,
+        }
+        for report in self.reports:
+            totals["input_tokens"] += report.input_tokens
+            totals["cached_tokens"] += report.cached_tokens
+            totals["uncached_input_tokens"] += report.uncached_input_tokens
+            totals["output_tokens"] += report.output_tokens
+        return totals
+
+    def summary(self) -> str:
+        totals = self.totals()
+        return (
+            f"{totals['forecasts']} forecasts: input={totals['input_tokens']} "
+            f"(cached={totals['cached_tokens']}, uncached={totals['uncached_input_tokens']}), "
+            f"output={totals['output_tokens']}"
+        )
@@ -0,0 +1,163 @@
+"""
+Response cache for root agent runs.
+
+Identical prompts (after normalization) against the same agent graph, model and
+generation settings return the stored response instead of running the whole
+multi-agent pipeline again. Only prompts opening a conversation are cached: a
+follow-up depends on the session history. Entries expire after a configurable TTL and live in memory or,
+optionally, in a Postgres table shared by all API workers.
+"""
+
+import hashlib
+import json
+import logging
+import time
+import unicodedata
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Protocol
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert
+
+from src.configuration import Configuration
+from src.db.db_config import db_config
+from src.db.hack.response_cache import ResponseCacheEntry
+
+logger = logging.getLogger(__name__)
+
+config = Configuration()
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt so trivially different spellings share a cache entry."""
+    text = unicodedata.normalize("NFKC", prompt)
+    return " ".join(text.casefold().split())
+
+
+def make_cache_key(prompt: str, graph_version: str, model: str, generation_config: str) -> str:
+    """
+    Build the cache key for an agent run.
+
+    Args:
+        prompt: Raw user prompt
+        graph_version: Version hash of the agent graph (agents, prompts, tools)
+        model: Model name used by the agents
+        generation_config: Canonical JSON of the agents' generation settings
+
+    Returns:
+        Hex sha256 digest
+    """
+    material = json.dumps(
+        [normalize_prompt(prompt), graph_version, model, generation_config],
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class ResponseCacheBackend(Protocol):
+    async def get(self, key: str) -> Optional[dict]: ...
+
+    async def set(self, key: str, value: dict, ttl_seconds: int): ...
+
+
+class InMemoryResponseCacheBackend:
+    """Process-local LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+    async def get(self, key: str) -> Optional[dict]:
+        item = self._entries.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: dict, ttl_seconds: int):
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+
+class PostgresResponseCacheBackend:
+    """Cache stored in the `response_cache` table, shared across workers."""
+
+    def __init__(self):
+        self._sessionmaker = db_config.get_sessionmaker()
+
+    async def get(self, key: str) -> Optional[dict]:
+        now = datetime.now(timezone.utc)
+        async with self._sessionmaker() as session:
+            entry = await session.scalar(
+                select(ResponseCacheEntry).where(ResponseCacheEntry.key == key)
+            )
+            if entry is None:
+                return None
+            if entry.expires_at <= now:
+                await session.execute(
+                    delete(ResponseCacheEntry).where(ResponseCacheEntry.key == key)
+                )
+                await session.commit()
+                return None
+            return entry.payload
+
+    async def set(self, key: str, value: dict, ttl_seconds: int):
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        statement = insert(ResponseCacheEntry).values(
+            key=key, payload=value, expires_at=expires_at
+        )
+        statement = statement.on_conflict_do_update(
+            index_elements=[ResponseCacheEntry.key],
+            set_={"payload": value, "expires_at": expires_at},
+        )
+        async with self._sessionmaker() as session:
+            await session.execute(statement)
+            await session.commit()
+
+
+class ResponseCache:
+    """TTL cache for agent responses with a pluggable backend."""
+
+    def __init__(self, backend: ResponseCacheBackend, ttl_seconds: int):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    async def get(self, key: str) -> Optional[dict]:
+        try:
+            return await self.backend.get(key)
+        except Exception as e:
+            # A broken cache must never break the request path
+            logger.warning(f"Response cache read failed: {e}")
+            return None
+
+    async def set(self, key: str, value: dict):
+        try:
+            await self.backend.set(key, value, self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Response cache write failed: {e}")
+
+
+def create_response_cache() -> Optional[ResponseCache]:
+    """Create the response cache from configuration, or None if disabled."""
+    if not config.response_cache_enabled:
+        return None
+    if config.response_cache_backend == "postgres":
+        backend = PostgresResponseCacheBackend()
+    elif config.response_cache_backend == "memory":
+        backend = InMemoryResponseCacheBackend(config.response_cache_max_entries)
+    else:
+        raise ValueError(
+            f"Unknown response cache backend: {config.response_cache_backend}"
+        )
+    logger.info(
+        f"Response cache enabled ({config.response_cache_backend}, "
+        f"ttl={config.response_cache_ttl_seconds}s)"
+    )
+    return ResponseCache(backend, config.response_cache_ttl_seconds)
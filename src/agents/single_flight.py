@@ -0,0 +1,47 @@
+"""
+Single-flight deduplication of concurrent async work.
+
+Concurrent callers asking for the same key share one in-flight computation and
+all receive its result (or its exception). The computation runs as its own task,
+so a caller that disconnects does not cancel it for the others.
+"""
+
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Coalesces concurrent calls with the same key into a single execution."""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> Tuple[T, bool]:
+        """
+        Run ``fn`` once per key among concurrent callers.
+
+        Args:
+            key: Deduplication key
+            fn: Coroutine factory producing the result
+
+        Returns:
+            Tuple of (result, shared) where ``shared`` is True for callers that
+            joined a computation started by someone else
+        """
+        task = self._inflight.get(key)
+        shared = task is not None
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._forget(key, task))
+        return await asyncio.shield(task), shared
+
+    def _forget(self, key: str, task: asyncio.Task):
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+
+    def inflight(self) -> int:
+        """Number of distinct computations currently running."""
+        return len(self._inflight)
@@ -1,54 +1,54 @@
-import os
 import logging
 from datetime import datetime
-from src.report_generator import ForecastReportGenerator
+from src.models.report import Report
 from src.models.world_model import WorldModel
-from src.configuration import config
+from src.report_store import ReportStore
+from src.configuration import Configuration
 from google.adk.tools import FunctionTool
 from pydantic import BaseModel
 
 logger = logging.getLogger(__name__)
 
+config = Configuration()
+
+report_store = ReportStore()
+
 
 class WorldReport(BaseModel):
+    report_hash: str
     report_path: str
 
 
-def get_world_report():
+async def get_world_report():
     """
     A tool that allows the agent to interact with the world.
+    Runs the simulation in the caller's event loop, so the API keeps serving
+    other requests while forecasts are generated.
     """
-    # Create reports directory from configuration
-    reports_dir = config.report_dir
-    os.makedirs(reports_dir, exist_ok=True)
-
     # Initialize World Model
     logger.info("Initializing World Model...")
     model = WorldModel()
 
     # Run complete simulation (exploration + forecasting)
-    model.run_simulation()
+    await model.arun_simulation()
 
-    # Generate PDF Report
-    logger.info("Generating PDF report...")
+    # Store the report model; the API renders HTML/Markdown/PDF from it on demand
+    logger.info("Saving report...")
     try:
         # Collect all forecasts from agents
         forecasts_data = model.get_forecasts()
 
         if forecasts_data:
-            # Generate PDF report
-            report_gen = ForecastReportGenerator()
-            report_gen.generate_report(
-                scenario=model.scenario,
-                forecasts=forecasts_data,
-                timestamp=datetime.now(),
-            )
-            logger.info(f"✅ PDF report generated: {report_gen.output_path}")
+            report = Report.from_forecasts(model.scenario, forecasts_data, datetime.now())
+            # Identical forecasts map to the same hash and reuse the stored report
+            report_hash = report_store.put(report)
+            report_path = report_store.path(report_hash)
+            logger.info(f"✅ Report saved: {report_path} (GET /reports/{report_hash}?format=pdf)")
+            return WorldReport(report_hash=report_hash, report_path=report_path).model_dump()
         else:
             logger.warning("No forecasts available to generate report")
 
     except Exception as e:
-        logger.error(f"Failed to generate PDF report: {e}", exc_info=True)
-
+        logger.error(f"Failed to save report: {e}", exc_info=True)
 
 world_tool = FunctionTool(func=get_world_report)
@@ -5,6 +5,7 @@ from pprint import pprint
 import logfire
 from fastapi import FastAPI
 
+from src.api.middleware import add_metrics_middleware
 from src.api.v1.routes import create_routes
 from src.configuration import Configuration
 
@@ -93,6 +94,7 @@ def create_app():
     async def shutdown_event():
         logger.info("🛑 HackNation AI Agent API is shutting down...")
 
+    add_metrics_middleware(app)
     create_routes(app)
 
     logger.info("✅ FastAPI application created successfully")
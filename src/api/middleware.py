@@ -0,0 +1,36 @@
+import time
+
+from fastapi import FastAPI, Request
+
+from src.metrics import HTTP_ERRORS, HTTP_LATENCY, HTTP_REQUESTS, track_inflight
+
+UNMATCHED_ROUTE = "unmatched"
+
+
+def _route_template(request: Request) -> str:
+    """Return the route path template (e.g. "/reports/{digest}") to keep labels bounded."""
+    route = request.scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+def add_metrics_middleware(app: FastAPI):
+    """Record request rate, errors and latency for every route."""
+
+    @app.middleware("http")
+    async def metrics_middleware(request: Request, call_next):
+        method = request.method
+        start = time.perf_counter()
+        status = 500
+        try:
+            with track_inflight("http_requests"):
+                response = await call_next(request)
+            status = response.status_code
+            return response
+        finally:
+            route = _route_template(request)
+            HTTP_REQUESTS.labels(method=method, route=route, status=str(status)).inc()
+            HTTP_LATENCY.labels(method=method, route=route).observe(
+                time.perf_counter() - start
+            )
+            if status >= 500:
+                HTTP_ERRORS.labels(method=method, route=route).inc()
@@ -2,10 +2,14 @@ from fastapi import APIRouter, FastAPI
 
 from src.api.v1.views.agent_info import router as agent_info_router
 from src.api.v1.views.health import router as health_router
+from src.api.v1.views.metrics import router as metrics_router
 from src.api.v1.views.prompt import router as prompt_router
+from src.api.v1.views.reports import router as reports_router
 
 
 def create_routes(app: FastAPI):
     app.include_router(health_router)
     app.include_router(agent_info_router)
     app.include_router(prompt_router)
+    app.include_router(metrics_router)
+    app.include_router(reports_router)
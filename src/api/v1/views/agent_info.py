@@ -1,13 +1,18 @@
-from fastapi import APIRouter
+import hashlib
+import json
+
+from fastapi import APIRouter, Request, Response
 from pydantic import BaseModel
 
 from src.configuration import Configuration
-from src.helpers import load_system_prompt
+from src.prompt_registry import prompt_registry
 
 config = Configuration()
 
 router = APIRouter()
 
+ROOT_PROMPT = "root"
+
 
 class AgentInfoResponse(BaseModel):
     model: str
@@ -16,11 +21,44 @@ class AgentInfoResponse(BaseModel):
     system_prompt: str
 
 
+# Rendered body and ETag, rebuilt only when the prompts change
+_cached = {"version": None, "body": b"", "etag": ""}
+
+
+def _render() -> tuple[bytes, str]:
+    version = prompt_registry.version
+    if _cached["version"] != version:
+        body = json.dumps(
+            AgentInfoResponse(
+                model=config.google_model_name,
+                provider="Google",
+                capabilities=["text_generation", "conversation", "problem_solving"],
+                system_prompt=prompt_registry.get(ROOT_PROMPT),
+            ).model_dump(mode="json"),
+            ensure_ascii=False,
+        ).encode("utf-8")
+        _cached.update(
+            version=version,
+            body=body,
+            etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"',
+        )
+    return _cached["body"], _cached["etag"]
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return etag.removeprefix("W/") in candidates
+
+
 @router.get("/agent_info", tags=["agent_info"])
-async def agent_info():
-    return AgentInfoResponse(
-        model=config.google_model_name,
-        provider="Google",
-        capabilities=["text_generation", "conversation", "problem_solving"],
-        system_prompt=load_system_prompt("src/prompts/root.md"),
-    ).model_dump(mode="json")
+async def agent_info(request: Request):
+    body, etag = _render()
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -1,7 +1,22 @@
+import asyncio
+import time
+from typing import Optional
+
 from fastapi import APIRouter
+from fastapi.responses import JSONResponse
+
+from src.configuration import Configuration
+from src.db.db_config import db_config
+from src.metrics import inflight_count, model_states
+
+config = Configuration()
 
 router = APIRouter()
 
+# Last readiness result, shared by concurrent probes
+_readiness = {"checked_at": 0.0, "ready": False, "checks": {}}
+_readiness_lock = asyncio.Lock()
+
 
 @router.get("/health", tags=["health"])
 async def health():
@@ -11,5 +26,79 @@ async def health():
         "endpoints": {
             "/prompt": "POST - Send prompts to the AI agent",
             "/agent_info": "GET - Get information about the AI agent",
+            "/livez": "GET - Liveness probe",
+            "/readyz": "GET - Readiness probe (database, models, queue depth)",
+            "/metrics": "GET - Prometheus metrics",
+            "/reports/{report_id}": "GET - Forecast report (?format=json|html|md|pdf)",
         },
     }
+
+
+@router.get("/livez", tags=["health"])
+async def livez():
+    """Liveness probe: the process is up and the event loop is responsive."""
+    return {"status": "ok"}
+
+
+async def _check_database() -> dict:
+    timeout = config.readiness_db_timeout_seconds
+    start = time.perf_counter()
+    try:
+        await asyncio.wait_for(asyncio.to_thread(db_config.ping, timeout), timeout)
+    except asyncio.TimeoutError:
+        return {"ok": False, "error": f"timeout after {timeout}s"}
+    except Exception as e:
+        return {"ok": False, "error": str(e)}
+    return {"ok": True, "latency_ms": round((time.perf_counter() - start) * 1000, 1)}
+
+
+def _check_models() -> Optional[dict]:
+    """Model load states; None (no check) when no model was ever loaded and none is required"""
+    states = model_states()
+    if not states:
+        if config.readiness_require_model_warm:
+            return {"ok": False, "warm": False, "states": {}, "error": "no model loaded"}
+        return None
+    failed = [name for name, state in states.items() if state == "failed"]
+    warm = all(state == "ready" for state in states.values())
+    ok = not failed and (warm or not config.readiness_require_model_warm)
+    return {"ok": ok, "warm": warm, "states": states}
+
+
+def _check_queue() -> dict:
+    depth = inflight_count("agent_runs")
+    limit = config.readiness_max_inflight_agent_runs
+    return {"ok": depth < limit, "depth": depth, "limit": limit}
+
+
+async def _run_readiness_checks() -> dict:
+    """Run readiness checks, reusing the previous result within the cache interval."""
+    async with _readiness_lock:
+        age = time.monotonic() - _readiness["checked_at"]
+        if age < config.readiness_cache_seconds:
+            return _readiness
+
+        checks = {"database": await _check_database()}
+        models = _check_models()
+        if models is not None:
+            checks["models"] = models
+        checks["queue"] = _check_queue()
+        _readiness.update(
+            checked_at=time.monotonic(),
+            ready=all(check["ok"] for check in checks.values()),
+            checks=checks,
+        )
+        return _readiness
+
+
+@router.get("/readyz", tags=["health"])
+async def readyz():
+    """Readiness probe: 200 when the pod can serve traffic, 503 otherwise."""
+    result = await _run_readiness_checks()
+    return JSONResponse(
+        status_code=200 if result["ready"] else 503,
+        content={
+            "status": "ready" if result["ready"] else "not_ready",
+            "checks": result["checks"],
+        },
+    )
@@ -0,0 +1,14 @@
+from fastapi import APIRouter, Response
+
+from src.db.db_config import db_config
+from src.metrics import METRICS_CONTENT_TYPE, render_metrics, set_db_pool_usage
+
+router = APIRouter()
+
+
+@router.get("/metrics", tags=["metrics"], include_in_schema=False)
+async def metrics():
+    """Expose Prometheus metrics."""
+    stats = db_config.pool_stats()
+    set_db_pool_usage(stats["used"], stats["idle"], stats["max"])
+    return Response(content=render_metrics(), media_type=METRICS_CONTENT_TYPE)
@@ -2,13 +2,29 @@ import os
 import uuid
 from typing import Annotated, Optional
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
+from fastapi.encoders import jsonable_encoder
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 from pydantic import BaseModel
 
-from src.agents.agent import root_agent
+from src.agents.agent import (
+    DEFAULT_MODEL,
+    agent_generation_config,
+    agent_graph_version,
+    root_agent,
+)
+from src.agents.response_cache import create_response_cache, make_cache_key
+from src.agents.single_flight import SingleFlight
+from src.configuration import Configuration
+from src.metrics import (
+    ACTIVE_SESSIONS,
+    AGENT_RUNS,
+    COALESCED_PROMPTS,
+    RESPONSE_CACHE,
+    track_inflight,
+)
 from src.models.input import CountryInput
 from src.models.prompts import PromptRequest, SystemInstructionInput
 
@@ -22,12 +38,19 @@ os.environ["MAX_TOOL_CALLS_PER_TURN"] = "2"
 os.environ["MAX_FUNCTION_CALLS"] = "3"
 os.environ["TOOL_CALL_LIMIT"] = "3"
 
+config = Configuration()
+
 router = APIRouter()
 
+CACHE_HEADER = "X-Cache"
+COALESCED_HEADER = "X-Coalesced"
+
 APP_NAME = "root_agent_app"
 
 session_service = InMemorySessionService()
 runner = Runner(agent=root_agent, app_name=APP_NAME, session_service=session_service)
+response_cache = create_response_cache()
+prompt_single_flight: SingleFlight[dict] = SingleFlight()
 
 # Store user sessions and contexts
 user_sessions = {}
@@ -56,6 +79,7 @@ async def get_user_session(
             user_id=user_id,
         )
         user_sessions[user_id] = {"session": session}
+        ACTIVE_SESSIONS.set(len(user_sessions))
 
     return user_id, user_sessions[user_id]
 
@@ -64,124 +88,201 @@ UserSessionDep = Annotated[tuple[str, dict], Depends(get_user_session)]
 RunnerDep = Annotated[Runner, Depends(get_runner)]
 
 
+async def run_agent(
+    agent_runner: Runner, session, content: types.Content
+) -> tuple[Optional[str], list, list]:
+    """Run the root agent once and collect the final response and tool usage."""
+    final_response = None
+    tools_used = []
+    agent_tools_info = []
+    tool_call_count = 0
+    max_tool_calls = 3  # Additional runtime limit
+
+    async for event in agent_runner.run_async(
+        user_id=session.user_id, session_id=session.id, new_message=content
+    ):
+        # Collect tool usage information from various possible sources
+        if hasattr(event, "tool_calls") and event.tool_calls:
+            for tool_call in event.tool_calls:
+                tool_call_count += 1
+                if tool_call_count > max_tool_calls:
+                    print(
+                        f"⚠️ Tool call limit ({max_tool_calls}) exceeded, skipping additional calls"
+                    )
+                    break
+                tools_used.append(
+                    {
+                        "tool_name": getattr(tool_call, "name", "unknown"),
+                        "parameters": getattr(tool_call, "arguments", {}),
+                        "timestamp": getattr(event, "timestamp", None),
+                    }
+                )
+
+        # Check for tool results or tool usage in the event
+        if hasattr(event, "tool_results") and event.tool_results:
+            for tool_result in event.tool_results:
+                tools_used.append(
+                    {
+                        "tool_name": getattr(tool_result, "name", "unknown"),
+                        "result": getattr(tool_result, "result", None),
+                        "timestamp": getattr(event, "timestamp", None),
+                    }
+                )
+
+        if event.is_final_response():
+            # Extract text content with error handling
+            final_response = None
+            try:
+                if hasattr(event, "content") and event.content:
+                    if hasattr(event.content, "parts") and event.content.parts:
+                        # Try to get text from parts
+                        part = event.content.parts[0]
+                        if hasattr(part, "text"):
+                            final_response = part.text
+                        elif hasattr(part, "content"):
+                            final_response = str(part.content)
+                        else:
+                            final_response = str(part)
+                    elif hasattr(event.content, "text"):
+                        final_response = event.content.text
+                    else:
+                        final_response = str(event.content)
+                elif hasattr(event, "text"):
+                    final_response = event.text
+                elif hasattr(event, "message"):
+                    final_response = event.message
+                else:
+                    final_response = str(event)
+            except Exception as e:
+                print(f"Error extracting response text: {e}")
+                final_response = f"Error extracting response: {str(e)}"
+
+            print(f"Agent Response: {final_response}")
+
+            # Extract tools information from various possible locations
+            if hasattr(event, "tools") and event.tools:
+                agent_tools_info = event.tools
+            elif hasattr(event.content, "tools") and getattr(
+                event.content, "tools", None
+            ):
+                agent_tools_info = event.content.tools
+            elif hasattr(event, "tool_calls") and event.tool_calls:
+                # Convert tool calls to tools info
+                agent_tools_info = [
+                    {
+                        "name": getattr(tc, "name", "unknown"),
+                        "args": getattr(tc, "arguments", {}),
+                    }
+                    for tc in event.tool_calls
+                ]
+
+            break
+
+    return final_response, agent_tools_info, tools_used
+
+
+async def compute_response(
+    agent_runner: Runner, session, prompt_text: str, cache_key: Optional[str]
+) -> dict:
+    """Run the root agent for a prompt and store the result in the response cache
+    (unless cache_key is None)."""
+    # Create message content
+    content = types.Content(role="user", parts=[types.Part(text=prompt_text)])
+
+    # Run the agent and collect response
+    try:
+        with track_inflight("agent_runs"):
+            final_response, agent_tools_info, tools_used = await run_agent(
+                agent_runner, session, content
+            )
+    except Exception:
+        AGENT_RUNS.labels(outcome="error").inc()
+        raise
+    AGENT_RUNS.labels(outcome="success").inc()
+
+    # Also try to get tools from the agent configuration
+    agent_declared_tools = []
+    if hasattr(root_agent, "tools") and root_agent.tools:
+        agent_declared_tools = [
+            {
+                "name": getattr(tool, "name", str(tool)),
+                "description": getattr(tool, "description", ""),
+            }
+            for tool in root_agent.tools
+        ]
+
+    result = {
+        "response": final_response,
+        "tools": agent_tools_info if agent_tools_info else agent_declared_tools,
+        "tools_used": tools_used,
+    }
+    if (
+        response_cache is not None
+        and cache_key is not None
+        and final_response is not None
+    ):
+        await response_cache.set(cache_key, jsonable_encoder(result))
+    return result
+
+
 @router.post("/prompt", tags=["prompt"])
 async def prompt(
     prompt_request: PromptRequest,
     user_session: UserSessionDep,
     agent_runner: RunnerDep,
+    response: Response,
 ):
     """Send a prompt to the root agent and get a response."""
     try:
         user_id, user_data = user_session
         session = user_data["session"]
 
-        # Create message content
-        content = types.Content(
-            role="user", parts=[types.Part(text=prompt_request.prompt)]
+        # A follow-up prompt is answered in the context of the conversation so
+        # far, so it is neither served from nor shared with other sessions
+        current = await session_service.get_session(
+            app_name=APP_NAME, user_id=user_id, session_id=session.id
         )
+        has_history = bool(current is not None and current.events)
+        cache_key = None
+        if not has_history:
+            cache_key = make_cache_key(
+                prompt_request.prompt,
+                agent_graph_version(),
+                DEFAULT_MODEL,
+                agent_generation_config(),
+            )
+        if response_cache is not None and cache_key is not None:
+            cached = await response_cache.get(cache_key)
+            if cached is not None:
+                RESPONSE_CACHE.labels(result="hit").inc()
+                response.headers[CACHE_HEADER] = "HIT"
+                return {
+                    **cached,
+                    "user_id": user_id,
+                    "session_id": session.id,
+                    "success": True,
+                }
+            RESPONSE_CACHE.labels(result="miss").inc()
+            response.headers[CACHE_HEADER] = "MISS"
+        else:
+            response.headers[CACHE_HEADER] = "BYPASS"
 
-        # Run the agent and collect response
-        final_response = None
-        tools_used = []
-        agent_tools_info = []
-        tool_call_count = 0
-        max_tool_calls = 3  # Additional runtime limit
-
-        async for event in agent_runner.run_async(
-            user_id=session.user_id, session_id=session.id, new_message=content
-        ):
-            # Collect tool usage information from various possible sources
-            if hasattr(event, "tool_calls") and event.tool_calls:
-                for tool_call in event.tool_calls:
-                    tool_call_count += 1
-                    if tool_call_count > max_tool_calls:
-                        print(
-                            f"⚠️ Tool call limit ({max_tool_calls}) exceeded, skipping additional calls"
-                        )
-                        break
-                    tools_used.append(
-                        {
-                            "tool_name": getattr(tool_call, "name", "unknown"),
-                            "parameters": getattr(tool_call, "arguments", {}),
-                            "timestamp": getattr(event, "timestamp", None),
-                        }
-                    )
-
-            # Check for tool results or tool usage in the event
-            if hasattr(event, "tool_results") and event.tool_results:
-                for tool_result in event.tool_results:
-                    tools_used.append(
-                        {
-                            "tool_name": getattr(tool_result, "name", "unknown"),
-                            "result": getattr(tool_result, "result", None),
-                            "timestamp": getattr(event, "timestamp", None),
-                        }
-                    )
+        def compute():
+            return compute_response(
+                agent_runner, session, prompt_request.prompt, cache_key
+            )
 
-            if event.is_final_response():
-                # Extract text content with error handling
-                final_response = None
-                try:
-                    if hasattr(event, "content") and event.content:
-                        if hasattr(event.content, "parts") and event.content.parts:
-                            # Try to get text from parts
-                            part = event.content.parts[0]
-                            if hasattr(part, "text"):
-                                final_response = part.text
-                            elif hasattr(part, "content"):
-                                final_response = str(part.content)
-                            else:
-                                final_response = str(part)
-                        elif hasattr(event.content, "text"):
-                            final_response = event.content.text
-                        else:
-                            final_response = str(event.content)
-                    elif hasattr(event, "text"):
-                        final_response = event.text
-                    elif hasattr(event, "message"):
-                        final_response = event.message
-                    else:
-                        final_response = str(event)
-                except Exception as e:
-                    print(f"Error extracting response text: {e}")
-                    final_response = f"Error extracting response: {str(e)}"
-
-                print(f"Agent Response: {final_response}")
-
-                # Extract tools information from various possible locations
-                if hasattr(event, "tools") and event.tools:
-                    agent_tools_info = event.tools
-                elif hasattr(event.content, "tools") and getattr(
-                    event.content, "tools", None
-                ):
-                    agent_tools_info = event.content.tools
-                elif hasattr(event, "tool_calls") and event.tool_calls:
-                    # Convert tool calls to tools info
-                    agent_tools_info = [
-                        {
-                            "name": getattr(tc, "name", "unknown"),
-                            "args": getattr(tc, "arguments", {}),
-                        }
-                        for tc in event.tool_calls
-                    ]
-
-                break
-
-        # Also try to get tools from the agent configuration
-        agent_declared_tools = []
-        if hasattr(root_agent, "tools") and root_agent.tools:
-            agent_declared_tools = [
-                {
-                    "name": getattr(tool, "name", str(tool)),
-                    "description": getattr(tool, "description", ""),
-                }
-                for tool in root_agent.tools
-            ]
+        if config.prompt_single_flight_enabled and cache_key is not None:
+            # Identical concurrent prompts share one agent run
+            result, shared = await prompt_single_flight.do(cache_key, compute)
+        else:
+            result, shared = await compute(), False
+        if shared:
+            COALESCED_PROMPTS.inc()
+            response.headers[COALESCED_HEADER] = "true"
 
         return {
-            "response": final_response,
-            "tools": agent_tools_info if agent_tools_info else agent_declared_tools,
-            "tools_used": tools_used,
+            **result,
             "user_id": user_id,
             "session_id": session.id,
             "success": True,
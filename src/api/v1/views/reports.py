@@ -0,0 +1,52 @@
+import asyncio
+
+from fastapi import APIRouter, HTTPException, Path, Query, Request, Response
+from fastapi.responses import FileResponse
+
+from src.agents.single_flight import SingleFlight
+from src.api.v1.views.agent_info import etag_matches
+from src.report_renderers import get_renderer
+from src.report_store import REPORT_HASH_PATTERN, ReportStore
+
+router = APIRouter()
+
+# Artifacts are content-addressed, so a URL always maps to the same bytes
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+report_store = ReportStore()
+
+# Concurrent requests for a format that is not rendered yet share one render
+render_single_flight: SingleFlight[str] = SingleFlight()
+
+
+@router.get("/reports/{report_hash}", tags=["reports"])
+async def get_report(
+    request: Request,
+    report_hash: str = Path(pattern=REPORT_HASH_PATTERN),
+    format: str = Query("json", description="json, html, md or pdf"),
+):
+    """
+    Serve a stored report in the requested format.
+
+    The JSON model is stored when the report is created; other formats are
+    rendered on first request (the PDF lazily, in a worker thread) and reused.
+    """
+    try:
+        renderer = get_renderer(format)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not report_store.exists(report_hash):
+        raise HTTPException(status_code=404, detail=f"Report '{report_hash}' not found")
+
+    etag = f'"{report_hash}-{renderer.format}"'
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL}
+    report_store.touch(report_hash)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    path = report_store.path(report_hash, renderer.format)
+    if not report_store.exists(report_hash, renderer.format):
+        path, _ = await render_single_flight.do(
+            path, lambda: asyncio.to_thread(report_store.render, report_hash, renderer.format)
+        )
+    return FileResponse(path, media_type=renderer.media_type, headers=headers)
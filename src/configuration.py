@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Dict, Optional, List
 from pydantic import Field, SecretStr
 from pydantic_settings import BaseSettings
 
@@ -27,6 +27,79 @@ class Configuration(BaseSettings):
     max_tokens: int = Field(default=1000, gt=0, env="MAX_TOKENS")
     logfire_token: Optional[SecretStr] = Field(default=None, env="LOGFIRE_TOKEN")
 
+    # Gemini (forecasting agent and scrapers)
+    gemini_api_key: Optional[str] = Field(default=None, env="GEMINI_API_KEY")
+    gemini_model_name: str = Field(default="gemini-2.0-flash", env="GEMINI_MODEL_NAME")
+    gemini_temperature: float = Field(default=0.2, ge=0.0, le=2.0, env="GEMINI_TEMPERATURE")
+    gemini_max_tokens: int = Field(default=4096, gt=0, env="GEMINI_MAX_TOKENS")
+    # Context cache for the static forecast prompt prefix (falls back to local reuse)
+    gemini_context_cache_enabled: bool = True
+    gemini_context_cache_ttl_seconds: int = 3600
+    gemini_context_cache_min_tokens: int = 1024
+
+    # LLM gateway (provider "gemini", or "fake" for local runs without API calls)
+    llm_provider: str = "gemini"
+    llm_rpm: int = 60
+    llm_tpm: int = 1_000_000
+    # Per-model overrides, e.g. {"gemini-2.5-flash": {"rpm": 10, "tpm": 250000}}
+    llm_model_limits: Dict[str, Dict[str, int]] = {}
+    llm_max_retries: int = 5
+    llm_backoff_base_seconds: float = 1.0
+    llm_backoff_max_seconds: float = 60.0
+
+    # Country scrapers: hosts are crawled in parallel, requests to one host are spaced out
+    crawler_max_concurrency: int = 8
+    crawler_domain_delay_seconds: float = 2.0
+    crawler_timeout_seconds: float = 15.0
+    crawler_max_retries: int = 2
+    crawler_backoff_base_seconds: float = 1.0
+    crawler_backoff_max_seconds: float = 30.0
+    # Conditional-request cache (ETag / Last-Modified); unchanged sources skip LLM extraction
+    crawler_cache_enabled: bool = True
+    crawler_cache_dir: str = ".cache/http"
+    # Scraped text sent to the extraction LLM per country (shared between its sources)
+    crawler_prompt_max_chars: int = 24000
+    # World Bank indicators (bulk multi-country queries, cached locally)
+    worldbank_start_year: int = 2010
+    worldbank_per_page: int = 1000
+    worldbank_cache_path: str = ".cache/worldbank.json"
+    worldbank_cache_ttl_hours: float = 24.0
+
+    # Logging
+    log_level: str = "INFO"
+    log_dir: str = "logs"
+
+    # Reports
+    report_dir: str = "reports"
+    report_page_size: str = "A4"
+    # Processes laying out report sections in parallel (1 = no pool, 0 = one per CPU core).
+    # Spawning the pool costs seconds, so it only pays off for reports with many countries
+    report_render_workers: int = 1
+    # Unicode TTF fonts for PDF reports (empty: search DejaVu Sans / Noto Emoji / Symbola)
+    report_font_path: str = ""
+    report_font_bold_path: str = ""
+    report_emoji_font_path: str = ""
+    # Content-addressed report store (served by GET /reports/{hash})
+    report_store_dir: str = "reports/store"
+    report_store_max_mb: int = 500
+    report_store_max_age_days: int = 30
+
+    # Simulation
+    max_other_countries_context: int = 5
+    # Most recent years of each World Bank indicator included in forecast prompts
+    forecast_indicator_years: int = 5
+    exploration_radius: int = 1
+    # Rank context countries by sentence-embedding similarity instead of hashed TF-IDF
+    relevance_use_embeddings: bool = False
+    relevance_embedding_model: str = "all-MiniLM-L6-v2"
+    # Forecasts in flight at once (simulation steps and scenario batches)
+    batch_max_concurrency: int = 4
+    # Sensitivity sweeps: bisect weight intervals whose confidence shifts more than this
+    sweep_confidence_threshold: float = 0.1
+    sweep_max_points: int = 25
+    # Resumable runs: completed forecasts are appended here (one JSONL file per run)
+    checkpoint_dir: str = "checkpoints"
+
     # Server settings
     host: str = "0.0.0.0"
     port: int = 8000
@@ -39,6 +112,20 @@ class Configuration(BaseSettings):
     cors_allow_methods: List[str] = ["*"]
     cors_allow_headers: List[str] = ["*"]
 
+    # Health probes
+    readiness_cache_seconds: float = 5.0
+    readiness_db_timeout_seconds: float = 2.0
+    readiness_max_inflight_agent_runs: int = 32
+    readiness_require_model_warm: bool = False
+
+    # Agent response cache (backend: "memory" or "postgres")
+    response_cache_enabled: bool = False
+    response_cache_backend: str = "memory"
+    response_cache_ttl_seconds: int = 900
+    response_cache_max_entries: int = 1024
+    # Coalesce identical concurrent prompts into one agent run
+    prompt_single_flight_enabled: bool = True
+
     # Nested DB settings — SAFE!
     db: DB = DB()
 
@@ -0,0 +1,228 @@
+"""
+Async HTTP crawler shared by the country scrapers
+Different hosts are fetched in parallel under a global concurrency limit, while
+requests to the same host are serialised and spaced by a politeness delay, so a
+full refresh takes about as long as the slowest domain instead of the sum of
+every request. Timeouts, retries and backoff come from the configuration.
+With an HttpCache, requests are conditional and 304 responses are served from disk.
+"""
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from src.configuration import Configuration
+from src.crawlers.http_cache import HttpCache
+
+logger = logging.getLogger(__name__)
+
+config = Configuration()
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+}
+# Transient responses worth another attempt
+RETRY_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+
+@dataclass
+class FetchResult:
+    """Outcome of fetching one URL"""
+
+    url: str
+    status_code: Optional[int] = None
+    content: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+    encoding: Optional[str] = None
+    error: Optional[str] = None
+    attempts: int = 0
+    elapsed: float = 0.0
+    # False when the body is the same as on the previous run (304, or same content hash)
+    changed: bool = True
+    from_cache: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status_code is not None and self.status_code < 400
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding or "utf-8", errors="replace")
+
+
+@dataclass
+class _DomainState:
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+    last_request: float = 0.0
+
+
+class AsyncCrawler:
+    """
+    Polite concurrent fetcher
+
+    Usage:
+        async with AsyncCrawler() as crawler:
+            results = await crawler.fetch_all(urls)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        domain_delay: Optional[float] = None,
+        timeout: Optional[float] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+        headers: Optional[Dict[str, str]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+        cache: Optional[HttpCache] = None,
+    ):
+        """
+        Args:
+            max_concurrency: Requests in flight across all hosts (default from configuration)
+            domain_delay: Seconds between two requests to the same host (default from configuration)
+            timeout: Per-request timeout in seconds (default from configuration)
+            max_retries: Retries of timeouts, connection errors and transient statuses
+            backoff_base: First backoff ceiling in seconds
+            backoff_max: Maximum backoff ceiling in seconds (also caps Retry-After)
+            headers: Request headers (default: browser-like DEFAULT_HEADERS)
+            transport: Custom httpx transport (e.g. a proxy or mock transport)
+            cache: Conditional-request cache (None: always download)
+        """
+        self.max_concurrency = max_concurrency or config.crawler_max_concurrency
+        self.domain_delay = config.crawler_domain_delay_seconds if domain_delay is None else domain_delay
+        self.timeout = timeout or config.crawler_timeout_seconds
+        self.max_retries = config.crawler_max_retries if max_retries is None else max_retries
+        self.backoff_base = backoff_base or config.crawler_backoff_base_seconds
+        self.backoff_max = backoff_max or config.crawler_backoff_max_seconds
+        self.headers = headers or DEFAULT_HEADERS
+        self.transport = transport
+        self.cache = cache
+        self._client: Optional[httpx.AsyncClient] = None
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._domains: Dict[str, _DomainState] = {}
+
+    async def __aenter__(self) -> "AsyncCrawler":
+        self._client = httpx.AsyncClient(
+            headers=self.headers,
+            timeout=self.timeout,
+            follow_redirects=True,
+            transport=self.transport,
+            limits=httpx.Limits(max_connections=self.max_concurrency),
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self._client.aclose()
+        self._client = None
+
+    def backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Retry-After of the response if given, else full-jitter exponential backoff"""
+        retry_after = response.headers.get("retry-after") if response is not None else None
+        if retry_after and retry_after.isdigit():
+            return min(self.backoff_max, float(retry_after))
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def _request(self, url: str, headers: Optional[Dict[str, str]]) -> httpx.Response:
+        # One request at a time per host, at least domain_delay apart; the global
+        # slot is taken only once it is this host's turn
+        domain = self._domains.setdefault(urlparse(url).netloc, _DomainState())
+        async with domain.lock:
+            wait = domain.last_request + self.domain_delay - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                async with self._semaphore:
+                    return await self._client.get(url, headers=headers)
+            finally:
+                domain.last_request = time.monotonic()
+
+    async def _fetch_with_retries(self, url: str, headers: Optional[Dict[str, str]]) -> FetchResult:
+        result = FetchResult(url=url)
+        for attempt in range(self.max_retries + 1):
+            result.attempts = attempt + 1
+            response = None
+            try:
+                response = await self._request(url, headers)
+                retryable = response.status_code in RETRY_STATUS_CODES
+                result.status_code = response.status_code
+                result.content = response.content
+                result.headers = dict(response.headers)
+                result.encoding = response.encoding
+                result.error = f"HTTP {response.status_code}" if response.status_code >= 400 else None
+            except httpx.HTTPError as e:
+                retryable = isinstance(e, (httpx.TimeoutException, httpx.TransportError))
+                result.error = f"{type(e).__name__}: {e}"
+            if not retryable or attempt == self.max_retries:
+                break
+            delay = self.backoff(attempt, response)
+            logger.warning(f"{url}: {result.error}; retry {attempt + 1}/{self.max_retries} in {delay:.1f}s")
+            await asyncio.sleep(delay)
+        return result
+
+    def _cached_body(self, url: str) -> Optional[bytes]:
+        try:
+            return self.cache.body(url) if self.cache.lookup(url) else None
+        except OSError:
+            # Removed between the lookup and the read
+            return None
+
+    async def fetch(self, url: str, headers: Optional[Dict[str, str]] = None) -> FetchResult:
+        """
+        Fetch one URL, retrying transient failures
+
+        Args:
+            url: URL to fetch
+            headers: Extra request headers
+
+        Returns:
+            FetchResult; errors are reported in FetchResult.error rather than raised
+        """
+        if self._client is None:
+            raise RuntimeError("AsyncCrawler must be used as 'async with AsyncCrawler() as crawler'")
+        started = time.monotonic()
+        validators = self.cache.conditional_headers(url) if self.cache is not None else {}
+        result = await self._fetch_with_retries(url, {**validators, **(headers or {})})
+        if self.cache is not None and result.error is None and result.status_code == 304:
+            body = self._cached_body(url)
+            if body is not None:
+                result.content = body
+                result.changed = False
+                result.from_cache = True
+            elif validators:
+                # The entry went away after its validators were sent: fetch the full page
+                logger.warning(f"{url}: not modified, but the cached body is gone; refetching")
+                result = await self._fetch_with_retries(url, headers)
+        if result.status_code == 304 and not result.from_cache:
+            result.error = "HTTP 304 without a cached body"
+        if self.cache is not None and result.error is None and result.status_code == 200:
+            result.changed = self.cache.store(url, result.content, result.headers)
+        result.elapsed = time.monotonic() - started
+        if result.error:
+            logger.error(f"Error fetching {url}: {result.error}")
+        elif result.from_cache:
+            logger.info(f"Not modified: {url} ({result.elapsed:.1f}s)")
+        else:
+            logger.info(f"Fetched {url} ({result.status_code}, {len(result.content)} bytes, {result.elapsed:.1f}s)")
+        return result
+
+    async def fetch_all(self, urls: Iterable[str]) -> Dict[str, FetchResult]:
+        """
+        Fetch URLs concurrently (hosts in parallel, politely within a host)
+
+        Args:
+            urls: URLs to fetch
+
+        Returns:
+            Dictionary URL -> FetchResult, in input order
+        """
+        urls = list(dict.fromkeys(urls))
+        results = await asyncio.gather(*(self.fetch(url) for url in urls))
+        return dict(zip(urls, results))
@@ -0,0 +1,505 @@
+#!/usr/bin/env python3
+"""
+Config-driven scraping engine for country profiles
+Each country is described by a JSON file in src/crawlers/sources/ (its name,
+ISO code, resources/ file and source URLs). Every country goes through the same
+pipeline - fetch → clean → extract → merge - and all selected countries run
+concurrently on one AsyncCrawler, so they share its connection pool, HTTP cache
+and per-domain politeness (e.g. Wikipedia is never hit in parallel). World Bank
+indicator series for all of them are then refreshed with one bulk query.
+
+Usage:
+    python -m src.crawlers.engine --countries all
+    python -m src.crawlers.engine --countries germany,france --force
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+from urllib.parse import urlparse
+
+from pydantic import BaseModel, Field
+from pydantic_ai import Agent
+from pydantic_ai.models.google import GoogleModel, GoogleModelSettings
+from pydantic_ai.providers.google import GoogleProvider
+
+from src.agents.prompt_cache import estimate_tokens
+from src.configuration import Configuration
+from src.crawlers.async_crawler import AsyncCrawler, FetchResult
+from src.crawlers.extraction import extract_blocks, fit_to_budget, remove_boilerplate
+from src.crawlers.http_cache import HttpCache
+from src.crawlers.worldbank import WorldBankError, refresh_indicators
+from src.llm import Priority, fake_model, get_gateway, use_fake_provider
+
+logger = logging.getLogger(__name__)
+
+config = Configuration()
+
+SOURCES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sources")
+NOT_FOUND = "NOT_FOUND"
+# Profile fields written to resources/*.json (no sources, no metadata)
+PROFILE_FIELDS = [
+    "country_name",
+    "geographical_features",
+    "population",
+    "climate",
+    "economic_strengths",
+    "army_size",
+    "digitalization_level",
+    "currency",
+    "key_bilateral_relations",
+    "political_economic_threats",
+    "military_threats",
+    "development_milestones",
+]
+
+SYSTEM_PROMPT = """
+You are an expert data analyst specialized in extracting structured information about countries from government websites.
+
+Your task is to analyze scraped content from official and reference websites of one country and extract accurate, factual information.
+
+IMPORTANT RULES:
+1. Extract ONLY factual information present in the provided content
+2. If information is not available or unclear, use exactly this phrase: "NOT_FOUND"
+3. Be concise but comprehensive
+4. For lists (like key_bilateral_relations), extract all mentioned countries
+5. Focus on recent/current information (2023-2025)
+6. Use official numbers and data when available
+7. Synthesize information from multiple sources if provided
+
+CRITICAL: Use "NOT_FOUND" (exactly this string) for any field where you cannot find reliable information in the scraped content.
+This allows the system to preserve existing data instead of overwriting with guesses.
+
+OUTPUT FORMAT:
+All fields must be filled. If you cannot find information, use "NOT_FOUND" as the value.
+"""
+
+
+class SourceConfig(BaseModel):
+    """One page scraped for a country"""
+
+    url: str
+    name: str = ""
+
+
+class CountryConfig(BaseModel):
+    """Scraping configuration of one country (src/crawlers/sources/<key>.json)"""
+
+    key: str = ""
+    country_name: str
+    country_code: Optional[str] = Field(default=None, description="ISO 3166-1 alpha-3 code")
+    resource_file: str
+    sources: List[SourceConfig] = Field(default_factory=list)
+    notes: str = ""
+
+
+class CountryData(BaseModel):
+    """Structured country data model"""
+    country_name: str = Field(description="Country name")
+    geographical_features: str = Field(description="Geographical location and features")
+    population: str = Field(description="Current population estimate")
+    climate: str = Field(description="Climate description")
+    economic_strengths: str = Field(description="Key economic sectors and strengths")
+    army_size: str = Field(description="Military personnel size")
+    digitalization_level: str = Field(description="Level of digitalization and tech adoption")
+    currency: str = Field(description="Official currency")
+    key_bilateral_relations: List[str] = Field(description="List of key partner countries")
+    political_economic_threats: str = Field(description="Current political and economic challenges")
+    military_threats: str = Field(description="Security and military threats")
+    development_milestones: str = Field(description="Recent and planned development achievements")
+
+
+@dataclass
+class CountryResult:
+    """Outcome of one country's pipeline run"""
+
+    country: str
+    # updated | unchanged | skipped | failed
+    status: str
+    updated_fields: List[str] = field(default_factory=list)
+    preserved_fields: List[str] = field(default_factory=list)
+    pages: int = 0
+    failed_pages: int = 0
+    error: Optional[str] = None
+
+
+def load_country_configs(directory: str = SOURCES_DIR) -> Dict[str, CountryConfig]:
+    """
+    Load every country configuration from a directory
+
+    Args:
+        directory: Directory with one <key>.json file per country
+
+    Returns:
+        Dictionary key -> CountryConfig, sorted by key
+    """
+    configs = {}
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith(".json"):
+            continue
+        key = filename[:-len(".json")]
+        with open(os.path.join(directory, filename), "r", encoding="utf-8") as f:
+            configs[key] = CountryConfig(key=key, **json.load(f))
+    return configs
+
+
+def select_countries(configs: Dict[str, CountryConfig], selection: Union[str, List[str]]) -> List[CountryConfig]:
+    """
+    Resolve a country selection ("all", or keys / names, comma-separated)
+
+    Raises:
+        ValueError: Unknown country
+    """
+    if isinstance(selection, str):
+        selection = [item for item in selection.split(",") if item.strip()]
+    names = [item.strip().lower() for item in selection]
+    if names == ["all"]:
+        return list(configs.values())
+    lookup = {}
+    for key, country in configs.items():
+        lookup[key] = country
+        lookup[country.country_name.lower()] = country
+    unknown = [name for name in names if name not in lookup and name.replace(" ", "_") not in lookup]
+    if unknown:
+        raise ValueError(f"Unknown countries: {', '.join(unknown)} (available: {', '.join(configs)})")
+    selected = [lookup.get(name) or lookup[name.replace(" ", "_")] for name in names]
+    return list({country.key: country for country in selected}.values())
+
+
+def merge_country_data(data: CountryData, filepath: str) -> Dict[str, List[str]]:
+    """
+    Merge extracted data into a country's JSON file
+    Only fields that were found are updated; NOT_FOUND fields keep their
+    existing value, and keys outside PROFILE_FIELDS are left untouched.
+
+    Args:
+        data: Extracted data
+        filepath: Country JSON file (created if missing)
+
+    Returns:
+        {"updated": [...], "preserved": [...]} field names
+    """
+    existing_data = {}
+    if Path(filepath).exists():
+        with open(filepath, 'r', encoding='utf-8') as f:
+            existing_data = json.load(f)
+    else:
+        logger.info(f"📝 Creating new file: {filepath}")
+
+    data_dict = data.model_dump()
+    clean_data = existing_data.copy()
+    updated_fields = []
+    preserved_fields = []
+
+    for field_name in PROFILE_FIELDS:
+        new_value = data_dict.get(field_name, "")
+        if isinstance(new_value, list):
+            found = bool(new_value) and NOT_FOUND not in str(new_value)
+        else:
+            found = bool(new_value) and NOT_FOUND not in new_value
+        if found:
+            clean_data[field_name] = new_value
+            if new_value != existing_data.get(field_name):
+                updated_fields.append(field_name)
+        elif field_name in existing_data:
+            preserved_fields.append(field_name)
+        else:
+            clean_data[field_name] = [] if field_name == "key_bilateral_relations" else ""
+
+    # Atomic, so the simulation never loads a half-written profile
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(clean_data, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, filepath)
+    return {"updated": updated_fields, "preserved": preserved_fields}
+
+
+def create_extraction_agent() -> Agent:
+    """LLM agent extracting CountryData from scraped content"""
+    if use_fake_provider():
+        model = fake_model()
+    else:
+        if not config.gemini_api_key:
+            raise ValueError("GEMINI_API_KEY not set in configuration")
+        provider = GoogleProvider(api_key=config.gemini_api_key)
+        settings = GoogleModelSettings(
+            temperature=0.1,  # Low temperature for factual extraction
+            max_tokens=4096,
+        )
+        model = GoogleModel(config.gemini_model_name, provider=provider, settings=settings)
+    return Agent(output_type=CountryData, model=model, system_prompt=SYSTEM_PROMPT)
+
+
+class CountryPipeline:
+    """fetch → clean → extract → merge for one country"""
+
+    def __init__(self, country: CountryConfig, agent: Agent, resources_dir: str = "resources"):
+        """
+        Args:
+            country: Country configuration
+            agent: Extraction agent (shared by all countries)
+            resources_dir: Directory of the country JSON files
+        """
+        self.country = country
+        self.agent = agent
+        self.resource_path = os.path.join(resources_dir, country.resource_file)
+
+    async def fetch(self, crawler: AsyncCrawler) -> Dict[str, FetchResult]:
+        return await crawler.fetch_all(source.url for source in self.country.sources)
+
+    def clean(self, results: Dict[str, FetchResult]) -> Dict[str, List[str]]:
+        """Main-content text blocks of every page that was fetched, without shared boilerplate"""
+        content = {}
+        for url, result in results.items():
+            if not result.ok:
+                continue
+            try:
+                blocks = extract_blocks(result.content)
+            except Exception as e:
+                logger.error(f"Unexpected error parsing {url}: {e}")
+                continue
+            if blocks:
+                content[url] = blocks
+        return {url: blocks for url, blocks in remove_boilerplate(content).items() if blocks}
+
+    def build_prompt(self, content: Dict[str, List[str]], existing_data: Dict) -> str:
+        name = self.country.country_name
+        content_summary = []
+        # Every source gets a share of the budget; unused shares go to the longer pages
+        for url, text in fit_to_budget(content, config.crawler_prompt_max_chars).items():
+            domain = urlparse(url).netloc
+            content_summary.append(f"\n--- SOURCE: {domain} ({url}) ---\n{text}\n")
+        combined_content = "\n".join(content_summary)
+        existing_data_str = json.dumps(existing_data, indent=2) if existing_data else "No existing data"
+
+        return f"""
+You are updating the existing database entry for {name} with fresh information from official websites.
+
+EXISTING DATA (CURRENT DATABASE):
+{existing_data_str}
+
+NEW SCRAPED CONTENT:
+{combined_content}
+
+TASK:
+Review the NEW SCRAPED CONTENT and update ONLY the fields where you found NEW, RELIABLE information.
+
+For each field:
+1. **geographical_features**: Location, borders, terrain
+2. **population**: Current population estimate (use latest available data)
+3. **climate**: Climate description
+4. **economic_strengths**: Key industries, economic sectors, GDP info
+5. **army_size**: Size of the armed forces of {name}
+6. **digitalization_level**: Digital transformation, Industry 4.0, tech adoption
+7. **currency**: Official currency
+8. **key_bilateral_relations**: List of key partner countries mentioned
+9. **political_economic_threats**: Current challenges (energy, economy, demographics, etc.)
+10. **military_threats**: Security threats, defense concerns
+11. **development_milestones**: Recent achievements and future plans
+
+CRITICAL RULES:
+- If you found NEW information in the scraped content that updates/improves the existing data → USE THE NEW DATA
+- If the scraped content has NO information about a field → Return exactly "NOT_FOUND" for that field
+- If the existing data is already good and scraped content has nothing new → Return "NOT_FOUND" to preserve existing
+- DO NOT guess or infer
+- DO NOT copy existing data - let the system preserve it automatically
+- Focus on RECENT information (2024-2025) when available
+- Use official statistics and numbers
+
+EXAMPLES:
+- Existing army_size: "183,000" | Scraped: mentions "185,000 active personnel" → UPDATE to "185,000"
+- Existing population: "84,000,000" | Scraped: no population mentioned → Return "NOT_FOUND" (preserve existing)
+- Existing climate: "good data" | Scraped: no climate info → Return "NOT_FOUND"
+
+Remember: "NOT_FOUND" tells the system to KEEP the existing value. Only provide new data when you actually found something useful!
+"""
+
+    async def extract(self, content: Dict[str, List[str]]) -> CountryData:
+        """Structured data from the cleaned pages (one LLM call through the gateway)"""
+        existing_data = {}
+        if Path(self.resource_path).exists():
+            with open(self.resource_path, 'r', encoding='utf-8') as f:
+                existing_data = json.load(f)
+        prompt = self.build_prompt(content, {k: v for k, v in existing_data.items() if k in PROFILE_FIELDS})
+        # Shared rate limits with the simulation and the API; retried on 429
+        result = await get_gateway().call(
+            lambda: self.agent.run(prompt),
+            model=config.gemini_model_name,
+            estimated_tokens=estimate_tokens(prompt),
+            priority=Priority.BATCH,
+        )
+        data = result.output
+        data.country_name = self.country.country_name
+        return data
+
+    def merge(self, data: CountryData) -> Dict[str, List[str]]:
+        return merge_country_data(data, self.resource_path)
+
+    async def run(self, crawler: AsyncCrawler, force: bool = False) -> CountryResult:
+        """
+        Run the whole pipeline
+
+        Args:
+            crawler: Shared crawler
+            force: Extract even if no source changed since the previous run
+
+        Returns:
+            CountryResult
+        """
+        name = self.country.country_name
+        if not self.country.sources:
+            logger.info(f"[{name}] No sources configured - skipping")
+            return CountryResult(country=name, status="skipped")
+
+        results = await self.fetch(crawler)
+        failed = sum(1 for result in results.values() if not result.ok)
+        content = self.clean(results)
+        outcome = CountryResult(country=name, status="unchanged", pages=len(content), failed_pages=failed)
+        if not content:
+            outcome.status = "failed"
+            if failed == len(results):
+                outcome.error = "no source could be fetched"
+            else:
+                outcome.error = f"no content left after cleaning {len(results) - failed} fetched pages"
+            return outcome
+
+        # Compared with the content of the last *successful* extraction, so a
+        # failed LLM call is retried on the next run even if the pages are cached
+        cache = crawler.cache
+        content_hash = hashlib.sha256(json.dumps(content, sort_keys=True).encode("utf-8")).hexdigest()
+        if (
+            not force
+            and cache is not None
+            and Path(self.resource_path).exists()
+            and cache.extracted_hash(self.country.key) == content_hash
+        ):
+            logger.info(f"[{name}] Content unchanged since the last extraction - skipping LLM extraction")
+            return outcome
+
+        data = await self.extract(content)
+        fields = self.merge(data)
+        if cache is not None:
+            cache.record_extraction(self.country.key, content_hash)
+        outcome.status = "updated" if fields["updated"] else "unchanged"
+        outcome.updated_fields = fields["updated"]
+        outcome.preserved_fields = fields["preserved"]
+        logger.info(
+            f"[{name}] ✅ {self.resource_path}: {len(fields['updated'])} fields updated, "
+            f"{len(fields['preserved'])} preserved"
+        )
+        return outcome
+
+
+class ScrapingEngine:
+    """Runs the pipelines of several countries concurrently on one crawler"""
+
+    def __init__(
+        self,
+        countries: List[CountryConfig],
+        resources_dir: str = "resources",
+        force: bool = False,
+        crawler: Optional[AsyncCrawler] = None,
+        indicators: bool = True,
+    ):
+        """
+        Args:
+            countries: Countries to scrape
+            resources_dir: Directory of the country JSON files
+            force: Extract even if no source changed since the previous run
+            crawler: Crawler to use (default: configured AsyncCrawler with the HTTP cache)
+            indicators: Also refresh the World Bank indicator series of the countries
+        """
+        self.countries = countries
+        self.resources_dir = resources_dir
+        self.force = force
+        self.indicators = indicators
+        self.crawler = crawler or AsyncCrawler(cache=HttpCache() if config.crawler_cache_enabled else None)
+        self._agent: Optional[Agent] = None
+
+    @property
+    def agent(self) -> Agent:
+        if self._agent is None:
+            self._agent = create_extraction_agent()
+        return self._agent
+
+    async def _run_country(self, pipeline: CountryPipeline) -> CountryResult:
+        try:
+            return await pipeline.run(self.crawler, force=self.force)
+        except Exception as e:
+            logger.error(f"[{pipeline.country.country_name}] Scraping failed: {e}")
+            return CountryResult(country=pipeline.country.country_name, status="failed", error=str(e))
+
+    async def run(self) -> List[CountryResult]:
+        """
+        Scrape all countries (one failing country does not stop the others)
+
+        Returns:
+            One CountryResult per country, in input order
+        """
+        pipelines = [CountryPipeline(country, self.agent, self.resources_dir) for country in self.countries]
+        started = datetime.now()
+        async with self.crawler:
+            results = await asyncio.gather(*(self._run_country(pipeline) for pipeline in pipelines))
+            if self.indicators:
+                # After the pipelines: both write the countries' resources/ files
+                try:
+                    await refresh_indicators(self.crawler, self.countries, self.resources_dir)
+                except WorldBankError as e:
+                    logger.error(f"World Bank indicators not refreshed: {e}")
+        elapsed = (datetime.now() - started).total_seconds()
+        logger.info("=" * 80)
+        logger.info(f"Scraped {len(results)} countries in {elapsed:.1f}s")
+        for result in results:
+            detail = f": {result.error}" if result.error else ""
+            logger.info(f"  {result.country}: {result.status}{detail}")
+        logger.info("=" * 80)
+        return list(results)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Scrape country profiles into resources/*.json")
+    parser.add_argument("--countries", default="all", help='Comma-separated country keys or names, or "all"')
+    parser.add_argument("--resources-dir", default="resources")
+    parser.add_argument("--sources-dir", default=SOURCES_DIR)
+    parser.add_argument("--skip-indicators", action="store_true", help="Do not refresh World Bank indicators")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        default=os.environ.get("FORCE_UPDATE", "false").lower() == "true",
+        help="Extract even if no source changed since the last run (env FORCE_UPDATE=true)",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=getattr(logging, config.log_level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    countries = select_countries(load_country_configs(args.sources_dir), args.countries)
+    engine = ScrapingEngine(
+        countries,
+        resources_dir=args.resources_dir,
+        force=args.force,
+        indicators=not args.skip_indicators,
+    )
+    results = asyncio.run(engine.run())
+    # Partial success still exits 0, so the workflow commits the countries (and
+    # indicators) that did update; one blocked host must not discard the rest
+    attempted = [result for result in results if result.status != "skipped"]
+    failed = [result.country for result in attempted if result.status == "failed"]
+    if failed and len(failed) == len(attempted):
+        logger.error("Every country failed")
+        return 1
+    if failed:
+        logger.warning(f"{len(failed)}/{len(attempted)} countries failed: {', '.join(failed)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
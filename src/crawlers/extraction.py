@@ -0,0 +1,235 @@
+"""
+Main-content extraction for scraped pages
+Pages are parsed with lxml and the element holding the article text is picked
+readability-style: text blocks score their ancestors by length and commas,
+class/id names such as "content" or "sidebar" adjust the score, and link-heavy
+elements (menus, link lists) are penalised. The winner is turned into compact
+text blocks; blocks repeated across the pages of one run (navigation, cookie
+banners, footers) are dropped, and the remaining text is fitted into the LLM
+prompt budget at block boundaries instead of being cut at a fixed length.
+"""
+import logging
+import re
+from collections import Counter
+from typing import Dict, List, Optional
+
+import lxml.html
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+# Removed before scoring: never article text. <form> itself is kept: ASP.NET
+# and DNN sites wrap the whole page in one, so only its controls go
+STRIP_TAGS = (
+    "script", "style", "noscript", "template", "svg", "canvas", "iframe",
+    "input", "textarea", "button", "select", "nav", "header", "footer", "aside",
+)
+BLOCK_TAGS = {"p", "li", "td", "th", "dd", "dt", "blockquote", "pre", "h1", "h2", "h3", "h4", "h5", "h6"}
+HEADING_TAGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+POSITIVE_NAMES = re.compile(r"article|body|content|entry|main|page|post|story|text|blog", re.I)
+NEGATIVE_NAMES = re.compile(
+    r"banner|breadcrumb|comment|cookie|consent|footer|header|menu|modal|nav|newsletter|"
+    r"popup|promo|related|share|sidebar|skip|social|sponsor|teaser|widget|advert",
+    re.I,
+)
+MIN_BLOCK_CHARS = 25
+# Blocks repeated on several pages are boilerplate only if they are short
+MAX_BOILERPLATE_CHARS = 200
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def _class_weight(element) -> int:
+    weight = 0
+    for name in (element.get("class"), element.get("id")):
+        if not name:
+            continue
+        if NEGATIVE_NAMES.search(name):
+            weight -= 25
+        if POSITIVE_NAMES.search(name):
+            weight += 25
+    return weight
+
+
+def _text_length(element) -> int:
+    # Non-whitespace characters: cheaper than normalising, same ratio for densities
+    text = element.text_content()
+    return len(text) - sum(text.count(c) for c in " \n\t\r")
+
+
+def _link_density(element) -> float:
+    text_length = _text_length(element)
+    if not text_length:
+        return 0.0
+    link_length = sum(_text_length(link) for link in element.iter("a"))
+    return min(1.0, link_length / text_length)
+
+
+def parse_html(html: bytes) -> Optional[etree._Element]:
+    """Parsed document with non-content elements removed (None for empty/unparsable pages)"""
+    if not html or not html.strip():
+        return None
+    try:
+        document = lxml.html.document_fromstring(html)
+    except (etree.ParserError, ValueError) as e:
+        logger.warning(f"Could not parse HTML: {e}")
+        return None
+    etree.strip_elements(document, *STRIP_TAGS, etree.Comment, with_tail=False)
+    for element in list(document.iter()):
+        # Hidden elements and the ARIA landmarks of navigation
+        if not isinstance(element.tag, str) or element.getparent() is None:
+            continue
+        role = element.get("role") or ""
+        if (
+            element.get("hidden") is not None
+            or element.get("aria-hidden") == "true"
+            or role in ("navigation", "banner", "contentinfo", "complementary", "dialog")
+        ):
+            element.drop_tree()
+    return document
+
+
+def find_main_content(document) -> Optional[etree._Element]:
+    """
+    Element most likely holding the main text of the page
+
+    Args:
+        document: Document returned by parse_html()
+
+    Returns:
+        Best scoring element (the body if nothing scores)
+    """
+    scores: Dict[etree._Element, float] = {}
+    for block in document.iter("p", "td", "pre", "li", "blockquote"):
+        text = _normalize(block.text_content())
+        if len(text) < MIN_BLOCK_CHARS:
+            continue
+        score = 1 + text.count(",") + min(len(text) / 100, 3)
+        parent = block.getparent()
+        for ancestor, share in ((parent, 1.0), (parent.getparent() if parent is not None else None, 0.5)):
+            if ancestor is None:
+                continue
+            if ancestor not in scores:
+                scores[ancestor] = _class_weight(ancestor) + (5 if ancestor.tag in ("main", "article") else 0)
+            scores[ancestor] += score * share
+
+    if not scores:
+        return document.find("body") if document.find("body") is not None else document
+    for element in scores:
+        scores[element] *= 1 - _link_density(element)
+    best = max(scores, key=scores.get)
+    best_score = scores[best]
+
+    # Text split over sibling containers (e.g. one <div> per section) belongs together
+    parent = best.getparent()
+    if parent is not None:
+        siblings = [
+            element for element in parent
+            if element is best or scores.get(element, 0) >= max(10, best_score * 0.2)
+        ]
+        if len(siblings) > 1:
+            return parent
+    return best
+
+
+def extract_blocks(html: bytes) -> List[str]:
+    """
+    Compact text blocks (paragraphs, list items, headings) of a page's main content
+
+    Args:
+        html: Raw page content
+
+    Returns:
+        Block texts in document order, without in-page duplicates
+    """
+    document = parse_html(html)
+    if document is None:
+        return []
+    main = find_main_content(document)
+    blocks = []
+    seen = set()
+    for element in main.iter(*BLOCK_TAGS):
+        # Innermost blocks only: an <li> holding a <p> contributes through the <p>
+        if next(element.iterdescendants(*BLOCK_TAGS), None) is not None:
+            continue
+        text = _normalize(element.text_content())
+        is_heading = element.tag in HEADING_TAGS
+        if not text or (len(text) < MIN_BLOCK_CHARS and not is_heading) or text in seen:
+            continue
+        if not is_heading and _link_density(element) > 0.5:
+            continue
+        seen.add(text)
+        blocks.append(text)
+    if not blocks:
+        # Pages without block markup (plain <div> text)
+        text = _normalize(main.text_content())
+        if text:
+            blocks.append(text)
+    # Headings only make sense followed by text
+    while blocks and len(blocks[-1]) < MIN_BLOCK_CHARS:
+        blocks.pop()
+    return blocks
+
+
+def extract_text(html: bytes) -> str:
+    """Main text content of a page, one block per line"""
+    return "\n".join(extract_blocks(html))
+
+
+def remove_boilerplate(pages: Dict[str, List[str]]) -> Dict[str, List[str]]:
+    """
+    Drop short blocks that appear on more than one page (navigation, cookie
+    notices, footers that survived extraction)
+
+    Args:
+        pages: URL -> blocks
+
+    Returns:
+        URL -> remaining blocks
+    """
+    counts = Counter(block for blocks in pages.values() for block in set(blocks))
+    return {
+        url: [block for block in blocks if counts[block] == 1 or len(block) > MAX_BOILERPLATE_CHARS]
+        for url, blocks in pages.items()
+    }
+
+
+def fit_to_budget(pages: Dict[str, List[str]], max_chars: int) -> Dict[str, str]:
+    """
+    Share a character budget between pages, cutting at block boundaries
+    Short pages keep all their text and leave the rest of their share to the others.
+
+    Args:
+        pages: URL -> blocks
+        max_chars: Total characters for all pages
+
+    Returns:
+        URL -> text (pages without text are omitted)
+    """
+    remaining = {url: blocks for url, blocks in pages.items() if blocks}
+    sizes = {url: len("\n".join(blocks)) for url, blocks in remaining.items()}
+    budget = max_chars
+    shares: Dict[str, int] = {}
+    # Smallest first: whatever a small page does not use goes to the larger ones
+    for index, url in enumerate(sorted(remaining, key=sizes.get)):
+        share = budget // (len(remaining) - index)
+        shares[url] = min(sizes[url], share)
+        budget -= shares[url]
+
+    fitted = {}
+    for url, blocks in remaining.items():
+        kept, length = [], 0
+        for block in blocks:
+            extra = len(block) + (1 if kept else 0)
+            if length + extra > shares[url]:
+                break
+            kept.append(block)
+            length += extra
+        if not kept and shares[url] >= MIN_BLOCK_CHARS:
+            # One huge block: cut it at a word boundary
+            kept = [blocks[0][:shares[url]].rsplit(" ", 1)[0] + " …"]
+        if kept:
+            fitted[url] = "\n".join(kept)
+    return fitted
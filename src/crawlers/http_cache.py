@@ -0,0 +1,149 @@
+"""
+On-disk HTTP cache shared by the country scrapers
+Response bodies are stored with their ETag / Last-Modified validators, so the
+next run sends conditional requests and the server can answer 304 Not Modified.
+Each entry also records a hash of the body: a page served again with a 200 but
+identical bytes counts as unchanged.
+
+Fetching is not processing: a body is cached as soon as it is downloaded, even
+if the LLM extraction using it fails afterwards. Whether a country's content was
+already extracted is therefore tracked separately - the scrapers record the hash
+of the content they extracted only once the result is merged, and skip the LLM
+call when the next run produces the same hash.
+"""
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Dict, Mapping, Optional, Tuple
+
+import requests
+
+from src.configuration import Configuration
+
+logger = logging.getLogger(__name__)
+
+config = Configuration()
+
+
+@dataclass
+class CacheEntry:
+    """Validators and content hash of one cached URL"""
+
+    url: str
+    content_hash: str
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fetched_at: str = ""
+
+
+class HttpCache:
+    """Conditional-request cache: one metadata JSON plus one body file per URL"""
+
+    def __init__(self, directory: Optional[str] = None):
+        """
+        Args:
+            directory: Cache directory (default from configuration)
+        """
+        self.directory = directory or config.crawler_cache_dir
+
+    def _path(self, url: str, suffix: str) -> str:
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{key}.{suffix}")
+
+    def lookup(self, url: str) -> Optional[CacheEntry]:
+        """Cached entry of a URL (None if missing or its body is gone)"""
+        try:
+            with open(self._path(url, "json"), "r", encoding="utf-8") as f:
+                entry = CacheEntry(**json.load(f))
+        except (OSError, ValueError, TypeError):
+            return None
+        return entry if os.path.exists(self._path(url, "body")) else None
+
+    def body(self, url: str) -> bytes:
+        with open(self._path(url, "body"), "rb") as f:
+            return f.read()
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a cached URL"""
+        entry = self.lookup(url)
+        headers = {}
+        if entry and entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry and entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(self, url: str, content: bytes, headers: Mapping[str, str]) -> bool:
+        """
+        Cache a 200 response
+
+        Args:
+            url: Requested URL
+            content: Response body
+            headers: Response headers (ETag / Last-Modified are kept)
+
+        Returns:
+            True if the body differs from the cached one (or nothing was cached)
+        """
+        content_hash = hashlib.sha256(content).hexdigest()
+        previous = self.lookup(url)
+        headers = {k.lower(): v for k, v in headers.items()}
+        entry = CacheEntry(
+            url=url,
+            content_hash=content_hash,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+            fetched_at=datetime.now().isoformat(),
+        )
+        os.makedirs(self.directory, exist_ok=True)
+        # Body first: an entry whose metadata exists always has a complete body
+        self._write(self._path(url, "body"), content)
+        self._write(self._path(url, "json"), json.dumps(asdict(entry), indent=2).encode("utf-8"))
+        return previous is None or previous.content_hash != content_hash
+
+    def extracted_hash(self, key: str) -> Optional[str]:
+        """Content hash recorded by the last successful extraction of key (e.g. a country)"""
+        try:
+            with open(self._path(f"extracted:{key}", "json"), "r", encoding="utf-8") as f:
+                return json.load(f).get("content_hash")
+        except (OSError, ValueError, AttributeError):
+            return None
+
+    def record_extraction(self, key: str, content_hash: str):
+        """Remember that the content with this hash was extracted successfully"""
+        os.makedirs(self.directory, exist_ok=True)
+        record = {"key": key, "content_hash": content_hash, "extracted_at": datetime.now().isoformat()}
+        self._write(self._path(f"extracted:{key}", "json"), json.dumps(record, indent=2).encode("utf-8"))
+
+    @staticmethod
+    def _write(path: str, data: bytes):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def get(self, session: requests.Session, url: str, timeout: float = 10) -> Tuple[bytes, bool]:
+        """
+        Conditional GET with a requests session
+
+        Args:
+            session: Session to send the request with
+            url: URL to fetch
+            timeout: Request timeout in seconds
+
+        Returns:
+            (body, changed): the cached body on 304 Not Modified, and whether
+            it differs from the previous run
+
+        Raises:
+            requests.HTTPError: Error status
+        """
+        response = session.get(url, timeout=timeout, headers=self.conditional_headers(url))
+        if response.status_code == 304 and self.lookup(url):
+            logger.info(f"Not modified: {url}")
+            return self.body(url), False
+        response.raise_for_status()
+        return response.content, self.store(url, response.content, response.headers)
@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+"""
+Bulk World Bank indicator fetcher
+All tracked indicators (src/models/indicators.py) for all countries are pulled
+with multi-country, multi-indicator queries (country/DEU;FRA;.../indicator/A;B;...)
+and paged, so a full refresh is a handful of requests instead of one per
+country and indicator. The parsed series are cached locally and written into
+resources/*.json under the "indicators" key, where the forecaster reads them.
+
+Usage (from the project root):
+    python -m src.crawlers.worldbank --countries all
+    python -m src.crawlers.worldbank --replay src/crawlers/fixtures/worldbank_sample.json \\
+        --countries germany,france --indicators gdp_current_usd,population \\
+        --start-year 2022 --end-year 2023 --per-page 4 --no-cache --dry-run
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime
+from typing import Dict, List, Optional, Sequence
+from urllib.parse import urlencode
+
+import httpx
+
+from src.configuration import Configuration
+from src.crawlers.async_crawler import AsyncCrawler, FetchResult
+from src.crawlers.http_cache import HttpCache
+from src.models.indicators import INDICATOR_KEYS_BY_CODE, INDICATORS
+
+logger = logging.getLogger(__name__)
+
+config = Configuration()
+
+API_URL = "https://api.worldbank.org/v2"
+# World Development Indicators; required for several indicators in one query
+WDI_SOURCE = 2
+# The API accepts up to 60 indicators per query
+MAX_INDICATORS_PER_REQUEST = 60
+SOURCE_NAME = "World Bank WDI"
+
+# {ISO3: {indicator key: {year: value}}}
+Series = Dict[str, Dict[str, Dict[str, float]]]
+
+
+class WorldBankError(RuntimeError):
+    """The API returned an error message or an unexpected payload"""
+
+
+@dataclass
+class IndicatorDataset:
+    """Indicator series of several countries over a range of years"""
+
+    start_year: int
+    end_year: int
+    indicators: List[str]
+    series: Series = field(default_factory=dict)
+    fetched_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+    def covers(self, country_codes: Sequence[str], indicators: Sequence[str], start_year: int, end_year: int) -> bool:
+        return (
+            self.start_year <= start_year
+            and self.end_year >= end_year
+            and set(indicators) <= set(self.indicators)
+            and set(country_codes) <= set(self.series)
+        )
+
+    def for_country(self, country_code: str) -> Dict[str, Dict[str, float]]:
+        return self.series.get(country_code, {})
+
+
+def load_cached_dataset(path: str, max_age_hours: float) -> Optional[IndicatorDataset]:
+    """Locally cached dataset, or None if missing, unreadable or older than max_age_hours"""
+    try:
+        if time.time() - os.path.getmtime(path) > max_age_hours * 3600:
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return IndicatorDataset(**json.load(f))
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+def save_dataset(dataset: IndicatorDataset, path: str):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(asdict(dataset), f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+
+
+class WorldBankClient:
+    """Multi-country, multi-indicator, paged queries on a shared AsyncCrawler"""
+
+    def __init__(self, crawler: AsyncCrawler, base_url: str = API_URL, per_page: Optional[int] = None):
+        """
+        Args:
+            crawler: Crawler to send the requests with (already entered)
+            base_url: API root
+            per_page: Rows per page (default from configuration)
+        """
+        self.crawler = crawler
+        self.base_url = base_url.rstrip("/")
+        self.per_page = per_page or config.worldbank_per_page
+
+    def url(self, country_codes: Sequence[str], codes: Sequence[str], start_year: int, end_year: int, page: int) -> str:
+        query = urlencode({
+            "format": "json",
+            "source": WDI_SOURCE,
+            "date": f"{start_year}:{end_year}",
+            "per_page": self.per_page,
+            "page": page,
+        })
+        return f"{self.base_url}/country/{';'.join(country_codes)}/indicator/{';'.join(codes)}?{query}"
+
+    @staticmethod
+    def _parse(result: FetchResult) -> tuple:
+        if not result.ok:
+            raise WorldBankError(f"{result.url}: {result.error}")
+        try:
+            payload = json.loads(result.content)
+        except ValueError as e:
+            raise WorldBankError(f"{result.url}: invalid JSON ({e})") from None
+        if not isinstance(payload, list) or not payload or not isinstance(payload[0], dict):
+            raise WorldBankError(f"{result.url}: unexpected payload")
+        if "message" in payload[0]:
+            raise WorldBankError(f"{result.url}: {payload[0]['message']}")
+        return payload[0], (payload[1] if len(payload) > 1 and payload[1] else [])
+
+    async def _query(self, country_codes: Sequence[str], codes: Sequence[str], start_year: int, end_year: int) -> List[Dict]:
+        first = await self.crawler.fetch(self.url(country_codes, codes, start_year, end_year, 1))
+        meta, rows = self._parse(first)
+        pages = int(meta.get("pages") or 1)
+        if pages > 1:
+            urls = [self.url(country_codes, codes, start_year, end_year, page) for page in range(2, pages + 1)]
+            results = await self.crawler.fetch_all(urls)
+            for result in results.values():
+                rows += self._parse(result)[1]
+        logger.info(f"World Bank: {len(rows)} rows for {len(codes)} indicators in {pages} pages")
+        return rows
+
+    async def fetch(
+        self,
+        country_codes: Sequence[str],
+        indicators: Optional[Sequence[str]] = None,
+        start_year: Optional[int] = None,
+        end_year: Optional[int] = None,
+    ) -> IndicatorDataset:
+        """
+        Fetch indicator series for several countries
+
+        Args:
+            country_codes: ISO 3166-1 alpha-3 codes
+            indicators: Keys of INDICATORS (default: all)
+            start_year: First year (default from configuration)
+            end_year: Last year (default: last year)
+
+        Returns:
+            IndicatorDataset (years without a value are omitted)
+
+        Raises:
+            WorldBankError: API error
+        """
+        indicators = list(indicators or INDICATORS)
+        start_year = start_year or config.worldbank_start_year
+        end_year = end_year or date.today().year - 1
+        codes = [INDICATORS[key].code for key in indicators]
+        chunks = [codes[i:i + MAX_INDICATORS_PER_REQUEST] for i in range(0, len(codes), MAX_INDICATORS_PER_REQUEST)]
+        batches = await asyncio.gather(*(self._query(country_codes, chunk, start_year, end_year) for chunk in chunks))
+
+        series: Series = {code: {} for code in country_codes}
+        for rows in batches:
+            for row in rows:
+                key = INDICATOR_KEYS_BY_CODE.get((row.get("indicator") or {}).get("id"))
+                country = row.get("countryiso3code")
+                if key is None or country not in series or row.get("value") is None:
+                    continue
+                series[country].setdefault(key, {})[str(row["date"])] = row["value"]
+        for values in series.values():
+            for key in values:
+                values[key] = dict(sorted(values[key].items()))
+        return IndicatorDataset(start_year=start_year, end_year=end_year, indicators=indicators, series=series)
+
+
+async def fetch_indicators(
+    crawler: AsyncCrawler,
+    country_codes: Sequence[str],
+    indicators: Optional[Sequence[str]] = None,
+    start_year: Optional[int] = None,
+    end_year: Optional[int] = None,
+    per_page: Optional[int] = None,
+    cache_path: Optional[str] = None,
+) -> IndicatorDataset:
+    """
+    Indicator series from the local cache if it is fresh and covers the
+    request, otherwise from the API (and cached)
+
+    Args:
+        crawler: Crawler to send the requests with (already entered)
+        country_codes: ISO 3166-1 alpha-3 codes
+        indicators: Keys of INDICATORS (default: all)
+        start_year: First year (default from configuration)
+        end_year: Last year (default: last year)
+        per_page: Rows per page (default from configuration)
+        cache_path: Dataset cache file ("" disables the cache; default from configuration)
+
+    Returns:
+        IndicatorDataset
+    """
+    indicators = list(indicators or INDICATORS)
+    start_year = start_year or config.worldbank_start_year
+    end_year = end_year or date.today().year - 1
+    cache_path = config.worldbank_cache_path if cache_path is None else cache_path
+    if cache_path:
+        cached = load_cached_dataset(cache_path, config.worldbank_cache_ttl_hours)
+        if cached and cached.covers(country_codes, indicators, start_year, end_year):
+            logger.info(f"World Bank: using cached indicators from {cache_path} ({cached.fetched_at})")
+            return cached
+
+    client = WorldBankClient(crawler, per_page=per_page)
+    dataset = await client.fetch(country_codes, indicators, start_year, end_year)
+    if cache_path:
+        save_dataset(dataset, cache_path)
+    return dataset
+
+
+def enrich_profile(filepath: str, series: Dict[str, Dict[str, float]]) -> bool:
+    """
+    Write a country's series into its resources/*.json file ("indicators" key)
+
+    Args:
+        filepath: Country JSON file
+        series: {indicator key: {year: value}} of the country
+
+    Returns:
+        True if the file changed
+    """
+    with open(filepath, "r", encoding="utf-8") as f:
+        profile = json.load(f)
+    previous = profile.get("indicators") or {}
+    # Keep series of indicators not fetched this time
+    merged = {**(previous.get("series") or {}), **series}
+    if merged == previous.get("series"):
+        return False
+    profile["indicators"] = {
+        "source": SOURCE_NAME,
+        "updated": date.today().isoformat(),
+        "series": merged,
+    }
+    tmp_path = f"{filepath}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(profile, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, filepath)
+    return True
+
+
+def enrich_resources(dataset: IndicatorDataset, countries, resources_dir: str = "resources") -> List[str]:
+    """
+    Write the dataset into the resources/ files of the given countries
+
+    Args:
+        dataset: Fetched indicators
+        countries: CountryConfig objects (those without a country_code are skipped)
+        resources_dir: Directory of the country JSON files
+
+    Returns:
+        Paths of the files that changed
+    """
+    changed = []
+    for country in countries:
+        series = dataset.for_country(country.country_code) if country.country_code else {}
+        path = os.path.join(resources_dir, country.resource_file)
+        if not series or not os.path.exists(path):
+            continue
+        if enrich_profile(path, series):
+            changed.append(path)
+    logger.info(f"World Bank indicators: {len(changed)} profiles updated")
+    return changed
+
+
+async def refresh_indicators(
+    crawler: AsyncCrawler,
+    countries,
+    resources_dir: str = "resources",
+    **fetch_kwargs,
+) -> List[str]:
+    """
+    Fetch indicators for the countries (one bulk query) and enrich their profiles
+
+    Args:
+        crawler: Crawler to send the requests with (already entered)
+        countries: CountryConfig objects
+        resources_dir: Directory of the country JSON files
+        **fetch_kwargs: Passed to fetch_indicators()
+
+    Returns:
+        Paths of the files that changed
+    """
+    codes = [country.country_code for country in countries if country.country_code]
+    if not codes:
+        return []
+    dataset = await fetch_indicators(crawler, codes, **fetch_kwargs)
+    return enrich_resources(dataset, countries, resources_dir)
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """
+    Serves responses recorded with RecordingTransport (offline runs and tests)
+    Requests that were not recorded get a 404.
+    """
+
+    def __init__(self, path: str):
+        with open(path, "r", encoding="utf-8") as f:
+            self.responses = json.load(f)["responses"]
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = self.responses.get(str(request.url))
+        if body is None:
+            return httpx.Response(404, json=[{"message": [{"key": "Not recorded", "value": str(request.url)}]}])
+        return httpx.Response(200, json=body)
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Sends requests over the network and records the JSON responses to a fixture file"""
+
+    def __init__(self, path: str, transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.path = path
+        self.transport = transport or httpx.AsyncHTTPTransport()
+        self.responses: Dict[str, object] = {}
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self.transport.handle_async_request(request)
+        await response.aread()
+        if response.status_code == 200:
+            self.responses[str(request.url)] = json.loads(response.content)
+        return response
+
+    async def aclose(self):
+        await self.transport.aclose()
+        with open(self.path, "w", encoding="utf-8") as f:
+            json.dump({"recorded_at": datetime.now().isoformat(), "responses": self.responses}, f, indent=2)
+        logger.info(f"Recorded {len(self.responses)} responses to {self.path}")
+
+
+def main() -> int:
+    from src.crawlers.engine import SOURCES_DIR, load_country_configs, select_countries
+
+    parser = argparse.ArgumentParser(description="Fetch World Bank indicators into resources/*.json")
+    parser.add_argument("--countries", default="all", help='Comma-separated country keys or names, or "all"')
+    parser.add_argument("--indicators", default="", help=f"Comma-separated keys (default: all of {', '.join(INDICATORS)})")
+    parser.add_argument("--start-year", type=int, default=None)
+    parser.add_argument("--end-year", type=int, default=None)
+    parser.add_argument("--per-page", type=int, default=None)
+    parser.add_argument("--resources-dir", default="resources")
+    parser.add_argument("--sources-dir", default=SOURCES_DIR)
+    parser.add_argument("--no-cache", action="store_true", help="Ignore the local indicator cache")
+    parser.add_argument("--dry-run", action="store_true", help="Print the series instead of writing resources/")
+    parser.add_argument("--replay", help="Serve API responses from a recorded fixture file")
+    parser.add_argument("--record", help="Record API responses to a fixture file")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=getattr(logging, config.log_level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    countries = select_countries(load_country_configs(args.sources_dir), args.countries)
+    indicators = [key.strip() for key in args.indicators.split(",") if key.strip()] or None
+    unknown = [key for key in indicators or [] if key not in INDICATORS]
+    if unknown:
+        parser.error(f"Unknown indicators: {', '.join(unknown)}")
+
+    transport = None
+    if args.replay:
+        transport = ReplayTransport(args.replay)
+    elif args.record:
+        transport = RecordingTransport(args.record)
+    fetch_kwargs = dict(
+        indicators=indicators,
+        start_year=args.start_year,
+        end_year=args.end_year,
+        per_page=args.per_page,
+        cache_path="" if args.no_cache or args.replay else None,
+    )
+
+    async def run():
+        # The HTTP cache is bypassed for fixtures, so replays never pollute it
+        cache = HttpCache() if config.crawler_cache_enabled and not (args.replay or args.record) else None
+        async with AsyncCrawler(transport=transport, cache=cache) as crawler:
+            if args.dry_run:
+                codes = [country.country_code for country in countries if country.country_code]
+                dataset = await fetch_indicators(crawler, codes, **fetch_kwargs)
+                print(json.dumps(dataset.series, indent=2))
+                return
+            await refresh_indicators(crawler, countries, args.resources_dir, **fetch_kwargs)
+
+    try:
+        asyncio.run(run())
+    except WorldBankError as e:
+        logger.error(f"World Bank fetch failed: {e}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -39,6 +39,7 @@ class DatabaseConfig:
         self.database = config.db.postgres_db
         self.user = config.db.postgres_user
         self.password = config.db.postgres_password
+        self._pool = None
 
     def get_connection(self):
         """Get a synchronous database connection."""
@@ -51,14 +52,64 @@ class DatabaseConfig:
         )
 
     def get_pool(self):
-        """Get a synchronous connection pool."""
-        # For simple synchronous usage, just return a connection
-        # For more advanced pooling, could use psycopg2.pool
-        return pool.SimpleConnectionPool(
-            minconn=1,
-            maxconn=10,
-            dsn=f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}",
-        )
+        """Get the shared synchronous connection pool (created on first use)."""
+        if self._pool is None or self._pool.closed:
+            self._pool = pool.ThreadedConnectionPool(
+                minconn=1,
+                maxconn=10,
+                dsn=f"postgresql://{self.user}:{self.password}@{self.host}:{self.port}/{self.database}",
+            )
+        return self._pool
+
+    def ping(self, timeout_seconds: float = 2.0) -> bool:
+        """
+        Run a cheap `SELECT 1` on a pooled connection.
+
+        Args:
+            timeout_seconds: Connect and statement timeout
+
+        Returns:
+            bool: True if the database answered
+        """
+        timeout_ms = int(timeout_seconds * 1000)
+        if self._pool is None or self._pool.closed:
+            # Probe without creating the pool so a down database fails fast
+            conn = psycopg2.connect(
+                host=self.host,
+                port=self.port,
+                user=self.user,
+                password=self.password,
+                dbname=self.database,
+                connect_timeout=max(1, int(timeout_seconds)),
+                options=f"-c statement_timeout={timeout_ms}",
+            )
+            try:
+                with conn.cursor() as cursor:
+                    cursor.execute("SELECT 1")
+                    return cursor.fetchone()[0] == 1
+            finally:
+                conn.close()
+
+        conn = self._pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute(f"SET LOCAL statement_timeout = {timeout_ms}")
+                cursor.execute("SELECT 1")
+                return cursor.fetchone()[0] == 1
+        finally:
+            if not conn.closed:
+                conn.rollback()
+            self._pool.putconn(conn, close=bool(conn.closed))
+
+    def pool_stats(self) -> dict:
+        """Get pool usage without creating the pool (zeros if it does not exist)."""
+        if self._pool is None or self._pool.closed:
+            return {"used": 0, "idle": 0, "max": 0}
+        return {
+            "used": len(self._pool._used),
+            "idle": len(self._pool._pool),
+            "max": self._pool.maxconn,
+        }
 
     def get_sessionmaker(self):
         """
@@ -2,10 +2,12 @@ from .base import Base
 from .embeddings import Embedding
 from .instructions import Instruction
 from .country_data import CountryData
+from .response_cache import ResponseCacheEntry
 
 __all__ = [
     "Base",
     "Embedding",
     "Instruction",
     "CountryData",
+    "ResponseCacheEntry",
 ]
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Text, TIMESTAMP, func
+from sqlalchemy.dialects.postgresql import JSONB
+
+from .base import Base
+
+
+class ResponseCacheEntry(Base):
+    """SQLAlchemy model for response_cache table."""
+
+    __tablename__ = "response_cache"
+
+    key = Column(Text, primary_key=True)
+    payload = Column(JSONB, nullable=False)
+    expires_at = Column(TIMESTAMP(timezone=True), nullable=False, index=True)
+    created_at = Column(
+        TIMESTAMP(timezone=True), server_default=func.now(), nullable=True
+    )
+
+    def __repr__(self):
+        return f"<ResponseCacheEntry(key='{self.key[:12]}...', expires_at={self.expires_at})>"
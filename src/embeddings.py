@@ -4,6 +4,7 @@ Moduł do generowania embeddingów i zapisu do PostgreSQL z pgvector.
 
 import asyncio
 import asyncpg
+from functools import lru_cache
 from typing import List, Dict
 from pathlib import Path
 from sentence_transformers import SentenceTransformer
@@ -11,10 +12,32 @@ import numpy as np
 from tqdm import tqdm
 from src.db.db_config import db_config
 from src.db.hack.embeddings import Embedding
+from src.metrics import set_model_state
 from src.pdf_processor import PDFProcessor
 from psycopg2 import extras
 
 
+@lru_cache(maxsize=None)
+def load_sentence_model(model_name: str) -> SentenceTransformer:
+    """
+    Ładuje model sentence-transformers raz na proces i publikuje jego stan.
+
+    Args:
+        model_name: Nazwa modelu sentence-transformers
+
+    Returns:
+        Załadowany (współdzielony) model
+    """
+    set_model_state(model_name, "loading")
+    try:
+        model = SentenceTransformer(model_name)
+    except Exception:
+        set_model_state(model_name, "failed")
+        raise
+    set_model_state(model_name, "ready")
+    return model
+
+
 class EmbeddingGenerator:
     """
     Klasa do generowania embeddingów używając sentence-transformers.
@@ -27,7 +50,7 @@ class EmbeddingGenerator:
         Args:
             model_name: Nazwa modelu sentence-transformers (384 wymiary)
         """
-        self.model = SentenceTransformer(model_name)
+        self.model = load_sentence_model(model_name)
 
     def generate_embedding(self, text: str) -> np.ndarray:
         """
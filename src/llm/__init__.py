@@ -0,0 +1,14 @@
+from .fake import fake_model, use_fake_provider
+from .gateway import LLMGateway, ModelLimits, Priority, classify_error, get_gateway
+from .token_bucket import TokenBucket
+
+__all__ = [
+    "LLMGateway",
+    "ModelLimits",
+    "Priority",
+    "TokenBucket",
+    "classify_error",
+    "fake_model",
+    "get_gateway",
+    "use_fake_provider",
+]
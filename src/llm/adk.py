@@ -0,0 +1,40 @@
+"""
+Google ADK integration of the LLM gateway.
+
+ADK agents call Gemini themselves, so the gateway cannot wrap the call; the
+``before_model_callback`` below makes each model request wait for admission
+under the shared rate limits instead.
+"""
+
+from src.llm.gateway import Priority, get_gateway
+from src.agents.prompt_cache import estimate_tokens
+
+
+def _request_text(llm_request) -> str:
+    texts = []
+    for content in getattr(llm_request, "contents", None) or []:
+        for part in getattr(content, "parts", None) or []:
+            text = getattr(part, "text", None)
+            if text:
+                texts.append(text)
+    return "".join(texts)
+
+
+def interactive_rate_limit(model: str):
+    """
+    Build an ADK ``before_model_callback`` admitting requests as INTERACTIVE
+
+    Args:
+        model: Default model name (used when the request does not name one)
+    """
+
+    async def before_model_callback(callback_context, llm_request):
+        await get_gateway().acquire(
+            getattr(llm_request, "model", None) or model,
+            estimated_tokens=estimate_tokens(_request_text(llm_request)),
+            priority=Priority.INTERACTIVE,
+        )
+        # None lets ADK send the request as usual
+        return None
+
+    return before_model_callback
@@ -0,0 +1,25 @@
+"""
+Local stand-in for Gemini, selected with ``LLM_PROVIDER=fake``.
+
+Returns schema-valid placeholder outputs without network access or an API key,
+so simulations, sweeps and the scrapers can be exercised locally and in tests.
+"""
+
+from pydantic_ai.models import Model
+from pydantic_ai.models.test import TestModel
+
+from src.configuration import Configuration
+
+config = Configuration()
+
+FAKE_PROVIDER = "fake"
+
+
+def use_fake_provider() -> bool:
+    """True when the configuration selects the fake provider."""
+    return config.llm_provider.lower() == FAKE_PROVIDER
+
+
+def fake_model(seed: int = 0) -> Model:
+    """Deterministic pydantic-ai model producing valid structured output."""
+    return TestModel(seed=seed)
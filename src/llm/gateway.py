@@ -0,0 +1,295 @@
+"""
+Shared LLM gateway: client-side rate limiting, priorities and retries.
+
+Every LLM call in the process goes through one gateway so that concurrent
+users (the /prompt endpoint, simulations, scrapers) share the model quotas:
+
+- per-model token buckets for requests per minute (RPM) and tokens per
+  minute (TPM),
+- strict priority between classes (interactive requests are admitted before
+  queued batch work),
+- retries of rate-limit and transient errors with full-jitter exponential
+  backoff; a rate-limit error also halves the model's admitted rate, which
+  then recovers gradually with successful calls.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import re
+import time
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import Awaitable, Callable, Dict, List, Optional, TypeVar
+
+from src.configuration import Configuration
+from src.llm.token_bucket import TokenBucket
+from src.metrics import LLM_CALLS, LLM_QUEUE_WAIT
+
+logger = logging.getLogger(__name__)
+
+config = Configuration()
+
+T = TypeVar("T")
+
+# Status codes worth retrying: rate limit, then transient server errors
+RATE_LIMIT_STATUS = 429
+TRANSIENT_STATUS = {500, 502, 503, 504}
+RATE_LIMIT_MARKERS = ("resource_exhausted", "rate limit", "quota", "too many requests")
+TRANSIENT_MARKERS = ("unavailable", "deadline exceeded", "overloaded", "temporarily")
+RETRY_AFTER_PATTERN = re.compile(r"retry(?:[ _-]?(?:in|after|delay))?\W+(\d+(?:\.\d+)?)\s*s", re.IGNORECASE)
+
+MIN_RATE_FACTOR = 0.1
+RATE_RECOVERY_STEP = 0.05
+
+
+class Priority(IntEnum):
+    """Admission class; lower values are admitted first."""
+
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+@dataclass(frozen=True)
+class ModelLimits:
+    rpm: int
+    tpm: int
+
+
+def classify_error(exc: BaseException) -> Optional[str]:
+    """
+    Classify an LLM error as "rate_limit", "transient" or None (not retryable)
+
+    Works with pydantic-ai ModelHTTPError (status_code), google-genai APIError
+    (code) and plain network errors.
+    """
+    if isinstance(exc, (asyncio.TimeoutError, ConnectionError)):
+        return "transient"
+    status = getattr(exc, "status_code", None) or getattr(exc, "code", None)
+    if status == RATE_LIMIT_STATUS:
+        return "rate_limit"
+    if status in TRANSIENT_STATUS:
+        return "transient"
+    message = str(exc).lower()
+    if any(marker in message for marker in RATE_LIMIT_MARKERS) or "429" in message:
+        return "rate_limit"
+    if any(marker in message for marker in TRANSIENT_MARKERS):
+        return "transient"
+    return None
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Server-suggested delay, if the error carries one (header or message)."""
+    headers = getattr(exc, "headers", None) or {}
+    value = headers.get("retry-after") if hasattr(headers, "get") else None
+    if value:
+        try:
+            return float(value)
+        except ValueError:
+            pass
+    match = RETRY_AFTER_PATTERN.search(str(exc))
+    return float(match.group(1)) if match else None
+
+
+@dataclass(order=True)
+class _Waiter:
+    priority: int
+    sequence: int
+    tokens: int = field(compare=False)
+    future: asyncio.Future = field(compare=False)
+    enqueued: float = field(compare=False, default_factory=time.monotonic)
+
+
+class _ModelLimiter:
+    """RPM and TPM buckets of one model plus its priority queue of waiters."""
+
+    def __init__(self, model: str, limits: ModelLimits):
+        self.model = model
+        self.limits = limits
+        self.requests = TokenBucket(limits.rpm / 60.0, limits.rpm)
+        self.tokens = TokenBucket(limits.tpm / 60.0, limits.tpm)
+        self.rate_factor = 1.0
+        self._queue: List[_Waiter] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+    def _apply_rate_factor(self):
+        self.requests.set_rate(self.limits.rpm / 60.0 * self.rate_factor)
+        self.tokens.set_rate(self.limits.tpm / 60.0 * self.rate_factor)
+
+    def penalize(self):
+        """Multiplicative decrease after a rate-limit error."""
+        self.rate_factor = max(MIN_RATE_FACTOR, self.rate_factor / 2)
+        self._apply_rate_factor()
+        logger.warning(f"Rate limited on {self.model}; admitted rate now {self.rate_factor:.0%} of quota")
+
+    def recover(self):
+        """Additive increase after a successful call."""
+        if self.rate_factor < 1.0:
+            self.rate_factor = min(1.0, self.rate_factor + RATE_RECOVERY_STEP)
+            self._apply_rate_factor()
+
+    async def acquire(self, tokens: int, priority: Priority) -> float:
+        """Wait for admission; returns the time spent queued."""
+        loop = asyncio.get_running_loop()
+        waiter = _Waiter(int(priority), next(self._sequence), tokens, loop.create_future())
+        heapq.heappush(self._queue, waiter)
+        self._dispatch()
+        try:
+            await waiter.future
+        except asyncio.CancelledError:
+            if not waiter.future.done() or waiter.future.cancelled():
+                self._queue = [w for w in self._queue if w is not waiter]
+                heapq.heapify(self._queue)
+                self._dispatch()
+            raise
+        return time.monotonic() - waiter.enqueued
+
+    def _dispatch(self):
+        """Admit waiters in priority order while both buckets allow it."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._queue:
+            head = self._queue[0]
+            if head.future.done():
+                heapq.heappop(self._queue)
+                continue
+            wait = max(self.requests.wait_time(1), self.tokens.wait_time(head.tokens))
+            if wait > 0:
+                # Head-of-line blocking keeps strict priority between classes
+                self._timer = head.future.get_loop().call_later(wait, self._dispatch)
+                return
+            heapq.heappop(self._queue)
+            self.requests.consume(1)
+            self.tokens.consume(head.tokens)
+            head.future.set_result(None)
+
+    def settle(self, estimated: int, actual: int):
+        """Correct the token bucket once the real usage of a call is known."""
+        if actual > estimated:
+            self.tokens.consume(actual - estimated)
+        elif actual < estimated:
+            self.tokens.refund(estimated - actual)
+            self._dispatch()
+
+    def queued(self) -> int:
+        return sum(1 for w in self._queue if not w.future.done())
+
+
+class LLMGateway:
+    """Process-wide admission control and retry policy for LLM calls"""
+
+    def __init__(
+        self,
+        default_limits: Optional[ModelLimits] = None,
+        model_limits: Optional[Dict[str, ModelLimits]] = None,
+        max_retries: Optional[int] = None,
+        backoff_base: Optional[float] = None,
+        backoff_max: Optional[float] = None,
+    ):
+        """
+        Args:
+            default_limits: RPM/TPM for models without explicit limits
+            model_limits: Per-model RPM/TPM overrides
+            max_retries: Retries after the first attempt
+            backoff_base: First backoff ceiling in seconds
+            backoff_max: Maximum backoff ceiling in seconds
+        """
+        self.default_limits = default_limits or ModelLimits(config.llm_rpm, config.llm_tpm)
+        self.model_limits = model_limits if model_limits is not None else {
+            name: ModelLimits(**limits) for name, limits in config.llm_model_limits.items()
+        }
+        self.max_retries = config.llm_max_retries if max_retries is None else max_retries
+        self.backoff_base = backoff_base or config.llm_backoff_base_seconds
+        self.backoff_max = backoff_max or config.llm_backoff_max_seconds
+        self._limiters: Dict[str, _ModelLimiter] = {}
+
+    def limiter(self, model: str) -> _ModelLimiter:
+        limiter = self._limiters.get(model)
+        if limiter is None:
+            limiter = _ModelLimiter(model, self.model_limits.get(model, self.default_limits))
+            self._limiters[model] = limiter
+        return limiter
+
+    async def acquire(self, model: str, estimated_tokens: int = 0, priority: Priority = Priority.BATCH):
+        """
+        Wait until a call to ``model`` may be sent (for callers that cannot be wrapped)
+
+        Args:
+            model: Model name
+            estimated_tokens: Tokens the call is expected to use
+            priority: Admission class
+        """
+        waited = await self.limiter(model).acquire(estimated_tokens, priority)
+        LLM_QUEUE_WAIT.labels(model=model, priority=priority.name.lower()).observe(waited)
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given (0-based) retry."""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2**attempt))
+
+    async def call(
+        self,
+        fn: Callable[[], Awaitable[T]],
+        model: str,
+        estimated_tokens: int = 0,
+        priority: Priority = Priority.BATCH,
+        usage_tokens: Optional[Callable[[T], int]] = None,
+    ) -> T:
+        """
+        Run an LLM call under the model's rate limits, retrying retryable errors
+
+        Args:
+            fn: Coroutine factory performing one call attempt
+            model: Model name (selects the rate limits)
+            estimated_tokens: Expected total tokens, reserved from the TPM bucket
+            priority: Admission class
+            usage_tokens: Extracts the actual token usage from the result
+
+        Returns:
+            The result of ``fn``
+        """
+        limiter = self.limiter(model)
+        label = priority.name.lower()
+        attempt = 0
+        while True:
+            await self.acquire(model, estimated_tokens, priority)
+            try:
+                result = await fn()
+            except Exception as e:
+                kind = classify_error(e)
+                if kind is None or attempt >= self.max_retries:
+                    LLM_CALLS.labels(model=model, priority=label, outcome="error").inc()
+                    raise
+                if kind == "rate_limit":
+                    limiter.penalize()
+                delay = max(self.backoff(attempt), retry_after_seconds(e) or 0.0)
+                LLM_CALLS.labels(model=model, priority=label, outcome=f"retry_{kind}").inc()
+                logger.warning(
+                    f"LLM call to {model} failed ({kind}): {e}; retry {attempt + 1}/{self.max_retries} in {delay:.1f}s"
+                )
+                attempt += 1
+                await asyncio.sleep(delay)
+                continue
+
+            limiter.recover()
+            if usage_tokens is not None:
+                try:
+                    limiter.settle(estimated_tokens, usage_tokens(result))
+                except Exception as e:
+                    logger.debug(f"Could not read token usage for {model}: {e}")
+            LLM_CALLS.labels(model=model, priority=label, outcome="success").inc()
+            return result
+
+
+_gateway: Optional[LLMGateway] = None
+
+
+def get_gateway() -> LLMGateway:
+    """The process-wide gateway (created on first use)."""
+    global _gateway
+    if _gateway is None:
+        _gateway = LLMGateway()
+    return _gateway
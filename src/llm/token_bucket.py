@@ -0,0 +1,69 @@
+"""
+Token bucket used for client-side LLM rate limiting.
+"""
+
+import time
+from typing import Callable
+
+
+class TokenBucket:
+    """
+    Classic token bucket: ``capacity`` tokens, refilled at ``rate`` tokens/second.
+
+    The bucket is not thread-safe; it is meant to be driven from one event loop.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            rate: Refill rate in tokens per second
+            capacity: Maximum number of tokens (burst size)
+            clock: Monotonic clock (injectable for tests)
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError("Token bucket rate and capacity must be positive")
+        self.rate = rate
+        self.capacity = capacity
+        self._clock = clock
+        self._tokens = capacity
+        self._updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def set_rate(self, rate: float):
+        """Change the refill rate from now on (time already elapsed refills at the old rate)."""
+        if rate <= 0:
+            raise ValueError("Token bucket rate must be positive")
+        self._refill()
+        self.rate = rate
+
+    def wait_time(self, amount: float) -> float:
+        """
+        Seconds until ``amount`` tokens are available (0 if available now)
+
+        Requests larger than the capacity are capped at the capacity so they can
+        still pass once the bucket is full.
+        """
+        self._refill()
+        amount = min(amount, self.capacity)
+        if self._tokens >= amount:
+            return 0.0
+        return (amount - self._tokens) / self.rate
+
+    def consume(self, amount: float):
+        """Take tokens (may go negative when settling a larger actual usage)."""
+        self._refill()
+        self._tokens -= min(amount, self.capacity)
+
+    def refund(self, amount: float):
+        """Return unused tokens (e.g. when the actual usage was below the estimate)."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + amount)
@@ -0,0 +1,151 @@
+"""
+Prometheus metrics shared by the API, agents and database layer.
+
+The module is intentionally lightweight (only ``prometheus_client``) so it can
+be imported from anywhere without pulling in models or database drivers.
+"""
+
+from contextlib import contextmanager
+from typing import Dict
+
+from prometheus_client import CONTENT_TYPE_LATEST, Counter, Gauge, Histogram
+from prometheus_client import generate_latest
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# Latency buckets tuned for LLM-backed endpoints (fast probes up to long agent runs)
+LATENCY_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    120.0,
+)
+
+# RED metrics (rate, errors, duration) per route template
+HTTP_REQUESTS = Counter(
+    "hacknation_http_requests_total",
+    "Total HTTP requests",
+    ["method", "route", "status"],
+)
+HTTP_ERRORS = Counter(
+    "hacknation_http_request_errors_total",
+    "HTTP requests that ended with a 5xx status or an unhandled exception",
+    ["method", "route"],
+)
+HTTP_LATENCY = Histogram(
+    "hacknation_http_request_duration_seconds",
+    "HTTP request latency in seconds",
+    ["method", "route"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# Saturation gauges
+ACTIVE_SESSIONS = Gauge(
+    "hacknation_active_sessions",
+    "Number of user sessions held by the prompt endpoint",
+)
+DB_POOL_CONNECTIONS = Gauge(
+    "hacknation_db_pool_connections",
+    "Database pool connections by state",
+    ["state"],
+)
+DB_POOL_UTILIZATION = Gauge(
+    "hacknation_db_pool_utilization_ratio",
+    "Fraction of the database pool connections currently checked out",
+)
+MODEL_LOADED = Gauge(
+    "hacknation_model_loaded",
+    "Model load state (1 = loaded, 0 = not loaded or failed)",
+    ["model"],
+)
+INFLIGHT_WORK = Gauge(
+    "hacknation_inflight_work",
+    "Async work currently in progress",
+    ["kind"],
+)
+AGENT_RUNS = Counter(
+    "hacknation_agent_runs_total",
+    "Agent runs triggered by the prompt endpoint",
+    ["outcome"],
+)
+RESPONSE_CACHE = Counter(
+    "hacknation_response_cache_total",
+    "Agent response cache lookups",
+    ["result"],
+)
+COALESCED_PROMPTS = Counter(
+    "hacknation_coalesced_prompts_total",
+    "Prompt requests served by joining an identical in-flight agent run",
+)
+LLM_CALLS = Counter(
+    "hacknation_llm_calls_total",
+    "LLM calls through the gateway by outcome (success, error, retry_*)",
+    ["model", "priority", "outcome"],
+)
+LLM_QUEUE_WAIT = Histogram(
+    "hacknation_llm_queue_wait_seconds",
+    "Time LLM calls waited for rate-limit admission",
+    ["model", "priority"],
+    buckets=LATENCY_BUCKETS,
+)
+
+# Plain in-process mirrors of the gauges, readable without scraping
+_inflight: Dict[str, int] = {}
+_model_states: Dict[str, str] = {}
+
+
+@contextmanager
+def track_inflight(kind: str):
+    """Count a unit of async work as in-flight for the duration of the block."""
+    _inflight[kind] = _inflight.get(kind, 0) + 1
+    INFLIGHT_WORK.labels(kind=kind).inc()
+    try:
+        yield
+    finally:
+        _inflight[kind] -= 1
+        INFLIGHT_WORK.labels(kind=kind).dec()
+
+
+def inflight_count(kind: str) -> int:
+    """Current number of in-flight units of the given kind."""
+    return _inflight.get(kind, 0)
+
+
+def set_model_state(model: str, state: str):
+    """
+    Record the load state of a model.
+
+    Args:
+        model: Model name (e.g. sentence-transformers model id)
+        state: One of "loading", "ready" or "failed"
+    """
+    _model_states[model] = state
+    MODEL_LOADED.labels(model=model).set(1 if state == "ready" else 0)
+
+
+def model_states() -> Dict[str, str]:
+    """Snapshot of known model load states."""
+    return dict(_model_states)
+
+
+def set_db_pool_usage(used: int, idle: int, maxconn: int):
+    """Publish database pool usage."""
+    DB_POOL_CONNECTIONS.labels(state="used").set(used)
+    DB_POOL_CONNECTIONS.labels(state="idle").set(idle)
+    DB_POOL_CONNECTIONS.labels(state="max").set(maxconn)
+    DB_POOL_UTILIZATION.set(used / maxconn if maxconn else 0)
+
+
+def render_metrics() -> bytes:
+    """Render all registered metrics in the Prometheus text format."""
+    return generate_latest()
@@ -0,0 +1,268 @@
+"""
+Scenario Batch Runner for Diplomind
+
+Runs many scenario variants against the same set of countries. The country
+registry, interaction graph and exploration results are computed once and
+shared; every (scenario x country) forecast is scheduled through a single
+concurrency-limited executor. Results are collected into a comparison matrix.
+
+Usage:
+    python -m src.models.batch_runner scenarios.json --output reports/comparison.csv
+"""
+import argparse
+import asyncio
+import csv
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Mapping, Optional, Union
+
+from src.agents.forecasting_agent import ForecastOutput, generate_forecast
+from src.agents.prompt_cache import TokenLedger
+from src.configuration import Configuration
+from src.models.checkpoint import SimulationCheckpoint
+from src.models.country_registry import CountryRegistry
+from src.models.interaction_graph import InteractionGraph
+from src.models.scenario import Scenario
+from src.models.world_model import WorldModel
+
+logger = logging.getLogger(__name__)
+
+config = Configuration()
+
+
+@dataclass
+class ScenarioRunResult:
+    """Forecasts of every country for one scenario"""
+
+    scenario_id: str
+    scenario: Scenario
+    forecasts: Dict[str, ForecastOutput] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    token_ledger: TokenLedger = field(default_factory=TokenLedger)
+
+    def forecasts_data(self) -> List[Dict]:
+        """Forecasts in the WorldModel.get_forecasts() format (for report generation)"""
+        return [
+            {"country_name": country_name, "forecast": forecast}
+            for country_name, forecast in self.forecasts.items()
+        ]
+
+
+class ScenarioBatchRunner:
+    """
+    Forecasts a batch of scenarios with one shared exploration phase
+    """
+
+    def __init__(
+        self,
+        scenarios: List[Union[Scenario, Dict[str, Any]]],
+        resources_dir: str = "resources",
+        countries: Optional[CountryRegistry] = None,
+        graph: Optional[InteractionGraph] = None,
+        max_concurrency: Optional[int] = None,
+        checkpoint_dir: Optional[str] = None,
+        resume: bool = False,
+    ):
+        """
+        Args:
+            scenarios: Scenarios, or dictionaries accepted by Scenario.coerce
+                       (structured 'factors' or legacy 'description')
+            resources_dir: Directory containing country JSON files
+            countries: Preloaded country registry (default: shared registry)
+            graph: Prebuilt interaction graph (default: built from the registry)
+            max_concurrency: Maximum forecasts in flight (default from configuration)
+            checkpoint_dir: Directory with one checkpoint file per scenario
+                            (<scenario_id>.jsonl). If None, nothing is checkpointed.
+            resume: Reuse forecasts already in the checkpoints instead of
+                    calling the LLM again
+        """
+        if not scenarios:
+            raise ValueError("At least one scenario is required")
+        self.scenarios = [Scenario.coerce(s) for s in scenarios]
+        self.scenario_ids = [s.id or f"scenario_{i + 1}" for i, s in enumerate(self.scenarios)]
+        if len(set(self.scenario_ids)) != len(self.scenario_ids):
+            raise ValueError("Scenario ids must be unique")
+
+        # The base model owns the registry, graph and exploration shared by all scenarios
+        self.model = WorldModel(
+            scenario=self.scenarios[0],
+            resources_dir=resources_dir,
+            countries=countries,
+            graph=graph,
+        )
+        self.max_concurrency = max_concurrency or config.batch_max_concurrency
+        self.checkpoint_dir = checkpoint_dir
+        self.resume = resume
+        self.results: List[ScenarioRunResult] = []
+        self._context: Optional[Dict[str, List[Mapping]]] = None
+
+    def explore(self) -> Dict[str, List[Mapping]]:
+        """
+        Run the exploration phase once and return each country's context
+
+        Returns:
+            Dictionary country name -> explored country profiles
+        """
+        if self._context is None:
+            self.model.run_exploration()
+            self._context = {
+                agent.resources["country_name"]: agent.explored_countries
+                for agent in self.model.my_agents
+            }
+        return self._context
+
+    async def arun(self) -> List[ScenarioRunResult]:
+        """
+        Forecast every (scenario x country) pair concurrently
+
+        Returns:
+            One ScenarioRunResult per scenario, in input order
+        """
+        context = self.explore()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        results = [
+            ScenarioRunResult(scenario_id, scenario)
+            for scenario_id, scenario in zip(self.scenario_ids, self.scenarios)
+        ]
+        checkpoints: Dict[str, SimulationCheckpoint] = {}
+        if self.checkpoint_dir:
+            for result in results:
+                checkpoint = SimulationCheckpoint(
+                    os.path.join(self.checkpoint_dir, f"{result.scenario_id}.jsonl"),
+                    result.scenario,
+                    resume=self.resume,
+                )
+                checkpoints[result.scenario_id] = checkpoint
+                result.forecasts.update(checkpoint.forecasts)
+
+        async def forecast(result: ScenarioRunResult, country_name: str):
+            checkpoint = checkpoints.get(result.scenario_id)
+            async with semaphore:
+                try:
+                    result.forecasts[country_name] = await generate_forecast(
+                        country_name=country_name,
+                        country_resources=self.model.countries[country_name],
+                        other_countries=context[country_name],
+                        scenario=result.scenario,
+                        token_ledger=result.token_ledger,
+                    )
+                except Exception as e:
+                    logger.error(f"[{result.scenario_id}] Forecast for {country_name} failed: {e}")
+                    result.errors[country_name] = str(e)
+                    if checkpoint is not None:
+                        checkpoint.record_failure(country_name, str(e))
+                    return
+            if checkpoint is not None:
+                explored = [profile["country_name"] for profile in context[country_name]]
+                checkpoint.record_forecast(country_name, result.forecasts[country_name], explored)
+
+        pending = [
+            (result, country_name)
+            for result in results
+            for country_name in context
+            if country_name not in result.forecasts
+        ]
+        skipped = len(results) * len(context) - len(pending)
+        if skipped:
+            logger.info(f"Skipping {skipped} forecasts restored from checkpoints")
+        logger.info(
+            f"Forecasting {len(pending)} (scenario x country) pairs "
+            f"(max {self.max_concurrency} concurrent)"
+        )
+        started = time.perf_counter()
+        await asyncio.gather(*(forecast(result, country_name) for result, country_name in pending))
+        logger.info(f"Batch finished in {time.perf_counter() - started:.1f}s")
+
+        # Keep registry order regardless of completion order
+        for result in results:
+            result.forecasts = {
+                name: result.forecasts[name] for name in context if name in result.forecasts
+            }
+        self.results = results
+        return results
+
+    def run(self) -> List[ScenarioRunResult]:
+        """Synchronous wrapper around arun()"""
+        return asyncio.run(self.arun())
+
+    def comparison_matrix(self) -> List[Dict]:
+        """
+        One row per (scenario, country) with forecast confidences
+
+        Returns:
+            List of dictionaries (scenario_id, country_name, confidence_12m,
+            confidence_36m, status)
+        """
+        rows = []
+        for result in self.results:
+            for country_name in self.model.countries.names:
+                forecast = result.forecasts.get(country_name)
+                rows.append({
+                    "scenario_id": result.scenario_id,
+                    "country_name": country_name,
+                    "confidence_12m": forecast.forecast_12_months.confidence if forecast else None,
+                    "confidence_36m": forecast.forecast_36_months.confidence if forecast else None,
+                    "status": "ok" if forecast else "failed",
+                })
+        return rows
+
+    def write_comparison_csv(self, path: str) -> str:
+        """
+        Write the comparison matrix to a CSV file
+
+        Args:
+            path: Output file path
+
+        Returns:
+            The path written
+        """
+        rows = self.comparison_matrix()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(
+                f,
+                fieldnames=["scenario_id", "country_name", "confidence_12m", "confidence_36m", "status"],
+            )
+            writer.writeheader()
+            writer.writerows(rows)
+        logger.info(f"Comparison matrix written to {path} ({len(rows)} rows)")
+        return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Forecast a batch of scenarios")
+    parser.add_argument("scenarios", help="JSON file with a list of scenario objects")
+    parser.add_argument("--output", default=os.path.join(config.report_dir, "comparison.csv"))
+    parser.add_argument("--resources-dir", default="resources")
+    parser.add_argument("--max-concurrency", type=int, default=None)
+    parser.add_argument("--checkpoint-dir", default=None, help="Checkpoint every forecast to this directory")
+    parser.add_argument("--resume", action="store_true", help="Skip forecasts already checkpointed")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=getattr(logging, config.log_level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    with open(args.scenarios, "r", encoding="utf-8") as f:
+        scenarios = json.load(f)
+
+    runner = ScenarioBatchRunner(
+        scenarios,
+        resources_dir=args.resources_dir,
+        max_concurrency=args.max_concurrency,
+        checkpoint_dir=args.checkpoint_dir or (config.checkpoint_dir if args.resume else None),
+        resume=args.resume,
+    )
+    runner.run()
+    runner.write_comparison_csv(args.output)
+    for result in runner.results:
+        logger.info(f"[{result.scenario_id}] tokens: {result.token_ledger.summary()}")
+
+
+if __name__ == "__main__":
+    main()
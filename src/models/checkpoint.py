@@ -0,0 +1,147 @@
+"""
+Simulation Checkpoints for Diplomind
+
+Append-only JSON lines file with one record per finished country forecast.
+Every record is flushed and fsynced, so a crash loses at most the forecast in
+progress; a resumed run skips countries that already have a forecast.
+"""
+import json
+import logging
+import os
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from src.agents.forecasting_agent import ForecastOutput
+from src.models.scenario import Scenario
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_VERSION = 1
+
+
+def read_complete_lines(path: str) -> List[str]:
+    """
+    Lines of an append-only JSON lines file, without a partial last line
+
+    A crash while writing leaves a partial last line; it is cut off the file so
+    the next appended record starts on a line of its own.
+
+    Args:
+        path: Existing file
+
+    Returns:
+        Complete lines (without line endings)
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    complete = data[:data.rfind(b"\n") + 1]
+    if len(complete) < len(data):
+        logger.warning(f"Dropping truncated last record of {path}")
+        with open(path, "r+b") as f:
+            f.truncate(len(complete))
+            os.fsync(f.fileno())
+    return complete.decode("utf-8").splitlines()
+
+
+class CheckpointMismatchError(ValueError):
+    """The checkpoint was written for a different scenario."""
+
+
+class SimulationCheckpoint:
+    """Completed forecasts of one scenario run, persisted as JSON lines"""
+
+    def __init__(self, path: str, scenario: Scenario, resume: bool = False):
+        """
+        Args:
+            path: Checkpoint file
+            scenario: Scenario of the run (must match the file when resuming)
+            resume: Load completed forecasts from an existing file; otherwise an
+                    existing file is replaced
+        """
+        self.path = path
+        self.scenario = scenario
+        self.forecasts: Dict[str, ForecastOutput] = {}
+        self.explored: Dict[str, List[str]] = {}
+        self.failures: Dict[str, str] = {}
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if resume and os.path.exists(path):
+            self._load()
+        else:
+            self._write_header()
+
+    def _write_header(self):
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write(json.dumps(self._header()) + "\n")
+
+    def _header(self) -> dict:
+        return {
+            "type": "header",
+            "version": CHECKPOINT_VERSION,
+            "scenario_id": self.scenario.id,
+            "scenario_fingerprint": self.scenario.fingerprint,
+            "created_at": datetime.now().isoformat(),
+        }
+
+    def _load(self):
+        lines = read_complete_lines(self.path)
+        if not lines:
+            self._write_header()
+        for line_number, line in enumerate(lines, 1):
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                logger.warning(f"Ignoring unreadable checkpoint line {line_number} in {self.path}")
+                continue
+            kind = record.get("type")
+            if kind == "header":
+                if record.get("scenario_fingerprint") != self.scenario.fingerprint:
+                    raise CheckpointMismatchError(
+                        f"Checkpoint {self.path} belongs to a different scenario; "
+                        "start a new run instead of resuming"
+                    )
+            elif kind == "forecast":
+                name = record["country_name"]
+                self.forecasts[name] = ForecastOutput.model_validate(record["forecast"])
+                self.explored[name] = record.get("explored", [])
+                self.failures.pop(name, None)
+            elif kind == "failed":
+                self.failures[record["country_name"]] = record.get("error", "")
+        logger.info(
+            f"Resuming from {self.path}: {len(self.forecasts)} forecasts done, "
+            f"{len(self.failures)} failed earlier (will be retried)"
+        )
+
+    def _append(self, record: dict):
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def record_forecast(self, country_name: str, forecast: ForecastOutput, explored: Optional[List[str]] = None):
+        """Persist a completed forecast."""
+        self.forecasts[country_name] = forecast
+        self.explored[country_name] = list(explored or [])
+        self.failures.pop(country_name, None)
+        self._append({
+            "type": "forecast",
+            "country_name": country_name,
+            "explored": self.explored[country_name],
+            "forecast": forecast.model_dump(mode="json"),
+            "recorded_at": datetime.now().isoformat(),
+        })
+
+    def record_failure(self, country_name: str, error: str):
+        """Persist a failed forecast (it is retried on resume)."""
+        self.failures[country_name] = error
+        self._append({
+            "type": "failed",
+            "country_name": country_name,
+            "error": error,
+            "recorded_at": datetime.now().isoformat(),
+        })
+
+    def is_done(self, country_name: str) -> bool:
+        return country_name in self.forecasts
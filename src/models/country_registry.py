@@ -0,0 +1,231 @@
+"""
+Country Registry for Diplomind
+
+Immutable, indexed store of country profiles loaded once per process from
+``resources/*.json`` and shared (by reference) by the world model and agents.
+"""
+import json
+import logging
+import os
+import unicodedata
+from collections.abc import Mapping, Sequence
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from src.models.input import CountryInput
+
+logger = logging.getLogger(__name__)
+
+# Common alternative names, keyed by normalized alias
+COUNTRY_ALIASES = {
+    "usa": "united states",
+    "us": "united states",
+    "u.s.": "united states",
+    "united states of america": "united states",
+    "uk": "united kingdom",
+    "great britain": "united kingdom",
+    "britain": "united kingdom",
+    "prc": "china",
+    "people's republic of china": "china",
+    "russian federation": "russia",
+    "ksa": "saudi arabia",
+    "deutschland": "germany",
+}
+
+
+def normalize_country_key(name: str) -> str:
+    """
+    Normalize a country name for lookups ("United_Kingdom " -> "united kingdom")
+
+    Args:
+        name: Country name, file stem or alias
+
+    Returns:
+        Normalized key
+    """
+    text = unicodedata.normalize("NFKC", name).casefold()
+    text = text.replace("_", " ").replace("-", " ")
+    return " ".join(text.split())
+
+
+def _freeze(data: dict) -> Mapping:
+    """Read-only view of a profile; lists become tuples."""
+    return MappingProxyType(
+        {k: tuple(v) if isinstance(v, list) else v for k, v in data.items()}
+    )
+
+
+class OtherCountriesView(Sequence):
+    """
+    Read-only sequence of every profile except one, without copying.
+
+    Supports ``len``, iteration, indexing and slicing like a list.
+    """
+
+    def __init__(self, profiles: Tuple[Mapping, ...], excluded_index: int):
+        self._profiles = profiles
+        self._excluded = excluded_index
+
+    def __len__(self) -> int:
+        return len(self._profiles) - 1
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("OtherCountriesView index out of range")
+        return self._profiles[index if index < self._excluded else index + 1]
+
+
+class CountryRegistry(Mapping):
+    """
+    Immutable mapping of normalized country key -> frozen profile.
+
+    Profiles are validated against ``CountryInput``; extra fields from the
+    JSON files (e.g. indicator time series) are preserved.
+    """
+
+    def __init__(self, profiles: Iterable[dict], aliases: Optional[Dict[str, str]] = None):
+        """
+        Args:
+            profiles: Country profile dictionaries (must contain country_name)
+            aliases: Extra alias -> country name mappings
+        """
+        frozen = sorted(
+            (_freeze(p) for p in profiles), key=lambda p: p["country_name"]
+        )
+        self._profiles: Tuple[Mapping, ...] = tuple(frozen)
+        self._index: Dict[str, int] = {}
+        for i, profile in enumerate(self._profiles):
+            key = normalize_country_key(profile["country_name"])
+            if key in self._index:
+                raise ValueError(f"Duplicate country in registry: {profile['country_name']}")
+            self._index[key] = i
+
+        self._aliases: Dict[str, int] = {}
+        for alias, target in {**COUNTRY_ALIASES, **(aliases or {})}.items():
+            target_index = self._index.get(normalize_country_key(target))
+            if target_index is not None:
+                self._aliases[normalize_country_key(alias)] = target_index
+
+    @classmethod
+    def from_directory(cls, resources_dir: str) -> "CountryRegistry":
+        """
+        Load and validate every ``*.json`` file in a directory
+
+        Args:
+            resources_dir: Directory containing country JSON files
+
+        Returns:
+            CountryRegistry (invalid files are logged and skipped)
+        """
+        if not os.path.exists(resources_dir):
+            logger.error(f"Resources directory not found: {resources_dir}")
+            raise FileNotFoundError(f"Resources directory not found: {resources_dir}")
+
+        json_files = sorted(f for f in os.listdir(resources_dir) if f.endswith(".json"))
+        if not json_files:
+            logger.warning(f"No country JSON files found in {resources_dir}")
+
+        profiles = []
+        aliases = {}
+        for filename in json_files:
+            try:
+                with open(os.path.join(resources_dir, filename), "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                data.setdefault("country_name", filename[:-5])
+                validated = CountryInput.model_validate(data)
+                profiles.append({**data, **validated.model_dump()})
+                # The file stem always resolves, even if it differs from the name
+                aliases[filename[:-5]] = data["country_name"]
+                logger.debug(f"Loaded country: {data['country_name']}")
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse JSON file {filename}: {e}")
+            except ValidationError as e:
+                logger.error(f"Invalid country profile in {filename}: {e}")
+            except Exception as e:
+                logger.error(f"Failed to load country from {filename}: {e}")
+
+        return cls(profiles, aliases=aliases)
+
+    def _position(self, name: str) -> Optional[int]:
+        key = normalize_country_key(name)
+        index = self._index.get(key)
+        return index if index is not None else self._aliases.get(key)
+
+    def __getitem__(self, name: str) -> Mapping:
+        index = self._position(name)
+        if index is None:
+            raise KeyError(name)
+        return self._profiles[index]
+
+    def __contains__(self, name) -> bool:
+        return isinstance(name, str) and self._position(name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return (p["country_name"] for p in self._profiles)
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def key_of(self, name: str) -> Optional[str]:
+        """Canonical normalized key for a name or alias (None if unknown)."""
+        index = self._position(name)
+        if index is None:
+            return None
+        return normalize_country_key(self._profiles[index]["country_name"])
+
+    @property
+    def names(self) -> List[str]:
+        """Country names in registry order."""
+        return [p["country_name"] for p in self._profiles]
+
+    @property
+    def profiles(self) -> Tuple[Mapping, ...]:
+        """All profiles in registry order."""
+        return self._profiles
+
+    def others(self, name: str) -> OtherCountriesView:
+        """All profiles except the given country (a view, not a copy)."""
+        index = self._position(name)
+        if index is None:
+            raise KeyError(name)
+        return OtherCountriesView(self._profiles, index)
+
+    def __repr__(self):
+        return f"CountryRegistry(countries={len(self)})"
+
+
+def _directory_signature(resources_dir: str) -> Tuple[Tuple[str, float], ...]:
+    return tuple(
+        (entry.name, entry.stat().st_mtime)
+        for entry in sorted(os.scandir(resources_dir), key=lambda e: e.name)
+        if entry.name.endswith(".json")
+    )
+
+
+@lru_cache(maxsize=8)
+def _load_cached(resources_dir: str, signature) -> CountryRegistry:
+    return CountryRegistry.from_directory(resources_dir)
+
+
+def load_country_registry(resources_dir: str = "resources") -> CountryRegistry:
+    """
+    Get the shared registry for a directory, re-loading only if files changed
+
+    Args:
+        resources_dir: Directory containing country JSON files
+
+    Returns:
+        CountryRegistry shared by every caller in the process
+    """
+    if not os.path.exists(resources_dir):
+        logger.error(f"Resources directory not found: {resources_dir}")
+        raise FileNotFoundError(f"Resources directory not found: {resources_dir}")
+    resources_dir = os.path.abspath(resources_dir)
+    return _load_cached(resources_dir, _directory_signature(resources_dir))
@@ -0,0 +1,72 @@
+"""
+Numeric indicators of country profiles
+resources/*.json may carry World Bank time series under the "indicators" key
+(written by src/crawlers/worldbank.py):
+
+    "indicators": {
+        "source": "World Bank WDI",
+        "updated": "2025-01-31",
+        "series": {"gdp_current_usd": {"2022": 4.08e12, "2023": 4.53e12}, ...}
+    }
+
+This module names the tracked indicators and formats the series for prompts.
+"""
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
+
+
+@dataclass(frozen=True)
+class Indicator:
+    """One tracked World Bank indicator"""
+
+    code: str
+    label: str
+    unit: str
+    # Values are divided by this before display (e.g. 1e9 for billions)
+    scale: float = 1.0
+    decimals: int = 1
+
+
+# Profile key -> indicator (World Development Indicators, source=2)
+INDICATORS: Dict[str, Indicator] = {
+    "gdp_current_usd": Indicator("NY.GDP.MKTP.CD", "PKB", "mld USD", scale=1e9),
+    "gdp_growth_pct": Indicator("NY.GDP.MKTP.KD.ZG", "Wzrost PKB", "%"),
+    "gdp_per_capita_usd": Indicator("NY.GDP.PCAP.CD", "PKB per capita", "USD", decimals=0),
+    "population": Indicator("SP.POP.TOTL", "Populacja", "mln", scale=1e6),
+    "inflation_pct": Indicator("FP.CPI.TOTL.ZG", "Inflacja (CPI)", "%"),
+    "unemployment_pct": Indicator("SL.UEM.TOTL.ZS", "Bezrobocie", "%"),
+    "military_expenditure_pct_gdp": Indicator("MS.MIL.XPND.GD.ZS", "Wydatki wojskowe", "% PKB", decimals=2),
+    "armed_forces_personnel": Indicator("MS.MIL.TOTL.P1", "Personel sił zbrojnych", "tys.", scale=1e3),
+    "trade_pct_gdp": Indicator("NE.TRD.GNFS.ZS", "Handel zagraniczny", "% PKB"),
+    "government_debt_pct_gdp": Indicator("GC.DOD.TOTL.GD.ZS", "Dług rządu centralnego", "% PKB"),
+    "fdi_net_inflows_pct_gdp": Indicator("BX.KLT.DINV.WD.GD.ZS", "Napływ BIZ netto", "% PKB", decimals=2),
+    "energy_imports_pct": Indicator("EG.IMP.CONS.ZS", "Import energii netto", "% zużycia"),
+    "internet_users_pct": Indicator("IT.NET.USER.ZS", "Użytkownicy internetu", "% populacji"),
+}
+INDICATOR_KEYS_BY_CODE = {indicator.code: key for key, indicator in INDICATORS.items()}
+
+
+def format_indicators(indicators: Optional[Mapping], years: int = 5) -> str:
+    """
+    Compact prompt lines with the latest values of each indicator
+
+    Args:
+        indicators: The profile's "indicators" object (may be missing)
+        years: Most recent years shown per indicator
+
+    Returns:
+        One "- label [unit]: year: value, ..." line per indicator with data
+    """
+    series = (indicators or {}).get("series") or {}
+    lines = []
+    for key, indicator in INDICATORS.items():
+        values = series.get(key) or {}
+        points = sorted((year, value) for year, value in values.items() if value is not None)[-years:]
+        if not points:
+            continue
+        formatted = ", ".join(
+            f"{year}: {value / indicator.scale:,.{indicator.decimals}f}".replace(",", " ")
+            for year, value in points
+        )
+        lines.append(f"- {indicator.label} [{indicator.unit}]: {formatted}")
+    return "\n".join(lines)
@@ -0,0 +1,139 @@
+"""
+Interaction Graph for Diplomind
+
+Sparse graph of relations between actors (countries and sub-state actors).
+Edges come from ``key_bilateral_relations`` and, when present in a profile,
+from ``trade_partners``, ``alliances`` and ``neighbors``. Exploration is
+limited to a node's neighborhood, so cost grows with degree, not with the
+total number of actors.
+"""
+import logging
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+from src.models.country_registry import CountryRegistry, normalize_country_key
+
+logger = logging.getLogger(__name__)
+
+# Profile field -> edge kind
+EDGE_FIELDS = {
+    "key_bilateral_relations": "bilateral",
+    "trade_partners": "trade",
+    "alliances": "alliance",
+    "neighbors": "proximity",
+}
+
+
+class InteractionGraph:
+    """Undirected multigraph over normalized actor keys"""
+
+    def __init__(self, nodes: Iterable[str] = ()):
+        self._adjacency: Dict[str, Dict[str, Set[str]]] = {}
+        for node in nodes:
+            self.add_node(node)
+
+    @classmethod
+    def from_registry(cls, registry: CountryRegistry) -> "InteractionGraph":
+        """
+        Build the graph from relation fields of every profile in a registry
+
+        Relations naming actors that are not in the registry (e.g. "NATO")
+        are ignored.
+
+        Args:
+            registry: Loaded country registry
+
+        Returns:
+            InteractionGraph with one node per registry entry
+        """
+        graph = cls(normalize_country_key(name) for name in registry.names)
+        unresolved = 0
+        for profile in registry.profiles:
+            source = normalize_country_key(profile["country_name"])
+            for field, kind in EDGE_FIELDS.items():
+                for related in profile.get(field) or ():
+                    target = registry.key_of(related)
+                    if target is None:
+                        unresolved += 1
+                        continue
+                    if target != source:
+                        graph.add_edge(source, target, kind)
+
+        logger.info(
+            f"Interaction graph: {len(graph)} nodes, {graph.edge_count()} edges "
+            f"({unresolved} relations outside the registry ignored)"
+        )
+        return graph
+
+    def add_node(self, node: str):
+        self._adjacency.setdefault(node, {})
+
+    def add_edge(self, a: str, b: str, kind: str = "bilateral"):
+        """Add (or tag) an undirected edge of the given kind"""
+        self.add_node(a)
+        self.add_node(b)
+        self._adjacency[a].setdefault(b, set()).add(kind)
+        self._adjacency[b].setdefault(a, set()).add(kind)
+
+    def neighbors(self, node: str) -> Set[str]:
+        """Direct neighbors of a node"""
+        return set(self._adjacency.get(node, ()))
+
+    def edge_kinds(self, a: str, b: str) -> Set[str]:
+        """Kinds of edges between two nodes (empty if not connected)"""
+        return set(self._adjacency.get(a, {}).get(b, ()))
+
+    def distances(self, source: str, max_hops: Optional[int] = None) -> Dict[str, int]:
+        """
+        Breadth-first hop distances from a node
+
+        Args:
+            source: Start node
+            max_hops: Stop expanding beyond this many hops (None = whole component)
+
+        Returns:
+            Dictionary node -> hops (source included with 0)
+        """
+        if source not in self._adjacency:
+            return {}
+        distances = {source: 0}
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            if max_hops is not None and distances[node] >= max_hops:
+                continue
+            for neighbor in self._adjacency[node]:
+                if neighbor not in distances:
+                    distances[neighbor] = distances[node] + 1
+                    queue.append(neighbor)
+        return distances
+
+    def neighborhood(self, node: str, radius: int = 1) -> List[str]:
+        """
+        Nodes within ``radius`` hops, nearest first (node itself excluded)
+
+        Args:
+            node: Center node
+            radius: Maximum number of hops
+
+        Returns:
+            List of node keys sorted by (distance, key)
+        """
+        distances = self.distances(node, max_hops=radius)
+        distances.pop(node, None)
+        return sorted(distances, key=lambda n: (distances[n], n))
+
+    def degree(self, node: str) -> int:
+        return len(self._adjacency.get(node, ()))
+
+    def edge_count(self) -> int:
+        return sum(len(edges) for edges in self._adjacency.values()) // 2
+
+    def __contains__(self, node) -> bool:
+        return node in self._adjacency
+
+    def __len__(self) -> int:
+        return len(self._adjacency)
+
+    def __repr__(self):
+        return f"InteractionGraph(nodes={len(self)}, edges={self.edge_count()})"
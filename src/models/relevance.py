@@ -0,0 +1,184 @@
+"""
+Relevance Index for Diplomind
+
+Ranks other countries by relevance to a target country so that the forecast
+prompt carries the most useful context instead of the first N files. The
+score combines, as one vectorized N x N matrix computed once per run:
+
+- profile similarity (cosine of TF-IDF hashed profile vectors, or of sentence
+  embeddings when an encoder is supplied),
+- proximity in the bilateral-relations interaction graph,
+- exposure of the other country to the scenario factors.
+"""
+import logging
+import re
+import zlib
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.models.country_registry import CountryRegistry, normalize_country_key
+from src.models.interaction_graph import InteractionGraph
+
+logger = logging.getLogger(__name__)
+
+# Profile fields used to describe a country
+PROFILE_TEXT_FIELDS = (
+    "geographical_features",
+    "climate",
+    "economic_strengths",
+    "army_size",
+    "digitalization_level",
+    "currency",
+    "key_bilateral_relations",
+    "political_economic_threats",
+    "military_threats",
+    "development_milestones",
+)
+
+HASH_DIM = 1024
+# Graph proximity is ignored beyond this many hops
+MAX_GRAPH_HOPS = 3
+TOKEN_PATTERN = re.compile(r"\w{3,}", re.UNICODE)
+
+Encoder = Callable[[List[str]], np.ndarray]
+
+
+def profile_text(profile) -> str:
+    """Flatten the descriptive fields of a profile into one string"""
+    parts = []
+    for field in PROFILE_TEXT_FIELDS:
+        value = profile.get(field) or ""
+        if isinstance(value, (list, tuple)):
+            value = " ".join(value)
+        parts.append(str(value))
+    return " ".join(parts)
+
+
+def hashed_tfidf(texts: Sequence[str], dim: int = HASH_DIM) -> np.ndarray:
+    """
+    L2-normalized TF-IDF vectors using the hashing trick (no vocabulary, no model)
+
+    Args:
+        texts: Documents
+        dim: Number of hash buckets
+
+    Returns:
+        Array of shape (len(texts), dim)
+    """
+    counts = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for token in TOKEN_PATTERN.findall(text.casefold()):
+            counts[row, zlib.crc32(token.encode("utf-8")) % dim] += 1.0
+
+    tf = np.log1p(counts)
+    document_frequency = np.count_nonzero(counts, axis=0)
+    idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1.0
+    vectors = tf * idf
+    return _l2_normalize(vectors)
+
+
+def _l2_normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return vectors / norms
+
+
+class RelevanceIndex:
+    """Precomputed pairwise relevance scores between all countries in a registry"""
+
+    def __init__(
+        self,
+        registry: CountryRegistry,
+        graph: InteractionGraph,
+        scenario_text: str = "",
+        encoder: Optional[Encoder] = None,
+        weights: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Args:
+            registry: Country registry
+            graph: Interaction graph over the registry keys
+            scenario_text: Scenario description (used for exposure)
+            encoder: Optional batch text encoder (e.g. a SentenceTransformer's
+                     ``encode``); defaults to hashed TF-IDF vectors
+            weights: Weights for "similarity", "graph" and "exposure"
+        """
+        self.weights = {"similarity": 0.4, "graph": 0.4, "exposure": 0.2, **(weights or {})}
+        self.keys: List[str] = [normalize_country_key(n) for n in registry.names]
+        self._position = {key: i for i, key in enumerate(self.keys)}
+
+        texts = [profile_text(p) for p in registry.profiles]
+        if encoder is not None:
+            vectors = _l2_normalize(np.asarray(encoder(texts + [scenario_text]), dtype=np.float32))
+        else:
+            vectors = hashed_tfidf(texts + [scenario_text])
+        profile_vectors, scenario_vector = vectors[:-1], vectors[-1]
+
+        similarity = profile_vectors @ profile_vectors.T
+        proximity = self._graph_proximity(graph)
+        exposure = profile_vectors @ scenario_vector
+        if exposure.max() > 0:
+            exposure = exposure / exposure.max()
+
+        self.scores = (
+            self.weights["similarity"] * similarity
+            + self.weights["graph"] * proximity
+            + self.weights["exposure"] * exposure[np.newaxis, :]
+        )
+        np.fill_diagonal(self.scores, -np.inf)
+        logger.info(f"Relevance index computed for {len(self.keys)} countries")
+
+    def _graph_proximity(self, graph: InteractionGraph) -> np.ndarray:
+        """1 / (1 + hops) for pairs within MAX_GRAPH_HOPS, 0 otherwise"""
+        size = len(self.keys)
+        adjacency = np.zeros((size, size), dtype=np.float32)
+        for i, key in enumerate(self.keys):
+            for other in graph.neighbors(key):
+                j = self._position.get(other)
+                if j is not None:
+                    adjacency[i, j] = 1.0
+
+        # Expand all frontiers at once: one matrix product per hop
+        proximity = np.zeros((size, size), dtype=np.float32)
+        reached = np.eye(size, dtype=bool)
+        frontier = np.eye(size, dtype=np.float32)
+        for hops in range(1, MAX_GRAPH_HOPS + 1):
+            frontier = ((frontier @ adjacency) > 0) & ~reached
+            if not frontier.any():
+                break
+            proximity[frontier] = 1.0 / (1.0 + hops)
+            reached |= frontier
+            frontier = frontier.astype(np.float32)
+        return proximity
+
+    def score(self, key: str, other: str) -> float:
+        """Relevance of `other` as context for `key`"""
+        return float(self.scores[self._position[key], self._position[other]])
+
+    def rank(self, key: str, candidates: Optional[Sequence[str]] = None, k: Optional[int] = None) -> List[str]:
+        """
+        Other country keys sorted by relevance to `key`, most relevant first
+
+        Args:
+            key: Target country key
+            candidates: Restrict ranking to these keys (default: all others)
+            k: Return at most k keys
+
+        Returns:
+            List of country keys
+        """
+        row = self.scores[self._position[key]]
+        if candidates is None:
+            indices = np.arange(len(self.keys))
+            indices = indices[indices != self._position[key]]
+        else:
+            indices = np.array(
+                [self._position[c] for c in candidates if c in self._position and c != key],
+                dtype=int,
+            )
+        if k is not None and k < len(indices):
+            # Partial sort: O(N) selection, then sort only the top k
+            indices = indices[np.argpartition(-row[indices], k - 1)[:k]]
+        order = indices[np.argsort(-row[indices], kind="stable")]
+        return [self.keys[i] for i in order]
@@ -0,0 +1,70 @@
+"""
+Report model for Diplomind
+
+Format-independent content of a forecast report: the scenario plus every
+country's ForecastOutput. Renderers (src/report_renderers.py) turn one model
+into PDF, HTML, Markdown or JSON, so the cheap formats never wait for ReportLab.
+"""
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Union
+
+from pydantic import BaseModel, Field
+
+from src.agents.forecasting_agent import ForecastOutput
+from src.models.scenario import Scenario
+
+REPORT_TITLE = "Raport Analiz Geopolitycznych"
+
+
+class CountryReport(BaseModel):
+    """Forecast section of one country"""
+
+    country_name: str
+    forecast: ForecastOutput
+
+
+class Report(BaseModel):
+    """Complete forecast report"""
+
+    title: str = REPORT_TITLE
+    scenario: Scenario
+    generated_at: datetime = Field(default_factory=datetime.now)
+    countries: List[CountryReport] = Field(default_factory=list)
+
+    @property
+    def subtitle(self) -> str:
+        return f"Prognozy dla {len(self.countries)} krajów"
+
+    @classmethod
+    def from_forecasts(
+        cls,
+        scenario: Union[Scenario, Dict[str, Any], str],
+        forecasts: List[Dict],
+        generated_at: Optional[datetime] = None,
+    ) -> "Report":
+        """
+        Build a report from WorldModel.get_forecasts() data
+
+        Args:
+            scenario: Scenario (or anything accepted by Scenario.coerce)
+            forecasts: List of dictionaries with country_name and forecast keys
+            generated_at: Report timestamp (default: now)
+
+        Returns:
+            Report
+        """
+        return cls(
+            scenario=Scenario.coerce(scenario),
+            generated_at=generated_at or datetime.now(),
+            countries=[
+                CountryReport(country_name=data["country_name"], forecast=data["forecast"])
+                for data in forecasts
+            ],
+        )
+
+    def forecasts_data(self) -> List[Dict]:
+        """Forecasts in the WorldModel.get_forecasts() format (for ForecastReportGenerator)"""
+        return [
+            {"country_name": country.country_name, "forecast": country.forecast}
+            for country in self.countries
+        ]
@@ -0,0 +1,194 @@
+"""
+Scenario model for Diplomind
+
+A scenario is a set of weighted factors (a, b, c, ...). The model is frozen and
+validated; its fingerprint is computed once and used for prompt and response
+cache keys, so sweeps can vary weights without re-hashing whole prompts.
+"""
+import hashlib
+import json
+import re
+from functools import cached_property
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+
+# "a) <text> (waga istotności: 30)" paragraphs of the legacy free-text format
+FACTOR_PATTERN = re.compile(
+    r"^\s*([a-z0-9_]+)\)\s*(.*?)\s*\(waga istotności:\s*(\d+)\)\s*$",
+    re.DOTALL | re.IGNORECASE,
+)
+
+
+class Factor(BaseModel):
+    """Single weighted factor of a scenario"""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: str = Field(pattern=r"^[a-z0-9_]+$", description="Short factor id (e.g. 'a')")
+    title: str = Field(default="", description="Short factor name used in weight listings")
+    text: str = Field(min_length=1, description="Factor description")
+    weight: int = Field(ge=0, le=100, description="Importance weight (0-100)")
+
+    @property
+    def label(self) -> str:
+        return self.title or self.text.split(";")[0][:80]
+
+
+class Scenario(BaseModel):
+    """Global scenario made of weighted factors"""
+
+    model_config = ConfigDict(frozen=True)
+
+    id: Optional[str] = Field(default=None, description="Scenario id (e.g. for batch runs)")
+    factors: Tuple[Factor, ...] = Field(min_length=1)
+
+    @field_validator("factors")
+    @classmethod
+    def _unique_factor_ids(cls, factors: Tuple[Factor, ...]) -> Tuple[Factor, ...]:
+        ids = [factor.id for factor in factors]
+        duplicates = sorted({i for i in ids if ids.count(i) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate factor ids: {', '.join(duplicates)}")
+        return factors
+
+    @property
+    def total_weight(self) -> int:
+        return sum(factor.weight for factor in self.factors)
+
+    @cached_property
+    def description(self) -> str:
+        """Scenario rendered in the legacy free-text format"""
+        return "\n\n".join(
+            f"{factor.id}) {factor.text} (waga istotności: {factor.weight})" for factor in self.factors
+        )
+
+    @cached_property
+    def fingerprint(self) -> str:
+        """Stable hash of the factors (ids, texts and weights); the id is not included"""
+        canonical = json.dumps(
+            [[factor.id, factor.title, factor.text, factor.weight] for factor in self.factors],
+            ensure_ascii=False,
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def factor(self, factor_id: str) -> Factor:
+        for factor in self.factors:
+            if factor.id == factor_id:
+                return factor
+        raise KeyError(factor_id)
+
+    def ranked_factors(self) -> List[Factor]:
+        """Factors by descending weight (ties keep declaration order)"""
+        return sorted(self.factors, key=lambda factor: -factor.weight)
+
+    def with_weights(self, weights: Dict[str, int], id: Optional[str] = None) -> "Scenario":
+        """
+        Copy of the scenario with some factor weights replaced
+
+        Args:
+            weights: Factor id -> new weight
+            id: Id of the new scenario (default: keep the current one)
+
+        Returns:
+            New validated Scenario
+        """
+        unknown = set(weights) - {factor.id for factor in self.factors}
+        if unknown:
+            raise KeyError(f"Unknown factor ids: {', '.join(sorted(unknown))}")
+        factors = [
+            {**factor.model_dump(), "weight": weights.get(factor.id, factor.weight)}
+            for factor in self.factors
+        ]
+        return Scenario.model_validate({"id": id if id is not None else self.id, "factors": factors})
+
+    @classmethod
+    def from_text(cls, description: str, total_weight: Optional[int] = None, id: Optional[str] = None) -> "Scenario":
+        """
+        Parse the legacy free-text format ("a) ... (waga istotności: 30)" paragraphs)
+
+        Text without recognizable factors becomes a single factor weighted
+        ``total_weight`` (default 100).
+
+        Args:
+            description: Scenario text
+            total_weight: Weight used when no factors can be parsed
+            id: Scenario id
+
+        Returns:
+            Scenario
+        """
+        factors = []
+        for paragraph in re.split(r"\n\s*\n", description.strip()):
+            match = FACTOR_PATTERN.match(paragraph)
+            if match is None:
+                factors = []
+                break
+            factor_id, text, weight = match.groups()
+            factors.append({"id": factor_id.lower(), "text": " ".join(text.split()), "weight": int(weight)})
+        if not factors:
+            factors = [{"id": "a", "text": description.strip(), "weight": total_weight if total_weight is not None else 100}]
+        return cls.model_validate({"id": id, "factors": factors})
+
+    @classmethod
+    def coerce(cls, value: Union["Scenario", Dict[str, Any], str]) -> "Scenario":
+        """
+        Accept a Scenario, a structured or legacy scenario dict, or plain text
+
+        Legacy dicts have 'description' and 'total_weight' (or 'weight') keys.
+        """
+        if isinstance(value, Scenario):
+            return value
+        if isinstance(value, str):
+            return cls.from_text(value)
+        if "factors" in value:
+            return cls.model_validate(value)
+        return cls.from_text(
+            value["description"],
+            total_weight=value.get("total_weight", value.get("weight")),
+            id=value.get("id"),
+        )
+
+
+DEFAULT_SCENARIO = Scenario(
+    id="default",
+    factors=(
+        Factor(
+            id="a",
+            title="Katastrofa GPU",
+            text="Wskutek zaistniałej przed miesiącem katastrofy naturalnej wiodący światowy producent procesorów graficznych stracił 60% zdolności produkcyjnych; odbudowa mocy produkcyjnych poprzez inwestycje w filie zlokalizowane na obszarach nieobjętych katastrofą potrwa do końca roku 2028",
+            weight=30,
+        ),
+        Factor(
+            id="b",
+            title="Kryzys automotive w Europie",
+            text="Przemysł motoryzacyjny w Europie (piątka głównych partnerów handlowych państwa Atlantis to kraje europejskie) bardzo wolno przestawia się na produkcję samochodów elektrycznych; rynek europejski zalewają tanie samochody elektryczne z Azji Wschodniej; europejski przemysł motoryzacyjny będzie miał w roku 2025 zyski na poziomie 30% średnich rocznych zysków z lat 2020-2024",
+            weight=15,
+        ),
+        Factor(
+            id="c",
+            title="Spadek PKB strefy euro",
+            text="PKB krajów strefy euro w roku 2025 spadnie średnio o 1,5% w stosunku do roku 2024",
+            weight=15,
+        ),
+        Factor(
+            id="d",
+            title="Rozejm na Ukrainie",
+            text="Na wschodzie Ukrainy trwa słaby rozejm; Rosja kontroluje dwie główne elektrownie ukraińskie, które pracują na potrzeby konsumentów rosyjskich; gospodarka ukraińska rozwija się w tempie 4% PKB, głównie dzięki inwestycjom w przemysł zbrojeniowy i odbudowę infrastruktury",
+            weight=10,
+        ),
+        Factor(
+            id="e",
+            title="Inwestycje w Ukrainie",
+            text="Inwestycje amerykańskie w Ukrainie kierowane są do przemysłu wydobywczego (surowce krytyczne); roczne inwestycje UE w Ukrainie są na poziomie 3% ukraińskiego PKB i utrzymają się na takim poziomie do roku 2029",
+            weight=5,
+        ),
+        Factor(
+            id="f",
+            title="Rewolucja energetyczna i spadek cen ropy",
+            text="Mamy gwałtowny wzrost udziału energii z OZE w miksie energetycznym krajów UE oraz Chin od początku roku 2028; w połowie roku 2023 średniej wielkości kraj południowoamerykański odkrył ogromne i łatwe do eksploatacji złoża ropy naftowej i gazu ziemnego dorównujące wielkością złożom Arabii Saudyjskiej i Kataru, co przełoży się pod koniec roku 2027 na nadpodaż tych paliw na światowe rynki; wzrost podaży energii z OZE oraz nadpodaż paliw węglowodorowych przekładają się na znaczny spadek cen ropy: do poziomu 30-35 USD za baryłkę; będzie to miało wpływ na budżet Rosji oraz (w mniejszym stopniu) innych krajów producentów ropy i paliw ropopochodnych",
+            weight=25,
+        ),
+    ),
+)
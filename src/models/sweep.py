@@ -0,0 +1,452 @@
+"""
+Scenario Sensitivity Sweep for Diplomind
+
+Varies factor weights of a scenario and forecasts every country at each point,
+paying for as few LLM calls as possible:
+
+- identical prompt inputs (same scenario fingerprint, country and context) are
+  computed once, also across concurrent grid points,
+- forecasts are cached by input key (optionally persisted as JSON lines),
+- one-factor sweeps are sampled adaptively: only intervals whose endpoints
+  differ in confidence by more than a threshold are bisected.
+
+Evaluated points are streamed to a CSV (or Parquet, if pyarrow is installed)
+table as soon as they complete.
+
+Usage:
+    python -m src.models.sweep --factor a --start 10 --stop 50 --step 5 --output reports/sweep_a.csv
+"""
+import argparse
+import asyncio
+import csv
+import hashlib
+import itertools
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from src.agents.forecasting_agent import ForecastOutput, generate_forecast
+from src.agents.prompt_cache import TokenLedger
+from src.agents.single_flight import SingleFlight
+from src.configuration import Configuration
+from src.models.batch_runner import ScenarioBatchRunner
+from src.models.checkpoint import read_complete_lines
+from src.models.country_registry import CountryRegistry, normalize_country_key
+from src.models.interaction_graph import InteractionGraph
+from src.models.scenario import DEFAULT_SCENARIO, Scenario
+
+logger = logging.getLogger(__name__)
+
+config = Configuration()
+
+HORIZONS = ("forecast_12_months", "forecast_36_months")
+
+
+def forecast_input_key(scenario: Scenario, country_name: str, other_countries: Sequence[Mapping]) -> str:
+    """
+    Cache key of one forecast call: everything that changes the prompt or the model
+
+    Args:
+        scenario: Scenario being forecast
+        country_name: Target country
+        other_countries: Context profiles passed to the prompt
+
+    Returns:
+        Hex digest
+    """
+    context = ",".join(normalize_country_key(c["country_name"]) for c in other_countries)
+    raw = "|".join(
+        [
+            scenario.fingerprint,
+            normalize_country_key(country_name),
+            context,
+            config.gemini_model_name,
+            str(config.gemini_temperature),
+            str(config.max_other_countries_context),
+        ]
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class ForecastCache:
+    """Forecasts by input key, optionally persisted to a JSON lines file"""
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Args:
+            path: JSON lines file to load from and append to (None = memory only)
+        """
+        self.path = path
+        self._forecasts: Dict[str, ForecastOutput] = {}
+        if path and os.path.exists(path):
+            for line_number, line in enumerate(read_complete_lines(path), 1):
+                try:
+                    record = json.loads(line)
+                    self._forecasts[record["key"]] = ForecastOutput.model_validate(record["forecast"])
+                except Exception as e:
+                    logger.warning(f"Skipping unreadable forecast cache line {line_number} in {path}: {e}")
+            logger.info(f"Loaded {len(self._forecasts)} cached forecasts from {path}")
+
+    def get(self, key: str) -> Optional[ForecastOutput]:
+        return self._forecasts.get(key)
+
+    def put(self, key: str, forecast: ForecastOutput):
+        self._forecasts[key] = forecast
+        if self.path:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            record = {"key": key, "forecast": forecast.model_dump(mode="json")}
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    def __len__(self) -> int:
+        return len(self._forecasts)
+
+
+@dataclass
+class SweepPoint:
+    """Forecasts of every country for one set of factor weights"""
+
+    weights: Dict[str, int]
+    scenario: Scenario
+    forecasts: Dict[str, ForecastOutput] = field(default_factory=dict)
+    errors: Dict[str, str] = field(default_factory=dict)
+    cached: int = 0
+    computed: int = 0
+
+    def confidence(self, country_name: str, horizon: str) -> Optional[float]:
+        forecast = self.forecasts.get(country_name)
+        return getattr(forecast, horizon).confidence if forecast else None
+
+    def rows(self) -> List[Dict]:
+        """Table rows: one per country"""
+        rows = []
+        for country_name in sorted(set(self.forecasts) | set(self.errors)):
+            rows.append({
+                **{f"weight_{factor_id}": weight for factor_id, weight in self.weights.items()},
+                "scenario_fingerprint": self.scenario.fingerprint[:16],
+                "country_name": country_name,
+                "confidence_12m": self.confidence(country_name, HORIZONS[0]),
+                "confidence_36m": self.confidence(country_name, HORIZONS[1]),
+                "status": "ok" if country_name in self.forecasts else "failed",
+            })
+        return rows
+
+
+def confidence_shift(a: SweepPoint, b: SweepPoint) -> float:
+    """Largest confidence change between two points over all countries and horizons"""
+    shift = 0.0
+    for country_name in set(a.forecasts) & set(b.forecasts):
+        for horizon in HORIZONS:
+            shift = max(shift, abs(a.confidence(country_name, horizon) - b.confidence(country_name, horizon)))
+    return shift
+
+
+class SweepResultWriter:
+    """Streams sweep rows to CSV or Parquet (chosen by file extension)"""
+
+    def __init__(self, path: str, factor_ids: Sequence[str]):
+        self.path = path
+        self.fieldnames = [f"weight_{factor_id}" for factor_id in factor_ids] + [
+            "scenario_fingerprint",
+            "country_name",
+            "confidence_12m",
+            "confidence_36m",
+            "status",
+        ]
+        self._file = None
+        self._csv = None
+        self._parquet = None
+        self.rows_written = 0
+
+    def __enter__(self) -> "SweepResultWriter":
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.path.endswith(".parquet"):
+            try:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+            except ImportError as e:
+                raise ImportError("Writing Parquet requires pyarrow: pip install pyarrow") from e
+            schema = pa.schema(
+                [(name, pa.int64()) for name in self.fieldnames if name.startswith("weight_")]
+                + [
+                    ("scenario_fingerprint", pa.string()),
+                    ("country_name", pa.string()),
+                    ("confidence_12m", pa.float64()),
+                    ("confidence_36m", pa.float64()),
+                    ("status", pa.string()),
+                ]
+            )
+            self._parquet = (pa, pq.ParquetWriter(self.path, schema), schema)
+        else:
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            self._csv = csv.DictWriter(self._file, fieldnames=self.fieldnames)
+            self._csv.writeheader()
+        return self
+
+    def write(self, point: SweepPoint):
+        rows = point.rows()
+        if not rows:
+            return
+        if self._parquet is not None:
+            pa, writer, schema = self._parquet
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+        else:
+            self._csv.writerows(rows)
+            self._file.flush()
+        self.rows_written += len(rows)
+
+    def __exit__(self, *exc):
+        if self._parquet is not None:
+            self._parquet[1].close()
+        if self._file is not None:
+            self._file.close()
+        logger.info(f"Sweep results written to {self.path} ({self.rows_written} rows)")
+
+
+class SweepEngine:
+    """
+    Forecasts weight variants of a base scenario with caching and deduplication
+    """
+
+    def __init__(
+        self,
+        base: Scenario = DEFAULT_SCENARIO,
+        resources_dir: str = "resources",
+        countries: Optional[CountryRegistry] = None,
+        graph: Optional[InteractionGraph] = None,
+        cache: Optional[ForecastCache] = None,
+        max_concurrency: Optional[int] = None,
+    ):
+        """
+        Args:
+            base: Scenario whose factor weights are varied
+            resources_dir: Directory containing country JSON files
+            countries: Preloaded country registry (default: shared registry)
+            graph: Prebuilt interaction graph (default: built from the registry)
+            cache: Forecast cache (default: in-memory)
+            max_concurrency: Maximum forecasts in flight (default from configuration)
+        """
+        self.base = base
+        # Exploration does not depend on weights: run it once for the whole sweep
+        self._runner = ScenarioBatchRunner([base], resources_dir=resources_dir, countries=countries, graph=graph)
+        self.context = self._runner.explore()
+        self.countries = self._runner.model.countries
+        self.cache = cache if cache is not None else ForecastCache()
+        self.token_ledger = TokenLedger()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._max_concurrency = max_concurrency or config.batch_max_concurrency
+        self._inflight: SingleFlight[ForecastOutput] = SingleFlight()
+        self._evaluating: SingleFlight[SweepPoint] = SingleFlight()
+        # Completed points only; concurrent requests for one point share _evaluating
+        self._points: Dict[str, SweepPoint] = {}
+        self.stats = {"points": 0, "computed": 0, "cached": 0, "deduplicated": 0}
+
+    async def _forecast(self, scenario: Scenario, country_name: str) -> Tuple[ForecastOutput, str]:
+        """Returns (forecast, source) where source is 'cached', 'shared' or 'computed'"""
+        other_countries = self.context[country_name]
+        key = forecast_input_key(scenario, country_name, other_countries)
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached, "cached"
+
+        async def compute() -> ForecastOutput:
+            async with self._semaphore:
+                forecast = await generate_forecast(
+                    country_name=country_name,
+                    country_resources=self.countries[country_name],
+                    other_countries=other_countries,
+                    scenario=scenario,
+                    token_ledger=self.token_ledger,
+                )
+            self.cache.put(key, forecast)
+            return forecast
+
+        forecast, shared = await self._inflight.do(key, compute)
+        return forecast, "shared" if shared else "computed"
+
+    async def evaluate(self, weights: Dict[str, int]) -> SweepPoint:
+        """
+        Forecast every country for one set of factor weights
+
+        Args:
+            weights: Factor id -> weight (unlisted factors keep the base weight)
+
+        Returns:
+            SweepPoint (memoized by scenario fingerprint)
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Each synchronous wrapper call runs in a fresh event loop
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._inflight = SingleFlight()
+            self._evaluating = SingleFlight()
+        scenario = self.base.with_weights(weights)
+        point = self._points.get(scenario.fingerprint)
+        if point is None:
+            point, shared = await self._evaluating.do(scenario.fingerprint, lambda: self._evaluate(scenario))
+            if not shared:
+                return point
+        self.stats["deduplicated"] += len(self.context)
+        return point
+
+    async def _evaluate(self, scenario: Scenario) -> SweepPoint:
+        point = SweepPoint(weights={f.id: f.weight for f in scenario.factors}, scenario=scenario)
+        self.stats["points"] += 1
+
+        async def run(country_name: str):
+            try:
+                forecast, source = await self._forecast(scenario, country_name)
+            except Exception as e:
+                logger.error(f"Sweep forecast for {country_name} at {point.weights} failed: {e}")
+                point.errors[country_name] = str(e)
+                return
+            point.forecasts[country_name] = forecast
+            if source == "computed":
+                point.computed += 1
+                self.stats["computed"] += 1
+            elif source == "cached":
+                point.cached += 1
+                self.stats["cached"] += 1
+            else:
+                self.stats["deduplicated"] += 1
+
+        await asyncio.gather(*(run(country_name) for country_name in self.context))
+        self._points[scenario.fingerprint] = point
+        return point
+
+    async def asweep_factor(
+        self,
+        factor_id: str,
+        values: Sequence[int],
+        writer: Optional[SweepResultWriter] = None,
+        threshold: Optional[float] = None,
+        max_points: Optional[int] = None,
+    ) -> List[SweepPoint]:
+        """
+        Adaptive one-factor sweep
+
+        The endpoints are always evaluated; an interval is bisected only while
+        the confidence shift between its endpoints exceeds ``threshold``.
+
+        Args:
+            factor_id: Factor to vary
+            values: Candidate weights (sorted, deduplicated internally)
+            writer: Optional streaming result writer
+            threshold: Confidence shift that triggers refinement (default from configuration)
+            max_points: Upper bound of evaluated points (default from configuration)
+
+        Returns:
+            Evaluated points sorted by weight
+        """
+        self.base.factor(factor_id)  # KeyError for unknown factors
+        values = sorted(set(values))
+        if not values:
+            return []
+        threshold = config.sweep_confidence_threshold if threshold is None else threshold
+        max_points = max_points or config.sweep_max_points
+
+        evaluated: Dict[int, SweepPoint] = {}
+
+        async def evaluate_indices(indices: List[int]):
+            points = await asyncio.gather(*(self.evaluate({factor_id: values[i]}) for i in indices))
+            for i, point in zip(indices, points):
+                evaluated[i] = point
+                if writer is not None:
+                    writer.write(point)
+
+        await evaluate_indices(sorted({0, len(values) - 1}))
+        intervals = [(0, len(values) - 1)] if len(values) > 1 else []
+        while intervals and len(evaluated) < max_points:
+            refine = [
+                (lo, hi)
+                for lo, hi in intervals
+                if hi - lo > 1 and confidence_shift(evaluated[lo], evaluated[hi]) > threshold
+            ]
+            refine = refine[: max_points - len(evaluated)]
+            if not refine:
+                break
+            midpoints = [(lo + hi) // 2 for lo, hi in refine]
+            await evaluate_indices(midpoints)
+            intervals = [half for (lo, hi), mid in zip(refine, midpoints) for half in ((lo, mid), (mid, hi))]
+
+        skipped = len(values) - len(evaluated)
+        logger.info(
+            f"Sweep of factor {factor_id}: {len(evaluated)}/{len(values)} points evaluated, "
+            f"{skipped} skipped as stable; {self.stats}"
+        )
+        return [evaluated[i] for i in sorted(evaluated)]
+
+    async def agrid(
+        self, grid: Dict[str, Sequence[int]], writer: Optional[SweepResultWriter] = None
+    ) -> List[SweepPoint]:
+        """
+        Exhaustive sweep over the cartesian product of factor weights
+
+        Args:
+            grid: Factor id -> candidate weights
+            writer: Optional streaming result writer
+
+        Returns:
+            Evaluated points in grid order
+        """
+        factor_ids = list(grid)
+        for factor_id in factor_ids:
+            self.base.factor(factor_id)
+
+        async def evaluate(weights: Dict[str, int]) -> SweepPoint:
+            point = await self.evaluate(weights)
+            if writer is not None:
+                writer.write(point)
+            return point
+
+        combinations = itertools.product(*(sorted(set(grid[f])) for f in factor_ids))
+        points = await asyncio.gather(
+            *(evaluate(dict(zip(factor_ids, combination))) for combination in combinations)
+        )
+        logger.info(f"Grid sweep over {factor_ids}: {len(points)} points; {self.stats}")
+        return list(points)
+
+    def sweep_factor(self, factor_id: str, values: Sequence[int], **kwargs) -> List[SweepPoint]:
+        """Synchronous wrapper around asweep_factor()"""
+        return asyncio.run(self.asweep_factor(factor_id, values, **kwargs))
+
+    def grid(self, grid: Dict[str, Sequence[int]], **kwargs) -> List[SweepPoint]:
+        """Synchronous wrapper around agrid()"""
+        return asyncio.run(self.agrid(grid, **kwargs))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sweep one factor weight of the default scenario")
+    parser.add_argument("--factor", required=True, help="Factor id (e.g. 'a')")
+    parser.add_argument("--start", type=int, required=True)
+    parser.add_argument("--stop", type=int, required=True, help="Inclusive upper weight")
+    parser.add_argument("--step", type=int, default=5)
+    parser.add_argument("--output", default=os.path.join(config.report_dir, "sweep.csv"))
+    parser.add_argument("--cache", default=None, help="JSON lines forecast cache to reuse")
+    parser.add_argument("--threshold", type=float, default=None)
+    parser.add_argument("--max-points", type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=getattr(logging, config.log_level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+    engine = SweepEngine(cache=ForecastCache(args.cache))
+    values = range(args.start, args.stop + 1, args.step)
+    with SweepResultWriter(args.output, [f.id for f in engine.base.factors]) as writer:
+        engine.sweep_factor(
+            args.factor, values, writer=writer, threshold=args.threshold, max_points=args.max_points
+        )
+    logger.info(f"Tokens: {engine.token_ledger.summary()}")
+
+
+if __name__ == "__main__":
+    main()
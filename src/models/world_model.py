@@ -3,14 +3,23 @@
 World Model for Diplomind
 """
 import mesa
-import os
-import json
+import asyncio
 import logging
-from typing import List, Dict, Optional
+from typing import Any, Callable, List, Dict, Optional, Union
 from src.agents.country_agent import CountryAgent
+from src.agents.forecasting_agent import ForecastOutput
+from src.agents.prompt_cache import TokenLedger
+from src.configuration import Configuration
+from src.models.checkpoint import SimulationCheckpoint
+from src.models.country_registry import CountryRegistry, load_country_registry
+from src.models.interaction_graph import InteractionGraph
+from src.models.relevance import Encoder, RelevanceIndex
+from src.models.scenario import DEFAULT_SCENARIO, Scenario
 
 logger = logging.getLogger(__name__)
 
+config = Configuration()
+
 
 class WorldModel(mesa.Model):
     """
@@ -18,88 +27,169 @@ class WorldModel(mesa.Model):
     Manages the simulation lifecycle: exploration → forecasting → reporting
     """
     
-    def __init__(self, scenario: Optional[Dict] = None, resources_dir: str = 'resources'):
+    def __init__(
+        self,
+        scenario: Optional[Union[Scenario, Dict[str, Any]]] = None,
+        resources_dir: str = 'resources',
+        countries: Optional[CountryRegistry] = None,
+        graph: Optional[InteractionGraph] = None,
+        exploration_radius: Optional[int] = None,
+        checkpoint_path: Optional[str] = None,
+        resume: bool = False,
+    ):
         """
         Initialize the World Model
         
         Args:
-            scenario: Dictionary with 'description' and 'total_weight' keys.
-                     If None, uses default complex scenario.
+            scenario: Scenario (or a legacy dictionary with 'description' and
+                     'total_weight' keys). If None, uses default complex scenario.
             resources_dir: Directory containing country JSON files
+            countries: Preloaded country registry (shared, e.g. across scenarios).
+                       If None, the process-wide registry for resources_dir is used.
+            graph: Prebuilt interaction graph. If None, built from the registry's
+                   bilateral relations.
+            exploration_radius: Hops of the interaction graph each agent explores
+                                (default from configuration)
+            checkpoint_path: JSON lines file receiving every completed forecast.
+                             If None, the run is not checkpointed.
+            resume: Restore completed forecasts from checkpoint_path and skip
+                    those countries (failed ones are retried)
         """
         super().__init__()
-        self.my_agents: List[CountryAgent] = []
+        # Agents live in Mesa's AgentSet (self.agents); this index gives O(1) lookup
+        self._agents_by_key: Dict[str, CountryAgent] = {}
         
         # Set scenario (use provided or default)
         if scenario is None:
             self.scenario = self._get_default_scenario()
         else:
-            self.scenario = scenario
+            self.scenario = Scenario.coerce(scenario)
+
+        # Load all countries (registry is loaded once per process and shared)
+        self.countries = countries if countries is not None else load_country_registry(resources_dir)
+        self.graph = graph if graph is not None else InteractionGraph.from_registry(self.countries)
+        self.exploration_radius = (
+            exploration_radius if exploration_radius is not None else config.exploration_radius
+        )
+        self.max_context_countries = config.max_other_countries_context
+        # Agents forecasting at once within one step (LLM calls are also rate limited by the gateway)
+        self.max_concurrency = config.batch_max_concurrency
+        self._relevance: Optional[RelevanceIndex] = None
+        # Token usage of every forecast call in this run
+        self.token_ledger = TokenLedger()
+        # Called with (country name, forecast) as soon as each forecast completes
+        self._forecast_listeners: List[Callable[[str, ForecastOutput], None]] = []
+        self._load_countries()
         
-        # Load all countries from resources directory
-        self._load_countries(resources_dir)
+        self.checkpoint: Optional[SimulationCheckpoint] = None
+        if checkpoint_path:
+            self.checkpoint = SimulationCheckpoint(checkpoint_path, self.scenario, resume=resume)
+            self._restore_from_checkpoint()
         
-        logger.info(f"WorldModel initialized with {len(self.my_agents)} countries")
-        logger.info(f"Scenario weight: {self.scenario.get('total_weight', 100)}/100")
+        logger.info(f"WorldModel initialized with {len(self._agents_by_key)} countries")
+        logger.info(f"Scenario weight: {self.scenario.total_weight}/100")
     
-    def _get_default_scenario(self) -> Dict:
+    def _get_default_scenario(self) -> Scenario:
         """
         Get the default complex multi-factor scenario
         
         Returns:
-            Dictionary with scenario description and total_weight
+            Scenario with six weighted factors (total weight 100)
         """
-        return {
-            "description": """
-a) Wskutek zaistniałej przed miesiącem katastrofy naturalnej wiodący światowy producent procesorów graficznych stracił 60% zdolności produkcyjnych; odbudowa mocy produkcyjnych poprzez inwestycje w filie zlokalizowane na obszarach nieobjętych katastrofą potrwa do końca roku 2028 (waga istotności: 30)
-
-b) Przemysł motoryzacyjny w Europie (piątka głównych partnerów handlowych państwa Atlantis to kraje europejskie) bardzo wolno przestawia się na produkcję samochodów elektrycznych; rynek europejski zalewają tanie samochody elektryczne z Azji Wschodniej; europejski przemysł motoryzacyjny będzie miał w roku 2025 zyski na poziomie 30% średnich rocznych zysków z lat 2020-2024 (waga istotności: 15)
-
-c) PKB krajów strefy euro w roku 2025 spadnie średnio o 1,5% w stosunku do roku 2024 (waga istotności: 15)
-
-d) Na wschodzie Ukrainy trwa słaby rozejm; Rosja kontroluje dwie główne elektrownie ukraińskie, które pracują na potrzeby konsumentów rosyjskich; gospodarka ukraińska rozwija się w tempie 4% PKB, głównie dzięki inwestycjom w przemysł zbrojeniowy i odbudowę infrastruktury (waga istotności: 10)
+        return DEFAULT_SCENARIO
+    
+    def _load_countries(self):
+        """
+        Create one agent per country in the registry
+        """
+        if not len(self.countries):
+            logger.warning("No countries available in the registry")
+            return
+        
+        for country_name in self.countries.names:
+            agent = CountryAgent(self, country_name)
+            self._agents_by_key[agent.country_key] = agent
+            logger.debug(f"Loaded country: {country_name}")
 
-e) Inwestycje amerykańskie w Ukrainie kierowane są do przemysłu wydobywczego (surowce krytyczne); roczne inwestycje UE w Ukrainie są na poziomie 3% ukraińskiego PKB i utrzymają się na takim poziomie do roku 2029 (waga istotności: 5)
+    def _restore_from_checkpoint(self):
+        """
+        Mark countries with a checkpointed forecast as done
+        """
+        for country_name, forecast in self.checkpoint.forecasts.items():
+            agent = self.get_agent_by_country_name(country_name)
+            if agent is None:
+                logger.warning(f"Checkpointed country {country_name} is not in the registry; ignoring")
+                continue
+            agent.forecasts = forecast
+            agent.explored_countries = [
+                self.countries[name] for name in self.checkpoint.explored.get(country_name, [])
+                if name in self.countries
+            ]
+            agent.state = "done"
+        restored = len(self.get_forecasts())
+        if restored:
+            logger.info(f"Restored {restored} completed forecasts from {self.checkpoint.path}")
 
-f) Mamy gwałtowny wzrost udziału energii z OZE w miksie energetycznym krajów UE oraz Chin od początku roku 2028; w połowie roku 2023 średniej wielkości kraj południowoamerykański odkrył ogromne i łatwe do eksploatacji złoża ropy naftowej i gazu ziemnego dorównujące wielkością złożom Arabii Saudyjskiej i Kataru, co przełoży się pod koniec roku 2027 na nadpodaż tych paliw na światowe rynki; wzrost podaży energii z OZE oraz nadpodaż paliw węglowodorowych przekładają się na znaczny spadek cen ropy: do poziomu 30-35 USD za baryłkę; będzie to miało wpływ na budżet Rosji oraz (w mniejszym stopniu) innych krajów producentów ropy i paliw ropopochodnych (waga istotności: 25)
-            """.strip(),
-            "total_weight": 100  # Sum of all scenario weights
-        }
-    
-    def _load_countries(self, resources_dir: str):
+    def add_forecast_listener(self, listener: Callable[[str, ForecastOutput], None]):
         """
-        Load all countries from JSON files in the resources directory
+        Register a callback invoked as soon as a country's forecast completes
+        (e.g. IncrementalReportWriter.add_country). Forecasts restored from a
+        checkpoint are not replayed; read them with get_forecasts().
         
         Args:
-            resources_dir: Path to directory containing country JSON files
+            listener: Callable taking the country name and its ForecastOutput
         """
-        if not os.path.exists(resources_dir):
-            logger.error(f"Resources directory not found: {resources_dir}")
-            raise FileNotFoundError(f"Resources directory not found: {resources_dir}")
-        
-        json_files = [f for f in os.listdir(resources_dir) if f.endswith('.json')]
-        
-        if not json_files:
-            logger.warning(f"No country JSON files found in {resources_dir}")
-            return
+        self._forecast_listeners.append(listener)
+
+    def forecast_finished(self, agent: CountryAgent):
+        """
+        Checkpoint the outcome of an agent's forecast and notify listeners
         
-        for filename in json_files:
-            try:
-                filepath = os.path.join(resources_dir, filename)
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # Create country agent
-                country_name = data.get("country_name", filename[:-5])
-                agent = CountryAgent(self, country_name)
-                self.my_agents.append(agent)
-                
-                logger.debug(f"Loaded country: {country_name}")
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Failed to parse JSON file {filename}: {e}")
-            except Exception as e:
-                logger.error(f"Failed to load country from {filename}: {e}")
+        Args:
+            agent: Agent that just finished (state 'done' or 'failed')
+        """
+        country_name = agent.resources['country_name']
+        if agent.state == "done":
+            if self.checkpoint is not None:
+                explored = [profile['country_name'] for profile in agent.explored_countries]
+                self.checkpoint.record_forecast(country_name, agent.forecasts, explored)
+            for listener in self._forecast_listeners:
+                try:
+                    listener(country_name, agent.forecasts)
+                except Exception as e:
+                    logger.error(f"Forecast listener failed for {country_name}: {e}", exc_info=True)
+        elif agent.state == "failed" and self.checkpoint is not None:
+            self.checkpoint.record_failure(country_name, agent.error or "")
+
+    @property
+    def relevance(self) -> RelevanceIndex:
+        """Pairwise country relevance, computed once per model (scenario-aware)"""
+        if self._relevance is None:
+            self._relevance = RelevanceIndex(
+                self.countries,
+                self.graph,
+                scenario_text=self.scenario.description,
+                encoder=self._relevance_encoder(),
+            )
+        return self._relevance
+
+    def _relevance_encoder(self) -> Optional[Encoder]:
+        """Sentence-embedding encoder if enabled in the configuration (None: hashed TF-IDF)"""
+        if not config.relevance_use_embeddings:
+            return None
+        try:
+            # Heavy import (torch); only needed when embeddings are enabled
+            from src.embeddings import load_sentence_model
+            model = load_sentence_model(config.relevance_embedding_model)
+        except Exception as e:
+            logger.warning(f"Embedding model unavailable, using TF-IDF relevance: {e}")
+            return None
+        return lambda texts: model.encode(texts, convert_to_numpy=True)
+
+    @property
+    def my_agents(self) -> List[CountryAgent]:
+        """Country agents in registry order (kept for backwards compatibility)"""
+        return list(self._agents_by_key.values())
     
     def step(self):
         """
@@ -107,41 +197,96 @@ f) Mamy gwałtowny wzrost udziału energii z OZE w miksie energetycznym krajów
         Each agent processes according to its current state:
         - exploring: Discover other countries
         - forecast_scenario: Generate AI forecasts
-        - done: No action
+        - done / failed: No action
+
+        Runs astep()'s agent round in one event loop for the whole step, so it
+        must not be called from a running loop; await astep() there.
         """
-        for agent in self.my_agents:
-            agent.step()
+        asyncio.run(self._step_agents())
+
+    async def astep(self):
+        """
+        Async version of step(): agents forecast concurrently (at most
+        max_concurrency at a time) in the current event loop, e.g. the API's.
+        """
+        # Mesa only counts steps for the synchronous step()
+        self.steps += 1
+        await self._step_agents()
+
+    async def _step_agents(self):
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def step_agent(agent: CountryAgent):
+            async with semaphore:
+                await agent.astep()
+
+        await asyncio.gather(*(step_agent(agent) for agent in self.my_agents))
     
     def run_exploration(self):
-        """Run the exploration phase - agents discover each other"""
-        logger.info("="*80)
-        logger.info("PHASE 1: EXPLORATION")
-        logger.info("="*80)
-        self.step()
+        """
+        Run the exploration phase - agents discover each other
+        Exploration does no I/O, so it needs no event loop and may also be
+        called from a running one (e.g. ScenarioBatchRunner.arun()).
+        """
+        self._log_phase("PHASE 1: EXPLORATION")
+        # Counted as one step, like step()
+        self.steps += 1
+        for agent in self.my_agents:
+            if agent.state == "exploring":
+                agent.explore()
+
+    async def arun_exploration(self):
+        """Async version of run_exploration()"""
+        self._log_phase("PHASE 1: EXPLORATION")
+        await self.astep()
     
     def run_forecasting(self):
-        """Run the forecasting phase - agents generate AI forecasts"""
-        logger.info("="*80)
-        logger.info("PHASE 2: FORECASTING")
-        logger.info("="*80)
-        self.step()
+        """
+        Run the forecasting phase - agents generate AI forecasts
+        Must not be called from a running event loop; use arun_forecasting() there.
+        """
+        asyncio.run(self.arun_forecasting())
+
+    async def arun_forecasting(self):
+        """Async version of run_forecasting()"""
+        self._log_phase("PHASE 2: FORECASTING")
+        await self.astep()
+        self._log_failures()
     
     def run_simulation(self):
         """
         Run complete simulation: exploration + forecasting
-        Convenience method that runs both phases
+        Convenience method that runs both phases.
+        Must not be called from a running event loop; use arun_simulation() there.
+        """
+        asyncio.run(self.arun_simulation())
+
+    async def arun_simulation(self):
+        """
+        Run complete simulation (exploration + forecasting) in the current event loop
         """
         logger.info("Starting complete simulation")
-        logger.info(f"Scenario preview: {self.scenario['description'][:200]}...")
-        logger.info(f"Total Weight: {self.scenario['total_weight']}/100")
+        logger.info(f"Scenario preview: {self.scenario.description[:200]}...")
+        logger.info(f"Total Weight: {self.scenario.total_weight}/100")
         
-        self.run_exploration()
-        self.run_forecasting()
+        await self.arun_exploration()
+        await self.arun_forecasting()
         
         logger.info("="*80)
         logger.info("SIMULATION COMPLETE")
+        logger.info(f"Token budget: {self.token_ledger.summary()}")
+        logger.info("="*80)
+
+    def _log_phase(self, title: str):
+        logger.info("="*80)
+        logger.info(title)
         logger.info("="*80)
     
+    def _log_failures(self):
+        failed = self.get_failed_countries()
+        if failed:
+            logger.warning(f"Forecasting failed for {len(failed)} countries: {', '.join(failed)}")
+
     def get_forecasts(self) -> List[Dict]:
         """
         Collect all forecasts from agents
@@ -157,9 +302,22 @@ f) Mamy gwałtowny wzrost udziału energii z OZE w miksie energetycznym krajów
                     'forecast': agent.forecasts
                 })
         
-        logger.info(f"Collected forecasts from {len(forecasts_data)}/{len(self.my_agents)} countries")
+        logger.info(f"Collected forecasts from {len(forecasts_data)}/{len(self._agents_by_key)} countries")
         return forecasts_data
     
+    def get_failed_countries(self) -> Dict[str, str]:
+        """
+        Countries whose forecast failed
+
+        Returns:
+            Dictionary country name -> error message
+        """
+        return {
+            agent.resources['country_name']: agent.error
+            for agent in self.my_agents
+            if agent.state == "failed"
+        }
+
     def get_country_names(self) -> List[str]:
         """
         Get list of all country names in the simulation
@@ -179,10 +337,8 @@ f) Mamy gwałtowny wzrost udziału energii z OZE w miksie energetycznym krajów
         Returns:
             CountryAgent or None if not found
         """
-        for agent in self.my_agents:
-            if agent.resources['country_name'] == country_name:
-                return agent
-        return None
+        key = self.countries.key_of(country_name)
+        return self._agents_by_key.get(key) if key is not None else None
     
     def __repr__(self):
-        return f"WorldModel(countries={len(self.my_agents)}, scenario_weight={self.scenario.get('total_weight', 100)})"
+        return f"WorldModel(countries={len(self._agents_by_key)}, scenario_weight={self.scenario.total_weight})"
@@ -0,0 +1,135 @@
+"""
+In-memory registry of agent prompt files.
+
+Prompts are read and hashed once, served from memory and reloaded only when a
+file's mtime changes (checked at most once per ``reload_interval`` seconds).
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+
+logger = logging.getLogger(__name__)
+
+PROMPTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "prompts")
+
+
+@dataclass(frozen=True)
+class PromptEntry:
+    name: str
+    path: str
+    text: str
+    sha256: str
+    mtime: float
+
+
+class PromptRegistry:
+    """Loads every ``*.md`` prompt in a directory and keeps them in memory."""
+
+    def __init__(self, prompts_dir: str = PROMPTS_DIR, reload_interval: float = 2.0):
+        """
+        Args:
+            prompts_dir: Directory with prompt markdown files
+            reload_interval: Minimum seconds between mtime checks
+        """
+        self.prompts_dir = prompts_dir
+        self.reload_interval = reload_interval
+        self._entries: Dict[str, PromptEntry] = {}
+        self._version = ""
+        self._checked_at = 0.0
+        self._listeners: List[Callable[[PromptEntry], None]] = []
+        self._lock = threading.Lock()
+        self.reload()
+
+    @staticmethod
+    def _read(name: str, path: str) -> PromptEntry:
+        with open(path, "rb") as f:
+            raw = f.read()
+        return PromptEntry(
+            name=name,
+            path=path,
+            text=raw.decode("utf-8"),
+            sha256=hashlib.sha256(raw).hexdigest(),
+            mtime=os.stat(path).st_mtime,
+        )
+
+    def reload(self) -> List[str]:
+        """
+        Re-read prompt files whose mtime changed and drop prompts whose file is gone.
+
+        Returns:
+            Names of prompts that were (re)loaded
+        """
+        changed = []
+        with self._lock:
+            self._checked_at = time.monotonic()
+            if not os.path.isdir(self.prompts_dir):
+                raise FileNotFoundError(f"Prompts directory not found: {self.prompts_dir}")
+
+            filenames = sorted(f for f in os.listdir(self.prompts_dir) if f.endswith(".md"))
+            removed = sorted(set(self._entries) - {filename[:-3] for filename in filenames})
+            for name in removed:
+                del self._entries[name]
+
+            for filename in filenames:
+                name = filename[:-3]
+                path = os.path.join(self.prompts_dir, filename)
+                entry = self._entries.get(name)
+                if entry is not None and entry.mtime == os.stat(path).st_mtime:
+                    continue
+                new_entry = self._read(name, path)
+                if entry is not None and entry.sha256 == new_entry.sha256:
+                    self._entries[name] = new_entry
+                    continue
+                self._entries[name] = new_entry
+                changed.append(name)
+
+            if changed or removed:
+                digest = hashlib.sha256()
+                for name in sorted(self._entries):
+                    digest.update(f"{name}:{self._entries[name].sha256};".encode())
+                self._version = digest.hexdigest()
+
+        for name in removed:
+            logger.info(f"Prompt '{name}' removed")
+        for name in changed:
+            logger.info(f"Loaded prompt '{name}' ({self._entries[name].sha256[:12]})")
+            for listener in self._listeners:
+                listener(self._entries[name])
+        return changed
+
+    def _maybe_reload(self):
+        if time.monotonic() - self._checked_at >= self.reload_interval:
+            try:
+                self.reload()
+            except OSError as e:
+                logger.warning(f"Prompt reload failed, serving cached prompts: {e}")
+
+    def entry(self, name: str) -> PromptEntry:
+        """Get a prompt entry by name (file stem, e.g. "root")."""
+        self._maybe_reload()
+        try:
+            return self._entries[name]
+        except KeyError as e:
+            raise FileNotFoundError(f"System prompt not found: {name}") from e
+
+    def get(self, name: str) -> str:
+        """Get prompt text by name."""
+        return self.entry(name).text
+
+    @property
+    def version(self) -> str:
+        """Combined hash of all prompts; changes whenever any prompt changes."""
+        self._maybe_reload()
+        return self._version
+
+    def on_change(self, listener: Callable[[PromptEntry], None]):
+        """Register a callback invoked with the new entry after a prompt changes."""
+        self._listeners.append(listener)
+
+
+prompt_registry = PromptRegistry()
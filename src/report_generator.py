@@ -2,21 +2,26 @@
 PDF Report Generator for Geopolitical Forecasts
 Generates professional PDF reports with forecasts and Chain of Thought analysis
 """
+import itertools
 import logging
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
-from typing import List, Dict
+from typing import Callable, List, Dict, Optional
+from pypdf import PdfWriter
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import A4, letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from reportlab.lib.units import inch
 from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle,
     PageBreak, KeepTogether, Indenter
 )
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_JUSTIFY
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
 from src.configuration import Configuration
+from src.report_styles import get_fonts, get_stylesheet, with_fallback_glyphs
+from src.models.scenario import Scenario
 
 logger = logging.getLogger(__name__)
 
@@ -40,115 +45,51 @@ class ForecastReportGenerator:
         
         self.output_path = output_path
         
-        # Get page size from config
-        page_size = A4 if config.report_page_size.upper() == "A4" else letter
+        self.doc = self._document(output_path)
+        # Fonts and styles are registered once per process and shared
+        self.fonts = get_fonts()
+        self.styles = get_stylesheet()
+        self.story = []
         
-        self.doc = SimpleDocTemplate(
-            output_path,
+    @staticmethod
+    def _document(path: str) -> SimpleDocTemplate:
+        """Document template with the configured page size and margins"""
+        page_size = A4 if config.report_page_size.upper() == "A4" else letter
+        return SimpleDocTemplate(
+            path,
             pagesize=page_size,
             rightMargin=72,
             leftMargin=72,
             topMargin=72,
             bottomMargin=18,
         )
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-        self.story = []
-        
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#1a237e'),
-            spaceAfter=30,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='CustomSubtitle',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#283593'),
-            spaceAfter=12,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Section header style
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading3'],
-            fontSize=14,
-            textColor=colors.HexColor('#3949ab'),
-            spaceAfter=6,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Subsection style
-        self.styles.add(ParagraphStyle(
-            name='Subsection',
-            parent=self.styles['Heading4'],
-            fontSize=12,
-            textColor=colors.HexColor('#5e35b1'),
-            spaceAfter=6,
-            fontName='Helvetica-Bold'
-        ))
-        
-        # Body text with justify
-        self.styles.add(ParagraphStyle(
-            name='BodyJustify',
-            parent=self.styles['BodyText'],
-            fontSize=10,
-            alignment=TA_JUSTIFY,
-            spaceAfter=6
-        ))
-        
-        # Indented text
-        self.styles.add(ParagraphStyle(
-            name='IndentedText',
-            parent=self.styles['BodyText'],
-            fontSize=10,
-            leftIndent=20,
-            spaceAfter=6
-        ))
-        
-        # Bullet point style (custom name to avoid conflict)
-        self.styles.add(ParagraphStyle(
-            name='CustomBullet',
-            parent=self.styles['BodyText'],
-            fontSize=10,
-            leftIndent=20,
-            bulletIndent=10,
-            spaceAfter=3
-        ))
-        
+
+    def _paragraph(self, text: str, style) -> Paragraph:
+        """Paragraph whose icons fall back to the emoji font (or are dropped)"""
+        return Paragraph(with_fallback_glyphs(text, self.fonts), style)
+
     def add_title_page(self, title: str, subtitle: str = None, scenario: str = None):
         """Add title page to report"""
         # Main title
         self.story.append(Spacer(1, 2*inch))
-        self.story.append(Paragraph(title, self.styles['CustomTitle']))
+        self.story.append(self._paragraph(title, self.styles['CustomTitle']))
         
         if subtitle:
             self.story.append(Spacer(1, 0.5*inch))
-            self.story.append(Paragraph(subtitle, self.styles['CustomSubtitle']))
+            self.story.append(self._paragraph(subtitle, self.styles['CustomSubtitle']))
         
         # Date and scenario
         self.story.append(Spacer(1, 1*inch))
         date_str = datetime.now().strftime("%d %B %Y, %H:%M")
-        self.story.append(Paragraph(f"<b>Data wygenerowania:</b> {date_str}", self.styles['BodyJustify']))
+        self.story.append(self._paragraph(f"<b>Data wygenerowania:</b> {date_str}", self.styles['BodyJustify']))
         
         if scenario:
             self.story.append(Spacer(1, 0.3*inch))
-            self.story.append(Paragraph("<b>Scenariusz Globalny:</b>", self.styles['SectionHeader']))
+            self.story.append(self._paragraph("<b>Scenariusz Globalny:</b>", self.styles['SectionHeader']))
             # Split long scenario into paragraphs
             for line in scenario.split('\n'):
                 if line.strip():
-                    self.story.append(Paragraph(line.strip(), self.styles['BodyJustify']))
+                    self.story.append(self._paragraph(line.strip(), self.styles['BodyJustify']))
                     self.story.append(Spacer(1, 6))
         
         self.story.append(PageBreak())
@@ -163,13 +104,13 @@ class ForecastReportGenerator:
             scenario_weight: Total weight of the scenario
         """
         # Country header
-        self.story.append(Paragraph(
+        self.story.append(self._paragraph(
             f"Analiza Prognostyczna: {country_name}",
             self.styles['CustomTitle']
         ))
         self.story.append(Spacer(1, 12))
         
-        self.story.append(Paragraph(
+        self.story.append(self._paragraph(
             f"<b>Waga scenariusza:</b> {scenario_weight}/100",
             self.styles['BodyJustify']
         ))
@@ -190,52 +131,52 @@ class ForecastReportGenerator:
     def _add_forecast_section(self, forecast, timeframe: str):
         """Add a single forecast section (12 or 36 months)"""
         # Timeframe header
-        self.story.append(Paragraph(
+        self.story.append(self._paragraph(
             f"📅 Prognoza na {timeframe}",
             self.styles['CustomSubtitle']
         ))
         self.story.append(Spacer(1, 12))
         
         # Chain of Thought section
-        self.story.append(Paragraph(
+        self.story.append(self._paragraph(
             "🔍 CHAIN OF THOUGHT (Wyjaśnialność)",
             self.styles['SectionHeader']
         ))
         
         # Historical facts
-        self.story.append(Paragraph("📚 Fakty historyczne i obecne trendy:", self.styles['Subsection']))
+        self.story.append(self._paragraph("📚 Fakty historyczne i obecne trendy:", self.styles['Subsection']))
         for i, fact in enumerate(forecast.historical_facts, 1):
-            self.story.append(Paragraph(f"{i}. {fact}", self.styles['IndentedText']))
+            self.story.append(self._paragraph(f"{i}. {fact}", self.styles['IndentedText']))
         self.story.append(Spacer(1, 12))
         
         # Correlations
-        self.story.append(Paragraph("🔗 Zidentyfikowane korelacje:", self.styles['Subsection']))
+        self.story.append(self._paragraph("🔗 Zidentyfikowane korelacje:", self.styles['Subsection']))
         for i, corr in enumerate(forecast.identified_correlations, 1):
-            self.story.append(Paragraph(f"<b>{i}. Korelacja między:</b>", self.styles['IndentedText']))
-            self.story.append(Paragraph(f"• {corr.fact_1}", self.styles['IndentedText']))
-            self.story.append(Paragraph(f"• {corr.fact_2}", self.styles['IndentedText']))
-            self.story.append(Paragraph(f"→ <i>{corr.correlation_description}</i>", self.styles['IndentedText']))
-            self.story.append(Paragraph(f"⚡ <b>Istotność:</b> {corr.relevance_to_forecast}", self.styles['IndentedText']))
+            self.story.append(self._paragraph(f"<b>{i}. Korelacja między:</b>", self.styles['IndentedText']))
+            self.story.append(self._paragraph(f"• {corr.fact_1}", self.styles['IndentedText']))
+            self.story.append(self._paragraph(f"• {corr.fact_2}", self.styles['IndentedText']))
+            self.story.append(self._paragraph(f"→ <i>{corr.correlation_description}</i>", self.styles['IndentedText']))
+            self.story.append(self._paragraph(f"⚡ <b>Istotność:</b> {corr.relevance_to_forecast}", self.styles['IndentedText']))
             self.story.append(Spacer(1, 6))
         self.story.append(Spacer(1, 12))
         
         # Non-obvious factors
-        self.story.append(Paragraph("🦢 Nieoczywiste czynniki (Deep Research):", self.styles['Subsection']))
+        self.story.append(self._paragraph("🦢 Nieoczywiste czynniki (Deep Research):", self.styles['Subsection']))
         for i, factor in enumerate(forecast.non_obvious_factors, 1):
-            self.story.append(Paragraph(f"<b>{i}. {factor.factor_name}</b>", self.styles['IndentedText']))
-            self.story.append(Paragraph(f"• Opis: {factor.description}", self.styles['IndentedText']))
-            self.story.append(Paragraph(f"• Potencjalny wpływ: {factor.potential_impact}", self.styles['IndentedText']))
+            self.story.append(self._paragraph(f"<b>{i}. {factor.factor_name}</b>", self.styles['IndentedText']))
+            self.story.append(self._paragraph(f"• Opis: {factor.description}", self.styles['IndentedText']))
+            self.story.append(self._paragraph(f"• Potencjalny wpływ: {factor.potential_impact}", self.styles['IndentedText']))
             self.story.append(Spacer(1, 6))
         self.story.append(Spacer(1, 12))
         
         # Chain of reasoning
-        self.story.append(Paragraph("🎯 Łańcuch rozumowania (krok po kroku):", self.styles['Subsection']))
+        self.story.append(self._paragraph("🎯 Łańcuch rozumowania (krok po kroku):", self.styles['Subsection']))
         for step in forecast.chain_of_thought:
-            self.story.append(Paragraph(
+            self.story.append(self._paragraph(
                 f"<b>Krok {step.step_number}:</b> {step.description}",
                 self.styles['IndentedText']
             ))
-            self.story.append(Paragraph(
+            self.story.append(self._paragraph(
                 f"→ Uzasadnienie: <i>{step.reasoning}</i>",
                 self.styles['IndentedText']
             ))
@@ -243,18 +184,20 @@ class ForecastReportGenerator:
         self.story.append(Spacer(1, 20))
         
         # Forecasts section
-        self.story.append(Paragraph(
+        self.story.append(self._paragraph(
             f"📊 PROGNOZY (Pewność: {forecast.confidence:.2f})",
             self.styles['SectionHeader']
         ))
         
         # Create table for forecasts
+        # Paragraph cells wrap long scenarios and can use the emoji font
+        cell, header = self.styles['TableCell'], self.styles['TableHeader']
         forecast_data = [
-            ['Typ', 'Scenariusz'],
-            ['✅ Pozytywny 1', forecast.positive_forecast_1],
-            ['✅ Pozytywny 2', forecast.positive_forecast_2],
-            ['❌ Negatywny 1', forecast.negative_forecast_1],
-            ['❌ Negatywny 2', forecast.negative_forecast_2],
+            [self._paragraph('Typ', header), self._paragraph('Scenariusz', header)],
+            [self._paragraph('✅ Pozytywny 1', cell), self._paragraph(forecast.positive_forecast_1, cell)],
+            [self._paragraph('✅ Pozytywny 2', cell), self._paragraph(forecast.positive_forecast_2, cell)],
+            [self._paragraph('❌ Negatywny 1', cell), self._paragraph(forecast.negative_forecast_1, cell)],
+            [self._paragraph('❌ Negatywny 2', cell), self._paragraph(forecast.negative_forecast_2, cell)],
         ]
         
         forecast_table = Table(forecast_data, colWidths=[1.5*inch, 5*inch])
@@ -262,7 +205,7 @@ class ForecastReportGenerator:
             ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#3949ab')),
             ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+            ('FONTNAME', (0, 0), (-1, 0), self.fonts.bold),
             ('FONTSIZE', (0, 0), (-1, 0), 10),
             ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
             ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
@@ -276,21 +219,21 @@ class ForecastReportGenerator:
         self.story.append(Spacer(1, 20))
         
         # Explanations section
-        self.story.append(Paragraph("💡 WYJAŚNIENIA", self.styles['SectionHeader']))
+        self.story.append(self._paragraph("💡 WYJAŚNIENIA", self.styles['SectionHeader']))
         
-        self.story.append(Paragraph(
+        self.story.append(self._paragraph(
             f"🎯 <b>Wyjaśnienie pewności prognozy ({forecast.confidence:.2f}):</b>",
             self.styles['Subsection']
         ))
-        self.story.append(Paragraph(forecast.confidence_explanation, self.styles['BodyJustify']))
+        self.story.append(self._paragraph(forecast.confidence_explanation, self.styles['BodyJustify']))
         self.story.append(Spacer(1, 12))
         
-        self.story.append(Paragraph("💭 <b>Uzasadnienie:</b>", self.styles['Subsection']))
-        self.story.append(Paragraph(forecast.reasoning, self.styles['BodyJustify']))
+        self.story.append(self._paragraph("💭 <b>Uzasadnienie:</b>", self.styles['Subsection']))
+        self.story.append(self._paragraph(forecast.reasoning, self.styles['BodyJustify']))
         self.story.append(Spacer(1, 12))
         
-        self.story.append(Paragraph("🔗 <b>Łańcuch przyczynowo-skutkowy:</b>", self.styles['Subsection']))
-        self.story.append(Paragraph(forecast.causality, self.styles['BodyJustify']))
+        self.story.append(self._paragraph("🔗 <b>Łańcuch przyczynowo-skutkowy:</b>", self.styles['Subsection']))
+        self.story.append(self._paragraph(forecast.causality, self.styles['BodyJustify']))
         self.story.append(Spacer(1, 20))
     
     def build(self):
@@ -303,30 +246,187 @@ class ForecastReportGenerator:
             logger.error(f"Error generating PDF report: {e}")
             raise
     
-    def generate_report(self, scenario: dict, forecasts: List[dict], timestamp: datetime):
+    def render_part(self, path: str, add_content: Callable, *args, **kwargs) -> str:
+        """
+        Render one section to its own PDF file, keeping only its flowables in memory
+
+        Args:
+            path: Output PDF file for the section
+            add_content: Story builder, e.g. self.add_title_page or self.add_country_forecast
+            *args, **kwargs: Arguments for add_content
+
+        Returns:
+            The path written
+        """
+        story, self.story = self.story, []
+        try:
+            add_content(*args, **kwargs)
+            self._document(path).build(self.story)
+        finally:
+            self.story = story
+        return path
+
+    def generate_report(self, scenario, forecasts: List[dict], timestamp: datetime):
         """
         Generate complete PDF report with all country forecasts
         
+        Countries are rendered one at a time to separate parts and merged at the
+        end, so peak memory does not grow with the number of countries.
+
         Args:
-            scenario: Dictionary with scenario description and total_weight
+            scenario: Scenario (or a legacy dictionary with description and total_weight)
             forecasts: List of dictionaries with country_name and forecast data
             timestamp: Timestamp for the report
         """
-        # Add title page
-        self.add_title_page(
-            title="Raport Analiz Geopolitycznych",
-            subtitle=f"Prognozy dla {len(forecasts)} krajów",
-            scenario=scenario.get('description', '')
-        )
+        writer = IncrementalReportWriter(scenario, output_path=self.output_path, generator=self)
+        try:
+            for forecast_data in forecasts:
+                writer.add_country(forecast_data['country_name'], forecast_data['forecast'])
+            return writer.finish()
+        except Exception as e:
+            writer.abort()
+            logger.error(f"Error generating PDF report: {e}")
+            raise
+
+
+# Generator reused by each report rendering worker process (styles are built once per process)
+_worker_generator: Optional[ForecastReportGenerator] = None
+
+
+def _render_country_part(path: str, country_name: str, forecast, scenario_weight: int) -> str:
+    """Render one country's section to a PDF part (runs in a worker process)"""
+    global _worker_generator
+    if _worker_generator is None:
+        _worker_generator = ForecastReportGenerator(path)
+    return _worker_generator.render_part(
+        path,
+        _worker_generator.add_country_forecast,
+        country_name=country_name,
+        forecasts=forecast,
+        scenario_weight=scenario_weight,
+    )
+
+
+class IncrementalReportWriter:
+    """
+    Writes a forecast report country by country
+
+    Each country section is rendered to its own PDF part as soon as its
+    forecast is added; finish() renders the title page and merges the parts
+    (with one bookmark per country) into the final report. With more than one
+    worker, sections are laid out in parallel in a process pool.
+    """
+
+    TITLE = "Raport Analiz Geopolitycznych"
+
+    def __init__(
+        self,
+        scenario,
+        output_path: Optional[str] = None,
+        generator: Optional[ForecastReportGenerator] = None,
+        order: Optional[List[str]] = None,
+        workers: Optional[int] = None,
+    ):
+        """
+        Args:
+            scenario: Scenario (or a legacy dictionary with description and total_weight)
+            output_path: Final PDF path. If None, generates timestamp-based name.
+            generator: Generator providing the styles and section layout
+            order: Country order in the merged report (default: order of arrival);
+                   countries missing from it are appended at the end
+            workers: Rendering processes; 1 renders in this process and 0 means
+                     one per CPU core (default from configuration)
+        """
+        self.scenario = Scenario.coerce(scenario)
+        self.generator = generator or ForecastReportGenerator(output_path)
+        self.output_path = output_path or self.generator.output_path
+        self.order = order
+        self.parts_dir = tempfile.mkdtemp(prefix="forecast_report_parts_")
+        self.parts: Dict[str, str] = {}
+        if workers is None:
+            workers = config.report_render_workers
+        self.workers = workers or os.cpu_count() or 1
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._pending: List[Future] = []
+        self._part_numbers = itertools.count()
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            # spawn: forking a process that runs an event loop and threads is unsafe
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def add_country(self, country_name: str, forecast) -> str:
+        """
+        Render a country's section right away (or queue it on the process pool)
+
+        Adding a country again replaces its earlier section.
         
-        # Add each country's forecast
-        scenario_weight = scenario.get('total_weight', 100)
-        for forecast_data in forecasts:
-            self.add_country_forecast(
-                country_name=forecast_data['country_name'],
-                forecasts=forecast_data['forecast'],
-                scenario_weight=scenario_weight
+        Args:
+            country_name: Name of the country
+            forecast: ForecastOutput of the country
+
+        Returns:
+            Path of the (possibly still rendering) part
+        """
+        path = os.path.join(self.parts_dir, f"{next(self._part_numbers):05d}.pdf")
+        if self.workers > 1:
+            self._pending.append(self._executor().submit(
+                _render_country_part, path, country_name, forecast, self.scenario.total_weight
+            ))
+        else:
+            self.generator.render_part(
+                path,
+                self.generator.add_country_forecast,
+                country_name=country_name,
+                forecasts=forecast,
+                scenario_weight=self.scenario.total_weight,
             )
+            logger.debug(f"Rendered report section for {country_name}")
+        self.parts[country_name] = path
+        return path
+
+    def _ordered_countries(self) -> List[str]:
+        if not self.order:
+            return list(self.parts)
+        ordered = [name for name in self.order if name in self.parts]
+        return ordered + [name for name in self.parts if name not in ordered]
+
+    def finish(self) -> str:
+        """
+        Render the title page and merge all parts into the final report
         
-        # Build the PDF
-        return self.build()
+        Returns:
+            Path of the merged report
+        """
+        try:
+            title_path = self.generator.render_part(
+                os.path.join(self.parts_dir, "title.pdf"),
+                self.generator.add_title_page,
+                title=self.TITLE,
+                subtitle=f"Prognozy dla {len(self.parts)} krajów",
+                scenario=self.scenario.description,
+            )
+            for future in self._pending:
+                future.result()
+            merged = PdfWriter()
+            merged.append(title_path)
+            for country_name in self._ordered_countries():
+                merged.append(self.parts[country_name], outline_item=country_name)
+            with open(self.output_path, "wb") as f:
+                merged.write(f)
+            merged.close()
+        finally:
+            self.abort()
+        logger.info(f"PDF report generated successfully: {self.output_path}")
+        return self.output_path
+
+    def abort(self):
+        """Stop the rendering workers and discard the rendered parts"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        self._pending = []
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
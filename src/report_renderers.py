@@ -0,0 +1,259 @@
+"""
+Report renderers for Geopolitical Forecasts
+Turn one Report model into PDF, HTML, Markdown or JSON. The text formats are
+rendered in milliseconds; the PDF goes through ReportLab and is the slowest.
+"""
+import html
+import logging
+import os
+import tempfile
+from typing import Dict, List
+
+from src.models.report import Report
+from src.report_generator import ForecastReportGenerator
+
+logger = logging.getLogger(__name__)
+
+# Bump when the layout of any format changes: it is part of the report content hash
+TEMPLATE_VERSION = 1
+
+TIMEFRAMES = (("forecast_12_months", "12 miesięcy"), ("forecast_36_months", "36 miesięcy"))
+
+
+class ReportRenderer:
+    """Base class: renders a Report to bytes of one format"""
+
+    format: str = ""
+    media_type: str = "application/octet-stream"
+    extension: str = ""
+
+    def render(self, report: Report) -> bytes:
+        raise NotImplementedError
+
+    def write(self, report: Report, path: str) -> str:
+        """
+        Render the report to a file
+
+        Args:
+            report: Report to render
+            path: Output file path
+
+        Returns:
+            The path written
+        """
+        with open(path, "wb") as f:
+            f.write(self.render(report))
+        return path
+
+
+class JSONRenderer(ReportRenderer):
+    format = "json"
+    media_type = "application/json"
+    extension = "json"
+
+    def render(self, report: Report) -> bytes:
+        return report.model_dump_json(indent=2).encode("utf-8")
+
+
+class MarkdownRenderer(ReportRenderer):
+    format = "md"
+    media_type = "text/markdown; charset=utf-8"
+    extension = "md"
+
+    def render(self, report: Report) -> bytes:
+        lines = [
+            f"# {report.title}",
+            "",
+            f"**{report.subtitle}**",
+            "",
+            f"**Data wygenerowania:** {report.generated_at:%d %B %Y, %H:%M}",
+            "",
+            "## Scenariusz Globalny",
+            "",
+        ]
+        lines += [f"{line.strip()}\n" for line in report.scenario.description.split("\n") if line.strip()]
+        for country in report.countries:
+            lines += [
+                f"## Analiza Prognostyczna: {country.country_name}",
+                "",
+                f"**Waga scenariusza:** {report.scenario.total_weight}/100",
+                "",
+            ]
+            for field, timeframe in TIMEFRAMES:
+                lines += self._forecast_section(getattr(country.forecast, field), timeframe)
+        return "\n".join(lines).encode("utf-8")
+
+    @staticmethod
+    def _forecast_section(forecast, timeframe: str) -> List[str]:
+        lines = [f"### 📅 Prognoza na {timeframe}", "", "#### 📚 Fakty historyczne i obecne trendy", ""]
+        lines += [f"{i}. {fact}" for i, fact in enumerate(forecast.historical_facts, 1)]
+        lines += ["", "#### 🔗 Zidentyfikowane korelacje", ""]
+        for i, corr in enumerate(forecast.identified_correlations, 1):
+            lines += [
+                f"{i}. **Korelacja między:** {corr.fact_1} / {corr.fact_2}",
+                f"   - → *{corr.correlation_description}*",
+                f"   - ⚡ **Istotność:** {corr.relevance_to_forecast}",
+            ]
+        lines += ["", "#### 🦢 Nieoczywiste czynniki", ""]
+        for i, factor in enumerate(forecast.non_obvious_factors, 1):
+            lines += [
+                f"{i}. **{factor.factor_name}**",
+                f"   - Opis: {factor.description}",
+                f"   - Potencjalny wpływ: {factor.potential_impact}",
+            ]
+        lines += ["", "#### 🎯 Łańcuch rozumowania", ""]
+        for step in forecast.chain_of_thought:
+            lines.append(f"- **Krok {step.step_number}:** {step.description} — *{step.reasoning}*")
+        lines += [
+            "",
+            f"#### 📊 Prognozy (pewność: {forecast.confidence:.2f})",
+            "",
+            "| Typ | Scenariusz |",
+            "| --- | --- |",
+            f"| ✅ Pozytywny 1 | {_table_cell(forecast.positive_forecast_1)} |",
+            f"| ✅ Pozytywny 2 | {_table_cell(forecast.positive_forecast_2)} |",
+            f"| ❌ Negatywny 1 | {_table_cell(forecast.negative_forecast_1)} |",
+            f"| ❌ Negatywny 2 | {_table_cell(forecast.negative_forecast_2)} |",
+            "",
+            "#### 💡 Wyjaśnienia",
+            "",
+            f"**🎯 Wyjaśnienie pewności prognozy ({forecast.confidence:.2f}):** {forecast.confidence_explanation}",
+            "",
+            f"**💭 Uzasadnienie:** {forecast.reasoning}",
+            "",
+            f"**🔗 Łańcuch przyczynowo-skutkowy:** {forecast.causality}",
+            "",
+        ]
+        return lines
+
+
+def _table_cell(text: str) -> str:
+    return text.replace("|", "\\|").replace("\n", " ")
+
+
+class HTMLRenderer(ReportRenderer):
+    format = "html"
+    media_type = "text/html; charset=utf-8"
+    extension = "html"
+
+    STYLE = (
+        "body{font-family:'DejaVu Sans',Arial,sans-serif;max-width:960px;margin:2rem auto;"
+        "padding:0 1rem;line-height:1.5;color:#212121}"
+        "h1,h2{color:#1a237e}h3{color:#283593}h4{color:#3949ab}"
+        "table{border-collapse:collapse;width:100%}"
+        "th{background:#3949ab;color:#fff}td{background:#f5f5dc}"
+        "th,td{border:1px solid #000;padding:6px;text-align:left;vertical-align:top}"
+        "section.country{border-top:2px solid #c5cae9;margin-top:2rem}"
+    )
+
+    def render(self, report: Report) -> bytes:
+        e = html.escape
+        parts = [
+            "<!DOCTYPE html>",
+            '<html lang="pl"><head><meta charset="utf-8">',
+            f"<title>{e(report.title)}</title><style>{self.STYLE}</style></head><body>",
+            f"<h1>{e(report.title)}</h1>",
+            f"<h2>{e(report.subtitle)}</h2>",
+            f"<p><b>Data wygenerowania:</b> {report.generated_at:%d %B %Y, %H:%M}</p>",
+            "<h3>Scenariusz Globalny</h3>",
+        ]
+        parts += [f"<p>{e(line.strip())}</p>" for line in report.scenario.description.split("\n") if line.strip()]
+        for country in report.countries:
+            parts += [
+                '<section class="country">',
+                f"<h2>Analiza Prognostyczna: {e(country.country_name)}</h2>",
+                f"<p><b>Waga scenariusza:</b> {report.scenario.total_weight}/100</p>",
+            ]
+            for field, timeframe in TIMEFRAMES:
+                parts += self._forecast_section(getattr(country.forecast, field), timeframe)
+            parts.append("</section>")
+        parts.append("</body></html>")
+        return "\n".join(parts).encode("utf-8")
+
+    @staticmethod
+    def _forecast_section(forecast, timeframe: str) -> List[str]:
+        e = html.escape
+        parts = [f"<h3>📅 Prognoza na {timeframe}</h3>", "<h4>📚 Fakty historyczne i obecne trendy</h4><ol>"]
+        parts += [f"<li>{e(fact)}</li>" for fact in forecast.historical_facts]
+        parts.append("</ol><h4>🔗 Zidentyfikowane korelacje</h4><ol>")
+        parts += [
+            f"<li><b>Korelacja między:</b> {e(corr.fact_1)} / {e(corr.fact_2)}<br>"
+            f"→ <i>{e(corr.correlation_description)}</i><br>"
+            f"⚡ <b>Istotność:</b> {e(corr.relevance_to_forecast)}</li>"
+            for corr in forecast.identified_correlations
+        ]
+        parts.append("</ol><h4>🦢 Nieoczywiste czynniki</h4><ol>")
+        parts += [
+            f"<li><b>{e(factor.factor_name)}</b><br>Opis: {e(factor.description)}<br>"
+            f"Potencjalny wpływ: {e(factor.potential_impact)}</li>"
+            for factor in forecast.non_obvious_factors
+        ]
+        parts.append("</ol><h4>🎯 Łańcuch rozumowania</h4><ul>")
+        parts += [
+            f"<li><b>Krok {step.step_number}:</b> {e(step.description)}<br>"
+            f"→ Uzasadnienie: <i>{e(step.reasoning)}</i></li>"
+            for step in forecast.chain_of_thought
+        ]
+        parts += [
+            "</ul>",
+            f"<h4>📊 Prognozy (pewność: {forecast.confidence:.2f})</h4>",
+            "<table><tr><th>Typ</th><th>Scenariusz</th></tr>",
+            f"<tr><td>✅ Pozytywny 1</td><td>{e(forecast.positive_forecast_1)}</td></tr>",
+            f"<tr><td>✅ Pozytywny 2</td><td>{e(forecast.positive_forecast_2)}</td></tr>",
+            f"<tr><td>❌ Negatywny 1</td><td>{e(forecast.negative_forecast_1)}</td></tr>",
+            f"<tr><td>❌ Negatywny 2</td><td>{e(forecast.negative_forecast_2)}</td></tr>",
+            "</table>",
+            "<h4>💡 Wyjaśnienia</h4>",
+            f"<p><b>🎯 Wyjaśnienie pewności prognozy ({forecast.confidence:.2f}):</b> "
+            f"{e(forecast.confidence_explanation)}</p>",
+            f"<p><b>💭 Uzasadnienie:</b> {e(forecast.reasoning)}</p>",
+            f"<p><b>🔗 Łańcuch przyczynowo-skutkowy:</b> {e(forecast.causality)}</p>",
+        ]
+        return parts
+
+
+class PDFRenderer(ReportRenderer):
+    format = "pdf"
+    media_type = "application/pdf"
+    extension = "pdf"
+
+    def render(self, report: Report) -> bytes:
+        fd, path = tempfile.mkstemp(suffix=".pdf")
+        os.close(fd)
+        try:
+            self.write(report, path)
+            with open(path, "rb") as f:
+                return f.read()
+        finally:
+            os.remove(path)
+
+    def write(self, report: Report, path: str) -> str:
+        return ForecastReportGenerator(path).generate_report(
+            scenario=report.scenario,
+            forecasts=report.forecasts_data(),
+            timestamp=report.generated_at,
+        )
+
+
+RENDERERS: Dict[str, ReportRenderer] = {
+    renderer.format: renderer
+    for renderer in (JSONRenderer(), MarkdownRenderer(), HTMLRenderer(), PDFRenderer())
+}
+
+
+def register_renderer(renderer: ReportRenderer):
+    """Add (or replace) the renderer for renderer.format"""
+    RENDERERS[renderer.format] = renderer
+
+
+def get_renderer(format: str) -> ReportRenderer:
+    """
+    Renderer for a format name
+
+    Raises:
+        ValueError: Unknown format
+    """
+    try:
+        return RENDERERS[format.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown report format '{format}' (available: {', '.join(RENDERERS)})") from None
@@ -0,0 +1,181 @@
+"""
+Content-addressed storage for forecast reports
+Reports are stored under the hash of (scenario, forecasts, template version),
+so identical simulations share one set of artifacts. The JSON model is written
+on put(); other formats are rendered into the store on first use. Entries not
+used for a while, or the least recently used ones above the size limit, are evicted.
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from typing import Dict, List, Optional
+
+from src.configuration import Configuration
+from src.models.report import Report
+from src.report_renderers import TEMPLATE_VERSION, get_renderer
+
+logger = logging.getLogger(__name__)
+
+config = Configuration()
+
+REPORT_HASH_PATTERN = r"^[0-9a-f]{64}$"
+_ARTIFACT_PATTERN = re.compile(r"^([0-9a-f]{64})\.[a-z]+$")
+
+
+def report_hash(report: Report) -> str:
+    """
+    Content hash of a report (the generation time is not part of the content)
+
+    Args:
+        report: Report to hash
+
+    Returns:
+        Hex sha256 digest
+    """
+    payload = {
+        "template_version": TEMPLATE_VERSION,
+        "title": report.title,
+        "scenario": report.scenario.model_dump(mode="json"),
+        "countries": [country.model_dump(mode="json") for country in report.countries],
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class ReportStore:
+    """Deduplicated report artifacts with size and age based eviction"""
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: Optional[int] = None,
+        max_age_seconds: Optional[float] = None,
+    ):
+        """
+        Args:
+            directory: Store directory (default from configuration)
+            max_bytes: Total size limit of all artifacts (default from configuration)
+            max_age_seconds: Entries unused for longer are evicted (default from configuration)
+        """
+        self.directory = directory or config.report_store_dir
+        self.max_bytes = config.report_store_max_mb * 1024 * 1024 if max_bytes is None else max_bytes
+        self.max_age_seconds = (
+            config.report_store_max_age_days * 86400 if max_age_seconds is None else max_age_seconds
+        )
+
+    def path(self, digest: str, format: str = "json") -> str:
+        """Path of one artifact of a stored report"""
+        return os.path.join(self.directory, f"{digest}.{get_renderer(format).extension}")
+
+    def exists(self, digest: str, format: str = "json") -> bool:
+        return os.path.exists(self.path(digest, format))
+
+    def put(self, report: Report) -> str:
+        """
+        Store a report model (no-op apart from refreshing its age if already stored)
+
+        Args:
+            report: Report to store
+
+        Returns:
+            Content hash of the report
+        """
+        digest = report_hash(report)
+        path = self.path(digest)
+        if os.path.exists(path):
+            self.touch(digest)
+            logger.info(f"Report {digest[:12]} already stored; reusing it")
+            return digest
+        self._write(path, get_renderer("json").render(report))
+        self.evict(keep=digest)
+        return digest
+
+    def load(self, digest: str) -> Report:
+        """Stored report model"""
+        with open(self.path(digest), "r", encoding="utf-8") as f:
+            return Report.model_validate_json(f.read())
+
+    def render(self, digest: str, format: str) -> str:
+        """
+        Path of a report artifact, rendering it into the store if missing
+
+        Args:
+            digest: Content hash of a stored report
+            format: Renderer format name (json, html, md, pdf)
+
+        Returns:
+            Path of the artifact
+        """
+        path = self.path(digest, format)
+        if not os.path.exists(path):
+            renderer = get_renderer(format)
+            tmp_path = f"{path}.tmp"
+            renderer.write(self.load(digest), tmp_path)
+            os.replace(tmp_path, path)
+            self.evict(keep=digest)
+        return path
+
+    def touch(self, digest: str):
+        """Mark a report as recently used (its JSON model's mtime is the last use)"""
+        try:
+            os.utime(self.path(digest))
+        except FileNotFoundError:
+            pass
+
+    def _write(self, path: str, data: bytes):
+        # Atomic, so concurrent readers never see a partial file
+        os.makedirs(self.directory, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _entries(self) -> Dict[str, List[os.DirEntry]]:
+        entries: Dict[str, List[os.DirEntry]] = {}
+        if not os.path.isdir(self.directory):
+            return entries
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                match = _ARTIFACT_PATTERN.match(entry.name)
+                if match and entry.is_file():
+                    entries.setdefault(match.group(1), []).append(entry)
+        return entries
+
+    def evict(self, keep: Optional[str] = None) -> List[str]:
+        """
+        Remove reports unused for longer than max_age_seconds, then the least
+        recently used ones until the store fits in max_bytes
+
+        Args:
+            keep: Hash that must survive (the report just written or served)
+
+        Returns:
+            Hashes of the evicted reports
+        """
+        now = time.time()
+        reports = []
+        for digest, files in self._entries().items():
+            stats = [entry.stat() for entry in files]
+            reports.append((max(s.st_mtime for s in stats), sum(s.st_size for s in stats), digest, files))
+        reports.sort()
+
+        total = sum(size for _, size, _, _ in reports)
+        evicted = []
+        for last_used, size, digest, files in reports:
+            if digest == keep:
+                continue
+            if now - last_used <= self.max_age_seconds and total <= self.max_bytes:
+                continue
+            for entry in files:
+                try:
+                    os.remove(entry.path)
+                except FileNotFoundError:
+                    pass
+            total -= size
+            evicted.append(digest)
+        if evicted:
+            logger.info(f"Evicted {len(evicted)} reports from {self.directory} ({total / 1024 / 1024:.1f} MB kept)")
+        return evicted
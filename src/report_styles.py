@@ -0,0 +1,280 @@
+"""
+Fonts and paragraph styles for the PDF report generator
+Fonts are registered and the stylesheet is built once per process and shared by
+every ForecastReportGenerator. A Unicode TTF (DejaVu Sans by default) covers
+Polish diacritics; heading icons are drawn with a monochrome emoji/symbol font
+(Noto Emoji or Symbola) when one is installed and dropped otherwise, instead of
+rendering as empty boxes.
+"""
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import FrozenSet, Iterable, Optional
+
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_CENTER, TA_JUSTIFY
+from reportlab.lib.fonts import addMapping
+from reportlab.lib.styles import ParagraphStyle, StyleSheet1, getSampleStyleSheet
+from reportlab.pdfbase import pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont
+
+from src.configuration import Configuration
+
+logger = logging.getLogger(__name__)
+
+config = Configuration()
+
+FONT_DIRS = (
+    "/usr/share/fonts/truetype/dejavu",
+    "/usr/share/fonts/dejavu",
+    "/usr/share/fonts/TTF",
+    "/usr/share/fonts/dejavu-sans-fonts",
+    "/Library/Fonts",
+    os.path.expanduser("~/Library/Fonts"),
+    "C:/Windows/Fonts",
+)
+FONT_FILES = {
+    "regular": ("DejaVuSans.ttf",),
+    "bold": ("DejaVuSans-Bold.ttf",),
+    "italic": ("DejaVuSans-Oblique.ttf",),
+    "bold_italic": ("DejaVuSans-BoldOblique.ttf",),
+}
+EMOJI_FONT_PATHS = (
+    "/usr/share/fonts/truetype/noto/NotoEmoji-Regular.ttf",
+    "/usr/share/fonts/noto/NotoEmoji-Regular.ttf",
+    "/usr/share/fonts/truetype/ancient-scripts/Symbola_hint.ttf",
+    "/usr/share/fonts/TTF/Symbola.ttf",
+    "/usr/share/fonts/gdouros-symbola/Symbola.ttf",
+)
+BASE_FONT = "ReportSans"
+EMOJI_FONT = "ReportEmoji"
+# Emoji presentation selector / joiner: invisible, only meaningful next to an emoji
+INVISIBLE_MODIFIERS = {"\ufe0f", "\u200d"}
+
+
+@dataclass(frozen=True)
+class ReportFonts:
+    """Registered font names used by the report styles"""
+
+    regular: str = "Helvetica"
+    bold: str = "Helvetica-Bold"
+    italic: str = "Helvetica-Oblique"
+    bold_italic: str = "Helvetica-BoldOblique"
+    emoji: Optional[str] = None
+    # Code points of the body font (None: standard PDF font, WinAnsi only)
+    body_chars: Optional[FrozenSet[int]] = None
+    emoji_chars: FrozenSet[int] = frozenset()
+
+    def has_char(self, char: str) -> bool:
+        if self.body_chars is None:
+            try:
+                char.encode("cp1252")
+                return True
+            except UnicodeEncodeError:
+                return False
+        return ord(char) in self.body_chars
+
+
+def _find_font(override: str, names: Iterable[str]) -> Optional[str]:
+    if override:
+        if os.path.exists(override):
+            return override
+        logger.warning(f"Configured report font {override} does not exist")
+    for directory in FONT_DIRS:
+        for name in names:
+            path = os.path.join(directory, name)
+            if os.path.exists(path):
+                return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def get_fonts() -> ReportFonts:
+    """
+    Register the report fonts (once per process)
+
+    Returns:
+        ReportFonts; falls back to the built-in Helvetica family without a Unicode TTF
+    """
+    emoji_name = None
+    emoji_chars: FrozenSet[int] = frozenset()
+    emoji_path = _find_font(config.report_emoji_font_path, ()) or next(
+        (path for path in EMOJI_FONT_PATHS if os.path.exists(path)), None
+    )
+    if emoji_path:
+        emoji_font = TTFont(EMOJI_FONT, emoji_path)
+        pdfmetrics.registerFont(emoji_font)
+        emoji_name = EMOJI_FONT
+        emoji_chars = frozenset(emoji_font.face.charToGlyph)
+    else:
+        logger.info("No emoji font found; icons are omitted from PDF reports")
+
+    regular_path = _find_font(config.report_font_path, FONT_FILES["regular"])
+    if regular_path is None:
+        logger.warning(
+            "No Unicode TTF font found (install DejaVu Sans or set REPORT_FONT_PATH); "
+            "PDF reports fall back to Helvetica, which lacks Polish diacritics"
+        )
+        return ReportFonts(emoji=emoji_name, emoji_chars=emoji_chars)
+
+    regular = TTFont(BASE_FONT, regular_path)
+    pdfmetrics.registerFont(regular)
+    names = {"regular": BASE_FONT}
+    for variant in ("bold", "italic", "bold_italic"):
+        override = config.report_font_bold_path if variant == "bold" else ""
+        path = _find_font(override, FONT_FILES[variant])
+        if path:
+            name = f"{BASE_FONT}-{variant}"
+            pdfmetrics.registerFont(TTFont(name, path))
+            names[variant] = name
+        else:
+            names[variant] = names["bold"] if variant == "bold_italic" and "bold" in names else BASE_FONT
+    # <b>/<i> markup inside paragraphs maps to the registered variants
+    addMapping(BASE_FONT, 0, 0, names["regular"])
+    addMapping(BASE_FONT, 1, 0, names["bold"])
+    addMapping(BASE_FONT, 0, 1, names["italic"])
+    addMapping(BASE_FONT, 1, 1, names["bold_italic"])
+    logger.info(f"Registered report font {regular_path}")
+    return ReportFonts(
+        regular=names["regular"],
+        bold=names["bold"],
+        italic=names["italic"],
+        bold_italic=names["bold_italic"],
+        emoji=emoji_name,
+        body_chars=frozenset(regular.face.charToGlyph),
+        emoji_chars=emoji_chars,
+    )
+
+
+def with_fallback_glyphs(text: str, fonts: Optional[ReportFonts] = None) -> str:
+    """
+    Paragraph markup drawing characters missing from the body font (emoji icons)
+    with the emoji font, or dropping them when no font has them
+
+    Args:
+        text: Paragraph text (may contain ReportLab markup)
+        fonts: Registered fonts (default: get_fonts())
+
+    Returns:
+        Text safe to render with the report styles
+    """
+    fonts = fonts or get_fonts()
+    if text.isascii():
+        return text
+    out = []
+    dropped = False
+    for char in text:
+        if char.isascii() or fonts.has_char(char):
+            out.append(char)
+        elif char in INVISIBLE_MODIFIERS:
+            dropped = True
+        elif fonts.emoji and ord(char) in fonts.emoji_chars:
+            out.append(f'<font name="{fonts.emoji}">{char}</font>')
+        elif char.isalpha():
+            # Keep letters even if the fallback font cannot draw them
+            out.append(char)
+        else:
+            dropped = True
+    result = "".join(out)
+    # "📅 Prognoza" without its icon should not start with a space
+    return result.replace("  ", " ").lstrip() if dropped else result
+
+
+@lru_cache(maxsize=None)
+def get_stylesheet() -> StyleSheet1:
+    """
+    Sample stylesheet plus the report's custom styles (built once per process)
+
+    The returned stylesheet is shared; treat it as read-only.
+    """
+    fonts = get_fonts()
+    styles = getSampleStyleSheet()
+    for name in ("Normal", "BodyText", "Title", "Heading1", "Heading2", "Heading3", "Heading4"):
+        styles[name].fontName = fonts.bold if name.startswith(("Title", "Heading")) else fonts.regular
+
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=colors.HexColor('#1a237e'),
+        spaceAfter=30,
+        alignment=TA_CENTER,
+        fontName=fonts.bold
+    ))
+
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='CustomSubtitle',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=colors.HexColor('#283593'),
+        spaceAfter=12,
+        fontName=fonts.bold
+    ))
+
+    # Section header style
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading3'],
+        fontSize=14,
+        textColor=colors.HexColor('#3949ab'),
+        spaceAfter=6,
+        spaceBefore=12,
+        fontName=fonts.bold
+    ))
+
+    # Subsection style
+    styles.add(ParagraphStyle(
+        name='Subsection',
+        parent=styles['Heading4'],
+        fontSize=12,
+        textColor=colors.HexColor('#5e35b1'),
+        spaceAfter=6,
+        fontName=fonts.bold
+    ))
+
+    # Body text with justify
+    styles.add(ParagraphStyle(
+        name='BodyJustify',
+        parent=styles['BodyText'],
+        fontSize=10,
+        alignment=TA_JUSTIFY,
+        spaceAfter=6
+    ))
+
+    # Indented text
+    styles.add(ParagraphStyle(
+        name='IndentedText',
+        parent=styles['BodyText'],
+        fontSize=10,
+        leftIndent=20,
+        spaceAfter=6
+    ))
+
+    # Bullet point style (custom name to avoid conflict)
+    styles.add(ParagraphStyle(
+        name='CustomBullet',
+        parent=styles['BodyText'],
+        fontSize=10,
+        leftIndent=20,
+        bulletIndent=10,
+        spaceAfter=3
+    ))
+
+    # Forecast table cells (wrapped paragraphs instead of single-line strings)
+    styles.add(ParagraphStyle(
+        name='TableCell',
+        parent=styles['BodyText'],
+        fontSize=9,
+        leading=11,
+    ))
+    styles.add(ParagraphStyle(
+        name='TableHeader',
+        parent=styles['TableCell'],
+        fontSize=10,
+        textColor=colors.whitesmoke,
+        fontName=fonts.bold
+    ))
+    return styles
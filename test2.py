@@ -3,33 +3,47 @@ Main script to run geopolitical forecasting simulation
 Uses WorldModel, CountryAgent, and generates PDF reports
 """
 
+import argparse
 import logging
 import os
 from datetime import datetime
 from src.models.world_model import WorldModel
-from src.report_generator import ForecastReportGenerator
+from src.report_generator import IncrementalReportWriter
 from src.configuration import Configuration
 
 # Load configuration
 config = Configuration()
 
-# Setup logging from configuration
-log_dir = config.log_dir
-os.makedirs(log_dir, exist_ok=True)
-timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-log_file = os.path.join(log_dir, f"forecast_{timestamp}.log")
+logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=getattr(logging, config.log_level.upper()),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[logging.FileHandler(log_file, encoding="utf-8"), logging.StreamHandler()],
-)
 
-logger = logging.getLogger(__name__)
+def setup_logging():
+    """
+    Setup logging from configuration
+    Called from the __main__ guard only: report rendering workers re-import this
+    module and must not open log files of their own.
+    """
+    log_dir = config.log_dir
+    os.makedirs(log_dir, exist_ok=True)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    log_file = os.path.join(log_dir, f"forecast_{timestamp}.log")
+
+    logging.basicConfig(
+        level=getattr(logging, config.log_level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.FileHandler(log_file, encoding="utf-8"), logging.StreamHandler()],
+    )
 
 
 def main():
     """Main function to run the complete simulation pipeline"""
+    parser = argparse.ArgumentParser(description="Run the geopolitical forecasting simulation")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run, skipping countries already forecast",
+    )
+    args = parser.parse_args()
 
     # Create reports directory from configuration
     reports_dir = config.report_dir
@@ -37,27 +51,26 @@ def main():
 
     # Initialize World Model
     logger.info("Initializing World Model...")
-    model = WorldModel()
+    checkpoint_path = os.path.join(config.checkpoint_dir, "simulation.jsonl")
+    model = WorldModel(checkpoint_path=checkpoint_path, resume=args.resume)
+
+    # Render each country's report section as soon as its forecast arrives
+    report_writer = IncrementalReportWriter(model.scenario, order=model.get_country_names())
+    for forecast_data in model.get_forecasts():  # restored from the checkpoint
+        report_writer.add_country(forecast_data["country_name"], forecast_data["forecast"])
+    model.add_forecast_listener(report_writer.add_country)
 
     # Run complete simulation (exploration + forecasting)
     model.run_simulation()
 
-    # Generate PDF Report
+    # Merge the PDF Report
     logger.info("Generating PDF report...")
     try:
-        # Collect all forecasts from agents
-        forecasts_data = model.get_forecasts()
-
-        if forecasts_data:
-            # Generate PDF report
-            report_gen = ForecastReportGenerator()
-            report_gen.generate_report(
-                scenario=model.scenario,
-                forecasts=forecasts_data,
-                timestamp=datetime.now(),
-            )
-            logger.info(f"✅ PDF report generated: {report_gen.output_path}")
+        if report_writer.parts:
+            report_writer.finish()
+            logger.info(f"✅ PDF report generated: {report_writer.output_path}")
         else:
+            report_writer.abort()
             logger.warning("No forecasts available to generate report")
 
     except Exception as e:
@@ -65,4 +78,5 @@ def main():
 
 
 if __name__ == "__main__":
+    setup_logging()
     main()
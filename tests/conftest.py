@@ -0,0 +1,33 @@
+"""
+Shared test setup: every LLM call goes to the offline fake provider, so the
+suite needs neither API keys nor network access.
+"""
+import os
+
+import pytest
+
+os.environ.setdefault("LLM_PROVIDER", "fake")
+os.environ.setdefault("PYDANTIC_AI_NO_BANNER", "1")
+
+
+@pytest.fixture
+def forecast():
+    """Minimal valid ForecastOutput"""
+    from src.agents.forecasting_agent import ForecastOutput, ForecastScenario
+
+    scenario = ForecastScenario(
+        timeframe="12 months",
+        historical_facts=[],
+        identified_correlations=[],
+        non_obvious_factors=[],
+        chain_of_thought=[],
+        positive_forecast_1="+1",
+        positive_forecast_2="+2",
+        negative_forecast_1="-1",
+        negative_forecast_2="-2",
+        confidence=0.5,
+        confidence_explanation="",
+        reasoning="",
+        causality="",
+    )
+    return ForecastOutput(forecast_12_months=scenario, forecast_36_months=scenario)
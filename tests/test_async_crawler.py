@@ -0,0 +1,49 @@
+import asyncio
+import os
+
+import httpx
+
+from src.crawlers.async_crawler import AsyncCrawler
+from src.crawlers.http_cache import HttpCache
+
+URL = "https://example.org/page"
+
+
+def make_crawler(cache: HttpCache, handler) -> AsyncCrawler:
+    return AsyncCrawler(domain_delay=0, max_retries=0, cache=cache, transport=httpx.MockTransport(handler))
+
+
+async def fetch_twice(crawler: AsyncCrawler):
+    async with crawler:
+        return await crawler.fetch(URL), await crawler.fetch(URL)
+
+
+def test_not_modified_serves_the_cached_body(tmp_path):
+    def handler(request):
+        if request.headers.get("if-none-match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"<p>page</p>", headers={"ETag": '"v1"'})
+
+    first, second = asyncio.run(fetch_twice(make_crawler(HttpCache(str(tmp_path)), handler)))
+    assert first.ok and first.changed
+    assert second.ok and second.from_cache and not second.changed
+    assert second.content == b"<p>page</p>"
+
+
+def test_not_modified_without_cached_body_refetches(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    requests = []
+
+    def handler(request):
+        requests.append(request.headers.get("if-none-match"))
+        if request.headers.get("if-none-match"):
+            # The entry is evicted while the conditional request is in flight
+            os.remove(cache._path(URL, "body"))
+            return httpx.Response(304)
+        return httpx.Response(200, content=b"<p>page</p>", headers={"ETag": '"v1"'})
+
+    _, second = asyncio.run(fetch_twice(make_crawler(cache, handler)))
+    assert requests == [None, '"v1"', None]
+    assert second.ok and not second.from_cache
+    assert second.content == b"<p>page</p>"
+    assert cache.body(URL) == b"<p>page</p>"
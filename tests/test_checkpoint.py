@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from src.models.checkpoint import CheckpointMismatchError, SimulationCheckpoint
+from src.models.scenario import Factor, Scenario
+
+SCENARIO = Scenario(factors=(Factor(id="a", text="Embargo on gas imports", weight=60),))
+
+
+def test_resume_restores_forecasts_and_retries_failures(tmp_path, forecast):
+    path = str(tmp_path / "run.jsonl")
+    checkpoint = SimulationCheckpoint(path, SCENARIO)
+    checkpoint.record_forecast("Poland", forecast, explored=["energy"])
+    checkpoint.record_failure("Germany", "timeout")
+
+    resumed = SimulationCheckpoint(path, SCENARIO, resume=True)
+    assert resumed.is_done("Poland")
+    assert resumed.forecasts["Poland"] == forecast
+    assert resumed.explored["Poland"] == ["energy"]
+    assert not resumed.is_done("Germany")
+    assert resumed.failures == {"Germany": "timeout"}
+
+
+def test_resume_cuts_off_a_partial_last_record(tmp_path, forecast):
+    path = tmp_path / "run.jsonl"
+    checkpoint = SimulationCheckpoint(str(path), SCENARIO)
+    checkpoint.record_forecast("Poland", forecast)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"type": "forecast", "country_name": "Fra')
+
+    resumed = SimulationCheckpoint(str(path), SCENARIO, resume=True)
+    resumed.record_forecast("France", forecast)
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["type"] for line in lines] == ["header", "forecast", "forecast"]
+    assert set(SimulationCheckpoint(str(path), SCENARIO, resume=True).forecasts) == {"Poland", "France"}
+
+
+def test_resume_of_a_file_without_complete_lines_rewrites_the_header(tmp_path):
+    path = tmp_path / "run.jsonl"
+    path.write_text('{"type": "hea', encoding="utf-8")
+    SimulationCheckpoint(str(path), SCENARIO, resume=True)
+    assert json.loads(path.read_text(encoding="utf-8"))["scenario_fingerprint"] == SCENARIO.fingerprint
+
+
+def test_resume_rejects_a_different_scenario(tmp_path):
+    path = str(tmp_path / "run.jsonl")
+    SimulationCheckpoint(path, SCENARIO)
+    other = Scenario(factors=(Factor(id="a", text="Embargo on oil imports", weight=60),))
+    with pytest.raises(CheckpointMismatchError):
+        SimulationCheckpoint(path, other, resume=True)
+
+
+def test_without_resume_an_existing_file_is_replaced(tmp_path, forecast):
+    path = str(tmp_path / "run.jsonl")
+    SimulationCheckpoint(path, SCENARIO).record_forecast("Poland", forecast)
+    SimulationCheckpoint(path, SCENARIO)
+    assert SimulationCheckpoint(path, SCENARIO, resume=True).forecasts == {}
@@ -0,0 +1,45 @@
+from src.crawlers.extraction import MIN_BLOCK_CHARS, extract_blocks, fit_to_budget, remove_boilerplate
+
+ARTICLE = "The government announced a new energy strategy, focused on gas imports, nuclear power and grids."
+
+
+def test_extract_blocks_keeps_form_wrapped_content():
+    html = f"""
+    <html><body><form id="Form" action="/">
+      <nav><a href="/">Home</a> <a href="/about">About us and our mission statement</a></nav>
+      <div class="content"><h2>Energy</h2><p>{ARTICLE}</p><p>{ARTICLE} Second part.</p></div>
+      <input type="hidden" name="__VIEWSTATE" value="abc">
+    </form></body></html>
+    """.encode()
+    assert extract_blocks(html) == ["Energy", ARTICLE, f"{ARTICLE} Second part."]
+
+
+def test_remove_boilerplate_drops_short_repeated_blocks():
+    cookie = "We use cookies to improve your experience."
+    long_repeated = "x" * 300
+    pages = {
+        "a": [cookie, "Page A text that is unique to it.", long_repeated],
+        "b": [cookie, "Page B text that is unique to it.", long_repeated],
+    }
+    assert remove_boilerplate(pages) == {
+        "a": ["Page A text that is unique to it.", long_repeated],
+        "b": ["Page B text that is unique to it.", long_repeated],
+    }
+
+
+def test_fit_to_budget_cuts_at_block_boundaries_and_shares_leftovers():
+    short = ["short page text"]
+    long = ["a" * 40, "b" * 40, "c" * 40]
+    fitted = fit_to_budget({"short": short, "long": long, "empty": []}, max_chars=100)
+    assert fitted["short"] == "short page text"
+    # 100 - 15 left for the long page: two blocks and their separator fit
+    assert fitted["long"] == "a" * 40 + "\n" + "b" * 40
+    assert "empty" not in fitted
+    assert sum(len(text) for text in fitted.values()) <= 100
+
+
+def test_fit_to_budget_cuts_a_single_huge_block_at_a_word():
+    fitted = fit_to_budget({"page": [" ".join(["word"] * 50)]}, max_chars=MIN_BLOCK_CHARS + 10)
+    assert fitted["page"].endswith(" …")
+    assert fitted["page"].startswith("word word")
+    assert "wor …" not in fitted["page"]
@@ -0,0 +1,36 @@
+import importlib
+
+import pytest
+
+from src import metrics
+
+# The views package re-exports the health() endpoint under the module's name
+health = importlib.import_module("src.api.v1.views.health")
+
+
+@pytest.fixture(autouse=True)
+def no_models(monkeypatch):
+    monkeypatch.setattr(metrics, "_model_states", {})
+
+
+def test_model_check_is_omitted_until_a_model_is_loaded(monkeypatch):
+    monkeypatch.setattr(health.config, "readiness_require_model_warm", False)
+    assert health._check_models() is None
+
+
+def test_model_check_fails_when_warm_model_is_required_but_none_loaded(monkeypatch):
+    monkeypatch.setattr(health.config, "readiness_require_model_warm", True)
+    check = health._check_models()
+    assert check["ok"] is False
+    assert check["warm"] is False
+
+
+def test_model_check_reports_load_states(monkeypatch):
+    monkeypatch.setattr(health.config, "readiness_require_model_warm", True)
+    metrics.set_model_state("all-MiniLM-L6-v2", "loading")
+    assert health._check_models()["ok"] is False
+    metrics.set_model_state("all-MiniLM-L6-v2", "ready")
+    assert health._check_models() == {"ok": True, "warm": True, "states": {"all-MiniLM-L6-v2": "ready"}}
+    metrics.set_model_state("all-MiniLM-L6-v2", "failed")
+    monkeypatch.setattr(health.config, "readiness_require_model_warm", False)
+    assert health._check_models()["ok"] is False
@@ -0,0 +1,61 @@
+import os
+from types import SimpleNamespace
+
+from src.crawlers.http_cache import HttpCache
+
+URL = "https://example.org/country"
+
+
+class FakeSession:
+    """Answers 304 when the request carries a validator, 200 with the given body otherwise"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.sent_headers = []
+
+    def get(self, url, timeout=None, headers=None):
+        self.sent_headers.append(headers)
+        if headers:
+            return SimpleNamespace(status_code=304, content=b"", headers={}, raise_for_status=lambda: None)
+        return SimpleNamespace(
+            status_code=200, content=self.body, headers={"ETag": '"v1"'}, raise_for_status=lambda: None
+        )
+
+
+def test_store_keeps_validators_and_reports_changes(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    assert cache.conditional_headers(URL) == {}
+    assert cache.store(URL, b"one", {"ETag": '"a"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    assert cache.conditional_headers(URL) == {
+        "If-None-Match": '"a"',
+        "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+    }
+    # Same bytes served again with a 200: unchanged
+    assert not cache.store(URL, b"one", {})
+    assert cache.store(URL, b"two", {})
+    assert cache.body(URL) == b"two"
+
+
+def test_entry_without_body_is_a_miss(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.store(URL, b"one", {"ETag": '"a"'})
+    os.remove(cache._path(URL, "body"))
+    assert cache.lookup(URL) is None
+    assert cache.conditional_headers(URL) == {}
+
+
+def test_get_serves_cached_body_on_304(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    session = FakeSession(b"<html>page</html>")
+    assert cache.get(session, URL) == (b"<html>page</html>", True)
+    assert cache.get(session, URL) == (b"<html>page</html>", False)
+    assert session.sent_headers == [{}, {"If-None-Match": '"v1"'}]
+
+
+def test_extraction_record_is_separate_from_fetch(tmp_path):
+    cache = HttpCache(str(tmp_path))
+    cache.store(URL, b"one", {})
+    assert cache.extracted_hash("poland") is None
+    cache.record_extraction("poland", "abc")
+    assert cache.extracted_hash("poland") == "abc"
+    assert HttpCache(str(tmp_path)).extracted_hash("germany") is None
@@ -0,0 +1,44 @@
+import asyncio
+
+from src.agents.prompt_cache import PrefixCache, TokenBudgetReport, TokenLedger, estimate_tokens
+
+
+def test_local_prefix_cache_reuses_entries():
+    async def run():
+        cache = PrefixCache()
+        first = await cache.get("static prefix", key="scenario-a")
+        assert await cache.get("static prefix", key="scenario-a") is first
+        assert first.mode == "local"
+        assert first.estimated_tokens == estimate_tokens("static prefix")
+
+    asyncio.run(run())
+
+
+def test_prefix_cache_is_bounded_lru():
+    async def run():
+        cache = PrefixCache(max_entries=2)
+        a = await cache.get("A", key="a")
+        await cache.get("B", key="b")
+        # Touch "a" so "b" is the least recently used
+        await cache.get("A", key="a")
+        await cache.get("C", key="c")
+        assert list(cache._entries) == ["a", "c"]
+        assert await cache.get("A", key="a") is a
+        for i in range(100):
+            await cache.get(f"scenario {i}", key=str(i))
+        assert len(cache._entries) == 2
+
+    asyncio.run(run())
+
+
+def test_token_ledger_totals():
+    ledger = TokenLedger()
+    ledger.record(TokenBudgetReport("Poland", "local", 100, 20, input_tokens=120, cached_tokens=100, output_tokens=50))
+    ledger.record(TokenBudgetReport("Germany", "local", 100, 30, input_tokens=130, output_tokens=60))
+    assert ledger.totals() == {
+        "forecasts": 2,
+        "input_tokens": 250,
+        "cached_tokens": 100,
+        "uncached_input_tokens": 150,
+        "output_tokens": 110,
+    }
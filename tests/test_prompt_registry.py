@@ -0,0 +1,25 @@
+import os
+
+import pytest
+
+from src.prompt_registry import PromptRegistry
+
+
+def test_reload_picks_up_changes_and_drops_deleted_prompts(tmp_path):
+    (tmp_path / "root.md").write_text("root prompt", encoding="utf-8")
+    (tmp_path / "searcher.md").write_text("search prompt", encoding="utf-8")
+    registry = PromptRegistry(str(tmp_path), reload_interval=0)
+    version = registry.version
+    assert registry.get("searcher") == "search prompt"
+
+    os.remove(tmp_path / "searcher.md")
+    assert registry.reload() == []
+    assert registry.version != version
+    with pytest.raises(FileNotFoundError):
+        registry.get("searcher")
+
+    path = tmp_path / "root.md"
+    path.write_text("new root prompt", encoding="utf-8")
+    os.utime(path, (0, 1))
+    assert registry.reload() == ["root"]
+    assert registry.get("root") == "new root prompt"
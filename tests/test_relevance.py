@@ -0,0 +1,73 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from src.models import world_model
+from src.models.country_registry import CountryRegistry
+from src.models.interaction_graph import InteractionGraph
+from src.models.relevance import RelevanceIndex
+from src.models.world_model import WorldModel
+
+PROFILES = [
+    {"country_name": "Alpha", "economic_strengths": "cars machinery chemicals", "key_bilateral_relations": ["Beta"]},
+    {"country_name": "Beta", "economic_strengths": "cars machinery steel", "key_bilateral_relations": ["Alpha"]},
+    {"country_name": "Gamma", "economic_strengths": "tourism fishing", "key_bilateral_relations": []},
+    {"country_name": "Delta", "economic_strengths": "oil gas", "key_bilateral_relations": []},
+]
+
+
+def make_index(**kwargs):
+    registry = CountryRegistry(PROFILES)
+    return RelevanceIndex(registry, InteractionGraph.from_registry(registry), **kwargs)
+
+
+def test_rank_prefers_graph_neighbours_and_similar_profiles():
+    index = make_index()
+    assert index.rank("alpha")[0] == "beta"
+    assert index.rank("alpha", k=2) == index.rank("alpha")[:2]
+    assert "alpha" not in index.rank("alpha")
+    assert index.rank("gamma", candidates=["delta", "gamma", "unknown"]) == ["delta"]
+
+
+def test_encoder_replaces_tfidf_vectors():
+    # Gamma and Delta identical, everything else orthogonal
+    vectors = {"tourism": [0, 1, 0], "oil": [0, 1, 0]}
+
+    def encoder(texts):
+        return np.array([next((v for word, v in vectors.items() if word in t), [1, 0, 0]) for t in texts])
+
+    index = make_index(encoder=encoder, weights={"graph": 0.0, "exposure": 0.0})
+    assert index.score("gamma", "delta") > index.score("gamma", "alpha")
+
+
+def test_world_model_wires_the_embedding_encoder(monkeypatch):
+    model = WorldModel(countries=CountryRegistry(PROFILES))
+    assert model._relevance_encoder() is None
+
+    class StubModel:
+        def encode(self, texts, convert_to_numpy=True):
+            return np.ones((len(texts), 4))
+
+    fake_embeddings = types.ModuleType("src.embeddings")
+    fake_embeddings.load_sentence_model = lambda name: StubModel()
+    monkeypatch.setitem(sys.modules, "src.embeddings", fake_embeddings)
+    monkeypatch.setattr(world_model.config, "relevance_use_embeddings", True)
+    model = WorldModel(countries=CountryRegistry(PROFILES))
+    # Identical embeddings: full similarity (0.4) and exposure (0.2) for every pair
+    assert model.relevance.score("gamma", "delta") == pytest.approx(0.6)
+    assert model.relevance.score("gamma", "alpha") == pytest.approx(0.6)
+
+
+def test_world_model_falls_back_to_tfidf_without_the_model(monkeypatch):
+    def unavailable(name):
+        raise OSError(f"{name} not found")
+
+    fake_embeddings = types.ModuleType("src.embeddings")
+    fake_embeddings.load_sentence_model = unavailable
+    monkeypatch.setitem(sys.modules, "src.embeddings", fake_embeddings)
+    monkeypatch.setattr(world_model.config, "relevance_use_embeddings", True)
+    model = WorldModel(countries=CountryRegistry(PROFILES))
+    assert model._relevance_encoder() is None
+    assert model.relevance.rank("alpha")[0] == "beta"
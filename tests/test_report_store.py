@@ -0,0 +1,59 @@
+import os
+import time
+from datetime import datetime
+
+from src.models.report import Report
+from src.models.scenario import Factor, Scenario
+from src.report_store import ReportStore, report_hash
+
+SCENARIO = Scenario(factors=(Factor(id="a", text="Embargo on gas imports", weight=60),))
+
+
+def make_report(forecast, country="Poland", generated_at=None) -> Report:
+    return Report.from_forecasts(
+        SCENARIO, [{"country_name": country, "forecast": forecast}], generated_at=generated_at
+    )
+
+
+def test_hash_ignores_generation_time_but_not_content(forecast):
+    first = make_report(forecast, generated_at=datetime(2024, 1, 1))
+    again = make_report(forecast, generated_at=datetime(2025, 6, 1))
+    assert report_hash(first) == report_hash(again)
+    assert report_hash(first) != report_hash(make_report(forecast, country="Germany"))
+
+
+def test_put_deduplicates_and_renders_on_demand(tmp_path, forecast):
+    store = ReportStore(str(tmp_path), max_bytes=10**9, max_age_seconds=3600)
+    digest = store.put(make_report(forecast))
+    assert store.put(make_report(forecast)) == digest
+    assert os.listdir(tmp_path) == [f"{digest}.json"]
+    assert store.load(digest).countries[0].country_name == "Poland"
+
+    path = store.render(digest, "md")
+    assert path == store.path(digest, "md") and store.exists(digest, "md")
+    assert "Poland" in open(path, encoding="utf-8").read()
+
+
+def test_evict_removes_stale_reports_with_all_formats(tmp_path, forecast):
+    store = ReportStore(str(tmp_path), max_bytes=10**9, max_age_seconds=3600)
+    old = store.put(make_report(forecast, country="Germany"))
+    store.render(old, "md")
+    stale = time.time() - 7200
+    for format in ("json", "md"):
+        os.utime(store.path(old, format), (stale, stale))
+    fresh = store.put(make_report(forecast))
+    assert not store.exists(old) and not store.exists(old, "md")
+    assert store.exists(fresh)
+
+
+def test_evict_drops_least_recently_used_above_size_limit(tmp_path, forecast):
+    store = ReportStore(str(tmp_path), max_bytes=10**9, max_age_seconds=3600)
+    digests = [store.put(make_report(forecast, country=name)) for name in ("Poland", "Germany", "France")]
+    for age, digest in zip((300, 200, 100), digests):
+        os.utime(store.path(digest), (time.time() - age, time.time() - age))
+    # Using the oldest report makes the second one the least recently used
+    store.touch(digests[0])
+
+    store.max_bytes = 2 * os.path.getsize(store.path(digests[0])) + 100
+    assert store.evict() == [digests[1]]
+    assert store.exists(digests[0]) and store.exists(digests[2])
@@ -0,0 +1,34 @@
+import asyncio
+import json
+
+from src.agents.response_cache import InMemoryResponseCacheBackend, make_cache_key
+
+
+def test_cache_key_normalizes_the_prompt():
+    assert make_cache_key("What about  POLAND?", "v1", "gemini", "{}") == make_cache_key(
+        "what about poland?", "v1", "gemini", "{}"
+    )
+
+
+def test_cache_key_depends_on_graph_model_and_generation_config():
+    key = make_cache_key("prompt", "v1", "gemini", "{}")
+    tuned = json.dumps({"root_agent": {"temperature": 0.1}})
+    assert key != make_cache_key("prompt", "v2", "gemini", "{}")
+    assert key != make_cache_key("prompt", "v1", "other-model", "{}")
+    assert key != make_cache_key("prompt", "v1", "gemini", tuned)
+
+
+def test_in_memory_backend_expires_and_evicts_least_recently_used():
+    async def run():
+        cache = InMemoryResponseCacheBackend(max_entries=2)
+        await cache.set("a", {"response": "A"}, ttl_seconds=60)
+        await cache.set("b", {"response": "B"}, ttl_seconds=60)
+        assert await cache.get("a") == {"response": "A"}
+        await cache.set("c", {"response": "C"}, ttl_seconds=60)
+        # "b" was the least recently used
+        assert await cache.get("b") is None
+        assert await cache.get("c") == {"response": "C"}
+        await cache.set("expired", {"response": "X"}, ttl_seconds=0)
+        assert await cache.get("expired") is None
+
+    asyncio.run(run())
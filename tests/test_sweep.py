@@ -0,0 +1,39 @@
+import asyncio
+
+from src.models.sweep import ForecastCache, SweepEngine
+
+
+def test_forecast_cache_appends_after_a_partial_last_line(tmp_path, forecast):
+    path = tmp_path / "cache.jsonl"
+    ForecastCache(str(path)).put("k1", forecast)
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"key": "k2", "forec')
+
+    cache = ForecastCache(str(path))
+    assert len(cache) == 1
+    cache.put("k3", forecast)
+
+    reloaded = ForecastCache(str(path))
+    assert reloaded.get("k1") == forecast
+    assert reloaded.get("k3") == forecast
+    assert reloaded.get("k2") is None
+
+
+def test_concurrent_evaluations_of_one_point_share_the_complete_result(forecast):
+    engine = SweepEngine()
+
+    async def slow_forecast(scenario, country_name):
+        await asyncio.sleep(0.01)
+        return forecast, "computed"
+
+    engine._forecast = slow_forecast
+
+    async def run():
+        return await asyncio.gather(engine.evaluate({"a": 30}), engine.evaluate({"a": 30}))
+
+    first, second = asyncio.run(run())
+    assert first is second
+    assert set(second.forecasts) == set(engine.context)
+    assert engine.stats["points"] == 1
+    assert engine.stats["computed"] == len(engine.context)
+    assert engine.stats["deduplicated"] == len(engine.context)
@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from src.llm.gateway import LLMGateway, ModelLimits, Priority, classify_error
+from src.llm.token_bucket import TokenBucket
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_bucket_refills_at_rate_up_to_capacity():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=10, clock=clock)
+    bucket.consume(10)
+    assert bucket.wait_time(4) == pytest.approx(2.0)
+    clock.now = 1.0
+    assert bucket.tokens == pytest.approx(2.0)
+    clock.now = 100.0
+    assert bucket.tokens == 10
+
+
+def test_bucket_caps_oversized_requests_and_settles_usage():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=1.0, capacity=5, clock=clock)
+    # Larger than the burst: still admitted once the bucket is full
+    assert bucket.wait_time(50) == 0.0
+    bucket.consume(3)
+    bucket.consume(4)
+    assert bucket.tokens == pytest.approx(-2.0)
+    bucket.refund(10)
+    assert bucket.tokens == 5
+
+
+def test_rate_change_is_not_applied_retroactively():
+    clock = FakeClock()
+    bucket = TokenBucket(rate=2.0, capacity=10, clock=clock)
+    bucket.consume(10)
+    clock.now = 1.0
+    bucket.set_rate(1.0)
+    clock.now = 2.0
+    # 2 tokens for the first second at the old rate, 1 for the second one
+    assert bucket.tokens == pytest.approx(3.0)
+
+
+def test_bucket_rejects_non_positive_settings():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0, capacity=1)
+
+
+def test_classify_error():
+    assert classify_error(ConnectionError()) == "transient"
+    assert classify_error(RuntimeError("429 RESOURCE_EXHAUSTED")) == "rate_limit"
+    assert classify_error(RuntimeError("503 UNAVAILABLE")) == "transient"
+    assert classify_error(ValueError("invalid schema")) is None
+
+
+def test_gateway_retries_transient_errors():
+    gateway = LLMGateway(ModelLimits(rpm=600, tpm=100_000), model_limits={}, max_retries=2, backoff_base=0.001)
+    attempts = []
+
+    async def flaky():
+        attempts.append(1)
+        if len(attempts) < 3:
+            raise RuntimeError("503 UNAVAILABLE")
+        return "ok"
+
+    assert asyncio.run(gateway.call(flaky, "model")) == "ok"
+    assert len(attempts) == 3
+
+
+def test_gateway_admits_interactive_before_batch():
+    gateway = LLMGateway(ModelLimits(rpm=60, tpm=100_000), model_limits={}, backoff_base=0.001)
+    limiter = gateway.limiter("model")
+    order = []
+
+    async def record(name):
+        order.append(name)
+
+    async def run():
+        # Drain the request bucket so both calls have to queue
+        limiter.requests.consume(limiter.requests.capacity)
+        queued = [
+            asyncio.create_task(gateway.call(lambda: record("batch"), "model", priority=Priority.BATCH)),
+            asyncio.create_task(gateway.call(lambda: record("interactive"), "model", priority=Priority.INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        assert limiter.queued() == 2
+        # Refill quickly so the queue drains in priority order
+        limiter.requests.set_rate(1000.0)
+        limiter._dispatch()
+        await asyncio.gather(*queued)
+
+    asyncio.run(run())
+    assert order == ["interactive", "batch"]
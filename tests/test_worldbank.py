@@ -0,0 +1,79 @@
+import asyncio
+import json
+import os
+
+import httpx
+
+from src.crawlers.async_crawler import AsyncCrawler
+from src.crawlers.worldbank import ReplayTransport, enrich_profile, fetch_indicators
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "src", "crawlers", "fixtures", "worldbank_sample.json")
+
+
+class CountingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, transport: httpx.AsyncBaseTransport):
+        self.transport = transport
+        self.pages = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        self.pages.append(request.url.params["page"])
+        return await self.transport.handle_async_request(request)
+
+
+def replay_fetch(transport, tmp_path):
+    async def run():
+        async with AsyncCrawler(domain_delay=0, max_retries=0, transport=transport) as crawler:
+            return await fetch_indicators(
+                crawler,
+                ["DEU", "FRA"],
+                indicators=["gdp_current_usd", "population"],
+                start_year=2022,
+                end_year=2023,
+                per_page=4,
+                cache_path=str(tmp_path / "worldbank.json"),
+            )
+
+    return asyncio.run(run())
+
+
+def test_fetch_indicators_pages_through_the_bulk_query(tmp_path):
+    transport = CountingTransport(ReplayTransport(FIXTURE))
+    dataset = replay_fetch(transport, tmp_path)
+
+    # One multi-country, multi-indicator query split over two pages
+    assert sorted(transport.pages) == ["1", "2"]
+    assert set(dataset.series) == {"DEU", "FRA"}
+    germany = dataset.for_country("DEU")
+    assert set(germany) == {"gdp_current_usd", "population"}
+    assert list(germany["gdp_current_usd"]) == ["2022", "2023"]
+    assert germany["gdp_current_usd"]["2023"] == 4.53e12
+    assert all(len(values) == 2 for series in dataset.series.values() for values in series.values())
+
+
+def test_fetch_indicators_uses_the_dataset_cache(tmp_path):
+    replay_fetch(CountingTransport(ReplayTransport(FIXTURE)), tmp_path)
+    transport = CountingTransport(ReplayTransport(FIXTURE))
+    dataset = replay_fetch(transport, tmp_path)
+
+    assert transport.pages == []
+    assert dataset.for_country("FRA")["population"]
+
+
+def test_enrich_profile_writes_and_merges_series(tmp_path):
+    dataset = replay_fetch(ReplayTransport(FIXTURE), tmp_path)
+    profile_path = tmp_path / "germany.json"
+    profile_path.write_text(json.dumps({
+        "country_name": "Germany",
+        "indicators": {"series": {"internet_users_pct": {"2022": 91.0}}},
+    }))
+
+    assert enrich_profile(str(profile_path), dataset.for_country("DEU"))
+    profile = json.loads(profile_path.read_text())
+    assert profile["country_name"] == "Germany"
+    assert profile["indicators"]["source"] == "World Bank WDI"
+    series = profile["indicators"]["series"]
+    assert series["population"] == dataset.for_country("DEU")["population"]
+    # Series not fetched this time are kept
+    assert series["internet_users_pct"] == {"2022": 91.0}
+
+    assert not enrich_profile(str(profile_path), dataset.for_country("DEU"))